@@ -7,26 +7,46 @@
 St. Edward Calendar Sync - Production Version with Central Time Support
 """
 import os
+import re
 import logging
 import secrets
 import traceback
 import signal
 import sys
+import time
 import config
 import json
-from datetime import datetime, timedelta
-from flask import Flask, render_template, jsonify, redirect, session, request, copy_current_request_context, make_response
+import hashlib
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, wait as wait_futures
+from itertools import groupby
+from datetime import datetime, timedelta, timezone
+from flask import Flask, Response, render_template, jsonify, redirect, session, request, copy_current_request_context, make_response
 import threading
+import _thread
 import requests
+import pytz
 
 # Import timezone utilities
-from utils import DateTimeUtils
+from utils import DateTimeUtils, SubjectIndex, TTLCache, parse_iso_datetime
+from calendar_ops import GRAPH_CLIENT, GRAPH_SESSION, parse_json_response
 from auth import require_auth
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; ojsonify falls back to jsonify
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Resolved once; pytz.timezone() does a lookup on every call
+_CENTRAL = pytz.timezone('America/Chicago')
+_UTC = pytz.UTC
+# Graph timeZone names seen on naive dateTime values
+_GRAPH_TIMEZONES = {'UTC': _UTC, 'Central Standard Time': _CENTRAL}
+
 # Add sync status file constant
 SYNC_STATUS_FILE = "sync_status.json"
 
@@ -39,6 +59,42 @@ def update_sync_status(status_data):
     except Exception as e:
         logger.error(f"Failed to update sync status: {e}")
 
+def ojsonify(obj):
+    """jsonify for large or frequently polled payloads, serialized with orjson when installed"""
+    if orjson is None:
+        return jsonify(obj)
+    return Response(orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS), mimetype='application/json')
+
+def conditional_ojsonify(obj, volatile=()):
+    """
+    ojsonify with an ETag, answering 304 when the client already has this state.
+
+    The tag hashes obj without its volatile keys (e.g. a current-time stamp), so
+    polls that would only differ in those get an empty 304 instead of the body.
+    """
+    stable = {k: v for k, v in obj.items() if k not in volatile}
+    if orjson is not None:
+        stable_bytes = orjson.dumps(stable, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SORT_KEYS)
+    else:
+        stable_bytes = json.dumps(stable, sort_keys=True, default=str).encode()
+    etag = hashlib.sha1(stable_bytes).hexdigest()
+
+    response = Response(status=304) if request.if_none_match.contains(etag) else ojsonify(obj)
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'no-cache'
+    return response
+
+def ndjson_response(header, rows):
+    """Stream a header object then one JSON line per row (application/x-ndjson)"""
+    dumps = (lambda obj: orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)) if orjson else (lambda obj: json.dumps(obj).encode())
+
+    def generate():
+        yield dumps(header) + b'\n'
+        for row in rows:
+            yield dumps(row) + b'\n'
+
+    return Response(generate(), mimetype='application/x-ndjson')
+
 # Initialize Flask
 app = Flask(__name__)
 app.secret_key = config.SECRET_KEY
@@ -126,6 +182,24 @@ def require_authentication():
     return None
 
 
+# Debug views read calendars through sync_engine; these few do not
+ENGINE_OPTIONAL_DEBUG_PREFIXES = ('/debug/job/', '/debug/bulletin-calculation')
+
+
+@app.before_request
+def require_sync_engine():
+    """Fail /debug/* requests up front when the sync engine is not initialized.
+
+    Runs after require_authentication, so the debug handlers need neither check.
+    """
+    path = request.path
+    if not path.startswith('/debug/') or path.startswith(ENGINE_OPTIONAL_DEBUG_PREFIXES):
+        return None
+    if not sync_engine:
+        return jsonify({"error": "Sync engine not initialized"}), 500
+    return None
+
+
 @app.route('/google496a12bccfaf6424.html')
 def google_site_verification():
     """Serve the Google Search Console site-ownership verification token."""
@@ -288,12 +362,9 @@ def detailed_health():
     last_sync = 'Never'
     last_sync_result = None
     if sync_engine:
-        try:
-            engine_status = sync_engine.get_status()
-            last_sync = engine_status.get('last_sync_time_display', 'Never')
-            last_sync_result = engine_status.get('last_sync_result')
-        except Exception as e:
-            logger.error(f"Health sync-status read failed: {e}")
+        # Two snapshot reads instead of building (and locking for) the full status
+        _, last_sync = sync_engine.get_last_sync_time_text()
+        last_sync_result = sync_engine.last_sync_result
 
     status = "healthy" if all(checks.values()) else "degraded"
 
@@ -428,13 +499,6 @@ def get_status():
             # Use actual rate limit from engine status
             status["rate_limit_remaining"] = engine_status.get('rate_limit_remaining', config.MAX_SYNC_REQUESTS_PER_HOUR)
             
-            # Format the last sync time for display
-            if engine_status.get('last_sync_time'):
-                try:
-                    last_sync_dt = datetime.fromisoformat(engine_status['last_sync_time'].replace('Z', '+00:00'))
-                    status['last_sync_time_display'] = format_central_time(last_sync_dt)
-                except:
-                    status['last_sync_time_display'] = "Unknown"
         
         # Add scheduler details to status
         if scheduler:
@@ -450,7 +514,8 @@ def get_status():
         # the Advanced Actions calendar picker.
         status['sync_pairs'] = build_pair_status(status.get('last_sync_result'))
 
-        return jsonify(status)
+        # Polled every few seconds; unchanged state is answered with a 304
+        return conditional_ojsonify(status, volatile=('current_time',))
         
     except Exception as e:
         logger.error(f"Status check failed: {e}")
@@ -460,6 +525,29 @@ def get_status():
             "sync_in_progress": False
         }), 500
 
+# Landing page for signed-out visitors; only the auth URL varies per request
+_SIGN_IN_HTML = '''
+<!DOCTYPE html>
+<html>
+<head>
+    <title>St. Edward Calendar Sync</title>
+    <link rel="icon" href="data:image/svg+xml,<svg xmlns=%22http://www.w3.org/2000/svg%22 viewBox=%220 0 100 100%22><text y=%22.9em%22 font-size=%2290%22>📅</text></svg>">
+</head>
+<body style="font-family: Arial; text-align: center; margin-top: 100px; background: #f5f5f5;">
+    <div style="background: white; max-width: 500px; margin: 0 auto; padding: 40px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
+        <h1 style="color: #005921;">🗓️ St. Edward Calendar Sync</h1>
+        <p style="margin: 20px 0; color: #666;">Automated synchronization between internal and public calendars</p>
+        <a href="{auth_url}" style="background: #0078d4; color: white; padding: 15px 30px; text-decoration: none; border-radius: 5px; font-size: 18px; display: inline-block;">
+            Sign in with Microsoft
+        </a>
+        <p style="margin-top: 30px; font-size: 12px; color: #999;">
+            St. Edward Church & School • Nashville, TN
+        </p>
+    </div>
+</body>
+</html>
+'''
+
 @app.route('/')
 def index():
     """Main dashboard"""
@@ -478,45 +566,19 @@ def index():
             session['oauth_state'] = state
             auth_url = auth_manager.get_auth_url(state) if auth_manager else "#"
             
-            return f'''
-            <!DOCTYPE html>
-            <html>
-            <head>
-                <title>St. Edward Calendar Sync</title>
-                <link rel="icon" href="data:image/svg+xml,<svg xmlns=%22http://www.w3.org/2000/svg%22 viewBox=%220 0 100 100%22><text y=%22.9em%22 font-size=%2290%22>📅</text></svg>">
-            </head>
-            <body style="font-family: Arial; text-align: center; margin-top: 100px; background: #f5f5f5;">
-                <div style="background: white; max-width: 500px; margin: 0 auto; padding: 40px; border-radius: 10px; box-shadow: 0 2px 10px rgba(0,0,0,0.1);">
-                    <h1 style="color: #005921;">🗓️ St. Edward Calendar Sync</h1>
-                    <p style="margin: 20px 0; color: #666;">Automated synchronization between internal and public calendars</p>
-                    <a href="{auth_url}" style="background: #0078d4; color: white; padding: 15px 30px; text-decoration: none; border-radius: 5px; font-size: 18px; display: inline-block;">
-                        Sign in with Microsoft
-                    </a>
-                    <p style="margin-top: 30px; font-size: 12px; color: #999;">
-                        St. Edward Church & School • Nashville, TN
-                    </p>
-                </div>
-            </body>
-            </html>
-            '''
+            response = make_response(_SIGN_IN_HTML.format(auth_url=auth_url))
+            # The auth URL carries this session's OAuth state; never cache it
+            response.headers['Cache-Control'] = 'no-store'
+            return response
         
         # User is authenticated - show dashboard
         last_sync_time = None
         last_sync_time_display = "Never"
         
         if sync_engine:
-            status = sync_engine.get_status()
-            last_sync_time_str = status.get('last_sync_time')
-            
-            # Convert ISO string back to datetime object and format for display
-            if last_sync_time_str:
-                try:
-                    last_sync_dt = datetime.fromisoformat(last_sync_time_str.replace('Z', '+00:00'))
-                    last_sync_time = last_sync_dt  # Keep original for template
-                    last_sync_time_display = format_central_time(last_sync_dt)
-                except:
-                    last_sync_time = None
-                    last_sync_time_display = "Never"
+            # Formatted when the sync finished; no full status build needed here
+            last_sync_time = sync_engine.last_sync_time
+            _, last_sync_time_display = sync_engine.get_last_sync_time_text()
         
         return render_template('index.html', 
                              last_sync_time=last_sync_time,
@@ -533,6 +595,13 @@ def index():
         </body></html>
         ''', 500
 
+# Manual syncs run on one pooled worker. A request is admitted only when no
+# manual sync is queued or running, so repeated clicks cannot stack threads
+# behind the engine's own lock.
+SYNC_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix='manual-sync')
+_manual_sync_future = None
+_manual_sync_lock = threading.Lock()
+
 @app.route('/sync', methods=['POST'])
 def trigger_sync():
     """Trigger sync in background, return immediately"""
@@ -547,24 +616,29 @@ def trigger_sync():
     if not sync_engine:
         return jsonify({"error": "Sync engine not initialized"}), 500
     
-    # Check if sync already running
-    if sync_engine.sync_in_progress:
-        return jsonify({
-            "status": "already_running",
-            "message": "Sync is already in progress",
-            "progress": sync_engine.get_progress_percent() if hasattr(sync_engine, 'get_progress_percent') else 0
-        }), 409
-    
     # Parse request body
     dry_run = request.json.get('dry_run', False) if request.json else False
     
-    # Start sync in background thread
-    sync_thread = threading.Thread(
-        target=_run_sync_background,
-        args=(dry_run,),
-        daemon=True
-    )
-    sync_thread.start()
+    global _manual_sync_future
+    with _manual_sync_lock:
+        # Check if sync already running (or a manual one is about to start)
+        pending = _manual_sync_future is not None and not _manual_sync_future.done()
+        if sync_engine.sync_in_progress or pending:
+            return jsonify({
+                "status": "already_running",
+                "message": "Sync is already in progress",
+                "progress": sync_engine.get_progress_percent() if hasattr(sync_engine, 'get_progress_percent') else 0
+            }), 409
+        
+        if sync_engine.rate_limit_remaining() <= 0:
+            return jsonify({
+                "status": "rate_limited",
+                "message": f"Rate limit exceeded. Maximum {config.MAX_SYNC_REQUESTS_PER_HOUR} syncs per hour.",
+                "retry_after": 3600
+            }), 429
+        
+        # Start sync in the background
+        _manual_sync_future = SYNC_EXECUTOR.submit(_run_sync_background, dry_run)
     
     return jsonify({
         "status": "started",
@@ -700,20 +774,12 @@ def clear_target():
         sweep_end = DateTimeUtils.get_central_time() + timedelta(days=config.SYNC_LOOKAHEAD_DAYS)
         events = sync_engine.reader.get_calendar_events(target_id, start=sweep_start, end=sweep_end) or []
         
-        deleted = 0
-        failed = 0
-        for event in events:
-            try:
-                event_id = event.get('id')
-                if event_id:
-                    success = sync_engine.writer.delete_event(target_id, event_id)
-                    if success:
-                        deleted += 1
-                    else:
-                        failed += 1
-            except Exception as e:
-                logger.error(f"Failed to delete event {event.get('id', 'unknown')}: {e}")
-                failed += 1
+        # 20 deletes per $batch round trip instead of one DELETE per event
+        result = sync_engine.writer.batch_delete_events(
+            target_id, [event['id'] for event in events if event.get('id')]
+        )
+        deleted = result['successful']
+        failed = result['failed']
         
         return jsonify({
             'success': True,
@@ -803,13 +869,13 @@ def auth_callback():
                 headers = auth_manager.get_headers()
                 if headers:
                     try:
-                        r = requests.get(
+                        r = GRAPH_SESSION.get(
                             'https://graph.microsoft.com/v1.0/me?$select=mail,userPrincipalName',
                             headers=headers,
                             timeout=10
                         )
                         if r.status_code == 200:
-                            data = r.json()
+                            data = parse_json_response(r)
                             mail = (data.get('mail') or data.get('userPrincipalName') or '').strip().lower()
                             if mail not in allowed:
                                 logger.warning(f"User {mail} not in ALLOWED_DASHBOARD_USERS")
@@ -1084,18 +1150,88 @@ def toggle_scheduler():
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
+# Short-lived cache for the admin/debug pages: clicking through several debug
+# views within a minute reuses one Graph fetch per calendar instead of one per click.
+DEBUG_CACHE_TTL_SECONDS = 60
+# The fields the debug views read; bodies and extended properties are skipped.
+# location is not selected, and the sync's own calendarView does not select it
+# either, so the '_sig' signatures below carry the same blank location the
+# sync's do. Routes that must reproduce sync matching read through the sync's
+# calls instead (see debug_test_single_event).
+DEBUG_EVENT_FIELDS = [
+    'id', 'subject', 'start', 'end', 'categories', 'showAs', 'type', 'seriesMasterId',
+    'isCancelled', 'recurrence', 'isAllDay', 'createdDateTime', 'lastModifiedDateTime'
+]
+_debug_cache = TTLCache(maxsize=16, ttl_seconds=DEBUG_CACHE_TTL_SECONDS)
+
+
+def _annotate_events(events):
+    """Precompute per-event lookup keys once per fetch; '_' keys are debug-only"""
+    if events is None:
+        return None
+    for event in events:
+        event['_subject_lc'] = (event.get('subject') or '').lower()
+        event['_sig'] = sync_engine._create_event_signature(event)
+    return events
+
+
+def strip_private_keys(event):
+    """Copy of a cached Graph event without the '_' annotation keys, for output"""
+    return {k: v for k, v in event.items() if not k.startswith('_')}
+
+
+def cached_calendars():
+    """The mailbox's calendar list, memoized for DEBUG_CACHE_TTL_SECONDS"""
+    return _debug_cache.get_or_load(('calendars',), sync_engine.reader.get_calendars)
+
+
+def cached_calendar_events(calendar_id):
+    """Full-window events for a calendar, memoized for DEBUG_CACHE_TTL_SECONDS; None if the read failed"""
+    return _debug_cache.get_or_load(
+        ('events', calendar_id),
+        lambda: _annotate_events(
+            sync_engine.reader.get_calendar_events(calendar_id, select_fields=DEBUG_EVENT_FIELDS)
+        )
+    )
+
+
+def cached_calendar_events_many(calendar_ids):
+    """cached_calendar_events for several calendars; misses share one $batch fetch"""
+    results = {calendar_id: _debug_cache.get(('events', calendar_id)) for calendar_id in calendar_ids}
+    missing = [calendar_id for calendar_id, events in results.items() if events is None]
+    if missing:
+        views = sync_engine.reader.get_calendar_views_batched(missing, select_fields=DEBUG_EVENT_FIELDS)
+        for calendar_id in missing:
+            events = views.get(calendar_id)
+            if events is None:
+                continue
+            results[calendar_id] = _annotate_events(events)
+            if events:
+                _debug_cache.set(('events', calendar_id), events)
+    return results
+
+def signature_index(calendar_id, events):
+    """
+    Signature -> event map for a cached event list (first event wins).
+
+    Kept in the debug cache next to the list it was built from, so looking up
+    several events in a row against a large calendar builds it once.
+    """
+    cached = _debug_cache.get(('signature_index', calendar_id))
+    if cached is not None and cached[0] is events:
+        return cached[1]
+    index = {}
+    for event in events:
+        index.setdefault(event['_sig'], event)
+    _debug_cache.set(('signature_index', calendar_id), (events, index))
+    return index
+
 @app.route('/debug/calendars')
 def debug_calendars():
     """Debug: List all available calendars"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get all calendars
-        all_calendars = sync_engine.reader.get_calendars()
+        all_calendars = cached_calendars()
         
         if not all_calendars:
             return jsonify({"error": "Could not retrieve calendars"}), 500
@@ -1111,9 +1247,10 @@ def debug_calendars():
                 "canShare": cal.get('canShare', False)
             })
         
-        # Also show which ones we're configured to use
-        source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
-        target_id = sync_engine.reader.find_calendar_id(config.TARGET_CALENDAR)
+        # Also show which ones we're configured to use (resolved from the list
+        # above, so an expired ID cache costs no further Graph calls)
+        source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR, calendars=all_calendars)
+        target_id = sync_engine.reader.find_calendar_id(config.TARGET_CALENDAR, calendars=all_calendars)
         
         return jsonify({
             "all_calendars": calendar_info,
@@ -1139,38 +1276,33 @@ def debug_calendars():
 def debug_events(calendar_name):
     """Debug: Show events and signatures for a specific calendar"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get calendar ID
         calendar_id = sync_engine.reader.find_calendar_id(calendar_name)
         if not calendar_id:
             return jsonify({"error": f"Calendar '{calendar_name}' not found"}), 404
         
         # Get all events (not just public)
-        all_events = sync_engine.reader.get_calendar_events(calendar_id)
+        all_events = cached_calendar_events(calendar_id)
         
         # Create debug info for each event
-        event_debug = []
-        for event in all_events:
-            signature = sync_engine._create_event_signature(event)
-            event_debug.append({
-                "subject": event.get('subject'),
-                "signature": signature,
-                "categories": event.get('categories', []),
-                "showAs": event.get('showAs'),
-                "type": event.get('type'),
-                "start": event.get('start', {}).get('dateTime', 'No date'),
-                "id": event.get('id', 'No ID')[:20] + "..."  # Truncate ID
-            })
-        
-        return jsonify({
+        event_debug = sorted(({
+            "subject": event.get('subject'),
+            "signature": event['_sig'],
+            "categories": event.get('categories', []),
+            "showAs": event.get('showAs'),
+            "type": event.get('type'),
+            "start": event.get('start', {}).get('dateTime', 'No date'),
+            "id": event.get('id', 'No ID')[:20] + "..."  # Truncate ID
+        } for event in all_events), key=lambda x: x['subject'] or '')
+        
+        # ?format=ndjson streams one event per line instead of one large document
+        if request.args.get('format') == 'ndjson':
+            return ndjson_response({"calendar": calendar_name, "total_events": len(all_events)}, event_debug)
+        
+        return ojsonify({
             "calendar": calendar_name,
             "total_events": len(all_events),
-            "events": sorted(event_debug, key=lambda x: x['subject'] or '')
+            "events": event_debug
         })
         
     except Exception as e:
@@ -1187,6 +1319,9 @@ def clear_cache():
             return jsonify({"error": "Not authenticated", "redirect": "/"}), 401
         
         sync_engine.change_tracker.clear_cache()
+        _debug_cache.clear()
+        _calendar_view_cache.clear()
+        _public_calendar_ids.clear()
         
         return jsonify({
             "success": True,
@@ -1246,33 +1381,27 @@ def get_cache_stats():
 def debug_event_details(event_subject):
     """Debug specific event to see its raw data"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source calendar events
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
             return jsonify({"error": "Source calendar not found"}), 404
         
-        all_events = sync_engine.reader.get_calendar_events(source_id)
+        all_events = cached_calendar_events(source_id)
+        if all_events is None:
+            return jsonify({"error": "Could not retrieve source events"}), 500
         
         # Find matching events
-        matching_events = []
-        for event in all_events:
-            if event_subject.lower() in event.get('subject', '').lower():
-                matching_events.append({
-                    'subject': event.get('subject'),
-                    'isAllDay': event.get('isAllDay'),
-                    'start': event.get('start'),
-                    'end': event.get('end'),
-                    'type': event.get('type'),
-                    'showAs': event.get('showAs'),
-                    'categories': event.get('categories'),
-                    'raw_event': event  # Full raw data
-                })
+        needle = event_subject.lower()
+        matching_events = [{
+            'subject': event.get('subject'),
+            'isAllDay': event.get('isAllDay'),
+            'start': event.get('start'),
+            'end': event.get('end'),
+            'type': event.get('type'),
+            'showAs': event.get('showAs'),
+            'categories': event.get('categories'),
+            'raw_event': strip_private_keys(event)  # Full raw data
+        } for event in all_events if needle in event['_subject_lc']]
         
         return jsonify({
             'search_term': event_subject,
@@ -1287,12 +1416,6 @@ def debug_event_details(event_subject):
 def debug_event_by_id(event_id):
     """See exactly what Graph API returns for a specific event"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         import requests
         
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
@@ -1301,7 +1424,7 @@ def debug_event_by_id(event_id):
         
         # Fetch the specific event
         url = f"https://graph.microsoft.com/v1.0/users/{config.SHARED_MAILBOX}/calendars/{source_id}/events/{event_id}"
-        response = requests.get(
+        response = GRAPH_SESSION.get(
             url,
             headers={"Authorization": f"Bearer {auth_manager.get_access_token()}"}
         )
@@ -1309,7 +1432,7 @@ def debug_event_by_id(event_id):
         if response.status_code != 200:
             return jsonify({"error": f"Failed to fetch event: {response.status_code}", "details": response.text}), response.status_code
         
-        event_data = response.json()
+        event_data = parse_json_response(response)
         
         # Check sync criteria
         categories = event_data.get('categories', [])
@@ -1343,19 +1466,12 @@ def debug_event_by_id(event_id):
         })
     except Exception as e:
         logger.error(f"Debug event error: {e}")
-        import traceback
         return jsonify({"error": str(e), "traceback": traceback.format_exc()}), 500
 
 @app.route('/debug/event-durations')
 def debug_event_durations():
     """Report on event durations to identify potential data issues"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source events
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
@@ -1425,19 +1541,13 @@ def debug_event_durations():
 def debug_duplicates():
     """Debug duplicate events in the target calendar"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get target calendar ID
         target_id = sync_engine.reader.find_calendar_id(config.TARGET_CALENDAR)
         if not target_id:
             return jsonify({"error": "Target calendar not found"}), 404
         
         # Get all events from target calendar
-        target_events = sync_engine.reader.get_calendar_events(target_id)
+        target_events = cached_calendar_events(target_id)
         if not target_events:
             return jsonify({"error": "Could not retrieve target events"}), 500
         
@@ -1518,19 +1628,13 @@ def debug_duplicates():
 def debug_categories():
     """Debug: Show raw event data including categories from source calendar"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source calendar ID
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
             return jsonify({"error": "Source calendar not found"}), 404
         
         # Get all events from source calendar
-        all_events = sync_engine.reader.get_calendar_events(source_id)
+        all_events = cached_calendar_events(source_id)
         if not all_events:
             return jsonify({"error": "Could not retrieve source events"}), 500
         
@@ -1550,7 +1654,7 @@ def debug_categories():
                 'isCancelled': event.get('isCancelled', False),
                 'type': event.get('type'),
                 'start': event.get('start', {}).get('dateTime', 'No date'),
-                'raw_event': event  # Include full raw data for debugging
+                'raw_event': strip_private_keys(event)  # Include full raw data for debugging
             }
             
             if categories:
@@ -1582,12 +1686,6 @@ def debug_categories():
 def debug_sync_filter():
     """Debug: Show what happens during the actual sync filtering process"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source calendar ID
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
@@ -1597,7 +1695,7 @@ def debug_sync_filter():
         public_events = sync_engine.reader.get_public_events(source_id)
         
         # Also get all events for comparison
-        all_events = sync_engine.reader.get_calendar_events(source_id)
+        all_events = cached_calendar_events(source_id)
         
         # Analyze what got filtered out
         public_event_subjects = {event.get('subject') for event in public_events} if public_events else set()
@@ -1638,19 +1736,13 @@ def debug_sync_filter():
 def debug_recurring_events():
     """Debug: Analyze recurring events and their types"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source calendar ID
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
             return jsonify({"error": "Source calendar not found"}), 404
         
         # Get all events from source calendar
-        all_events = sync_engine.reader.get_calendar_events(source_id)
+        all_events = cached_calendar_events(source_id)
         if not all_events:
             return jsonify({"error": "Could not retrieve source events"}), 500
         
@@ -1687,7 +1779,7 @@ def debug_recurring_events():
         # Focus on Mass events specifically
         mass_events = []
         for event in all_events:
-            if 'mass' in event.get('subject', '').lower():
+            if 'mass' in event['_subject_lc']:
                 mass_events.append({
                     'subject': event.get('subject'),
                     'type': event.get('type', 'singleInstance'),
@@ -1723,26 +1815,20 @@ def debug_recurring_events():
 def debug_mass_events_summary():
     """Debug: Simple summary of Mass events and their types"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source calendar ID
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
             return jsonify({"error": "Source calendar not found"}), 404
         
         # Get all events from source calendar
-        all_events = sync_engine.reader.get_calendar_events(source_id)
+        all_events = cached_calendar_events(source_id)
         if not all_events:
             return jsonify({"error": "Could not retrieve source events"}), 500
         
         # Focus only on Mass events
         mass_events = []
         for event in all_events:
-            if 'mass' in event.get('subject', '').lower():
+            if 'mass' in event['_subject_lc']:
                 mass_events.append({
                     'subject': event.get('subject'),
                     'type': event.get('type', 'singleInstance'),
@@ -1789,31 +1875,40 @@ def debug_mass_events_summary():
             "traceback": traceback.format_exc()
         }), 500
 
+# Subject keywords suggesting an event probably belongs on the public calendar.
+# Compiled once into a single alternation so each subject is scanned in one pass.
+_PUBLIC_KEYWORDS = (
+    'mass', 'liturgy', 'worship', 'school', 'education', 'class',
+    'parish', 'community', 'fellowship', 'ministry', 'outreach',
+    'celebration', 'festival', 'feast', 'baptism', 'confirmation',
+    'wedding', 'funeral', 'memorial', 'adoration', 'rosary',
+    'retreat', 'mission', 'youth', 'children', 'family', 'choir',
+    'music', 'concert', 'fundraiser', 'benefit', 'charity',
+    'volunteer', 'service', 'food drive', 'clothing drive',
+    'blood drive', 'health fair', 'open house', 'tour'
+)
+_PUBLIC_KEYWORD_PATTERN = re.compile('|'.join(re.escape(keyword) for keyword in _PUBLIC_KEYWORDS))
+
 @app.route('/debug/public-sync-issue')
 def debug_public_sync_issue():
     """Debug: Find out why so many public events aren't syncing"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source calendar ID
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
             return jsonify({"error": "Source calendar not found"}), 404
         
         # Get all events from source calendar
-        all_events = sync_engine.reader.get_calendar_events(source_id)
+        all_events = cached_calendar_events(source_id)
         if not all_events:
             return jsonify({"error": "Could not retrieve source events"}), 500
         
-        # Get what the sync actually finds as public
-        public_events = sync_engine.reader.get_public_events(source_id)
-        
-        # Analyze the gap
-        public_event_subjects = {event.get('subject') for event in public_events} if public_events else set()
+        # Get the subjects the sync actually treats as public: the cached list
+        # run through the sync's own filters and window
+        public_events = sync_engine.reader.get_public_events(source_id, events=all_events)
+        if public_events is None:
+            return jsonify({"error": "Could not determine which events sync"}), 500
+        public_event_subjects = {event.get('subject') for event in public_events}
         
         # Find events that SHOULD be public but aren't syncing
         missing_public_events = []
@@ -1826,19 +1921,7 @@ def debug_public_sync_issue():
                 continue
                 
             # Look for events that should probably be public
-            subject_lower = subject.lower()
-            should_be_public_keywords = [
-                'mass', 'liturgy', 'worship', 'school', 'education', 'class',
-                'parish', 'community', 'fellowship', 'ministry', 'outreach',
-                'celebration', 'festival', 'feast', 'baptism', 'confirmation',
-                'wedding', 'funeral', 'memorial', 'adoration', 'rosary',
-                'retreat', 'mission', 'youth', 'children', 'family', 'choir',
-                'music', 'concert', 'fundraiser', 'benefit', 'charity',
-                'volunteer', 'service', 'food drive', 'clothing drive',
-                'blood drive', 'health fair', 'open house', 'tour'
-            ]
-            
-            has_public_keyword = any(keyword in subject_lower for keyword in should_be_public_keywords)
+            has_public_keyword = _PUBLIC_KEYWORD_PATTERN.search(event['_subject_lc']) is not None
             
             if has_public_keyword and 'Public' not in categories:
                 missing_public_events.append({
@@ -1852,7 +1935,7 @@ def debug_public_sync_issue():
         
         return jsonify({
             'total_source_events': len(all_events),
-            'public_events_syncing': len(public_events) if public_events else 0,
+            'public_subjects_syncing': len(public_event_subjects),
             'events_missing_public_tag': len(missing_public_events),
             'missing_events_sample': missing_public_events[:20],  # First 20
             'generated_time': DateTimeUtils.format_central_time(DateTimeUtils.get_central_time())
@@ -1865,138 +1948,226 @@ def debug_public_sync_issue():
             "traceback": traceback.format_exc()
         }), 500
 
+# Background debug jobs: heavy diagnostics run on a small worker pool and are
+# polled via /debug/job/<job_id>, so they never pin a gunicorn worker. Extra
+# jobs wait in the pool's queue (status 'queued') instead of each taking a thread.
+DEBUG_JOB_TTL_SECONDS = 300  # Finished results are reused for 5 minutes
+DEBUG_JOB_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='debug-job')
+MAX_FILTERED_SAMPLE = 30  # Filtered-out events sampled by the sync breakdown
+_debug_jobs = {}
+_debug_jobs_by_key = {}
+_debug_jobs_lock = threading.Lock()
+
+
+def _prune_debug_jobs(now):
+    """Drop finished jobs older than the TTL (caller holds the lock)."""
+    expired = [
+        job_id for job_id, job in _debug_jobs.items()
+        if job['finished_at'] and now - job['finished_at'] > DEBUG_JOB_TTL_SECONDS
+    ]
+    for job_id in expired:
+        key = _debug_jobs.pop(job_id)['key']
+        if _debug_jobs_by_key.get(key) == job_id:
+            del _debug_jobs_by_key[key]
+
+
+def _run_debug_job(job_id, func, args):
+    """Execute a debug job and record its result or error"""
+    with _debug_jobs_lock:
+        _debug_jobs[job_id]['status'] = 'running'
+    try:
+        result = func(*args)
+        outcome = {'status': 'finished', 'result': result}
+    except Exception as e:
+        logger.error(f"Debug job {job_id} failed: {e}", exc_info=True)
+        outcome = {'status': 'failed', 'error': str(e), 'traceback': traceback.format_exc()}
+    with _debug_jobs_lock:
+        _debug_jobs[job_id].update(outcome)
+        _debug_jobs[job_id]['finished_at'] = time.time()
+
+
+def submit_debug_job(key, func, *args):
+    """
+    Queue func(*args) on the debug job pool, or reuse a job for the same key.
+
+    Concurrent requests for the same key share one in-flight job, and a
+    finished job is served from memory until DEBUG_JOB_TTL_SECONDS elapses.
+    Returns the job record.
+    """
+    now = time.time()
+    with _debug_jobs_lock:
+        _prune_debug_jobs(now)
+        existing = _debug_jobs.get(_debug_jobs_by_key.get(key))
+        if existing and existing['status'] != 'failed':
+            return dict(existing)
+
+        job_id = secrets.token_urlsafe(12)
+        job = {
+            'job_id': job_id,
+            'key': key,
+            'status': 'queued',
+            'created_at': now,
+            'finished_at': None,
+        }
+        _debug_jobs[job_id] = job
+        _debug_jobs_by_key[key] = job_id
+        snapshot = dict(job)
+
+    DEBUG_JOB_EXECUTOR.submit(_run_debug_job, job_id, func, args)
+    return snapshot
+
+
+def _debug_job_response(job):
+    """Serialize a job record for the client"""
+    payload = {k: v for k, v in job.items() if k not in ('key', 'finished_at')}
+    payload['poll_url'] = f"/debug/job/{job['job_id']}"
+    if job['status'] == 'finished':
+        return jsonify(payload), 200
+    if job['status'] == 'failed':
+        return jsonify(payload), 500
+    return jsonify(payload), 202
+
+
+@app.route('/debug/job/<job_id>')
+def debug_job_status(job_id):
+    """Poll a background debug job"""
+    with _debug_jobs_lock:
+        _prune_debug_jobs(time.time())
+        job = _debug_jobs.get(job_id)
+        job = dict(job) if job else None
+    if not job:
+        return jsonify({"error": "Job not found or expired"}), 404
+    return _debug_job_response(job)
+
+
+def compute_sync_breakdown(source_id):
+    """Run the get_public_events filter logic by hand and count why events drop out"""
+    # Manually run through the same filtering logic as get_public_events,
+    # streaming events so only one Graph page is held in memory at a time
+    stats = {
+        'total_events': 0,
+        'cancelled': 0,
+        'no_public_tag': 0,
+        'not_busy': 0,
+        'recurring_instances': 0,
+        'past_events': 0,
+        'future_events': 0,
+        'date_parse_errors': 0,
+        'passed_all_filters': 0
+    }
+    
+    filtered_out_events = []
+    
+    # Create timezone-aware cutoff dates (same as in calendar_ops.py)
+    now_central = DateTimeUtils.get_central_time()
+    cutoff_date = (now_central - timedelta(days=config.SYNC_CUTOFF_DAYS)).astimezone(pytz.UTC)
+    future_cutoff = (now_central + timedelta(days=365)).astimezone(pytz.UTC)
+    
+    for event in sync_engine.reader.iter_calendar_events(source_id, select_fields=DEBUG_EVENT_FIELDS):
+        stats['total_events'] += 1
+        subject = event.get('subject', 'No Subject')
+        categories = event.get('categories', [])
+        show_as = event.get('showAs', 'busy')
+        event_type = event.get('type', 'singleInstance')
+        
+        # Track why each event is filtered out
+        filter_reason = None
+        
+        # Skip cancelled events entirely
+        if event.get('isCancelled', False):
+            stats['cancelled'] += 1
+            filter_reason = "cancelled"
+        
+        # Check if public
+        elif 'Public' not in categories:
+            stats['no_public_tag'] += 1
+            filter_reason = "no_public_tag"
+        
+        # CRITICAL: Also check if event is marked as Busy
+        elif show_as != 'busy':
+            stats['not_busy'] += 1
+            filter_reason = f"not_busy (showAs: {show_as})"
+        
+        # ALWAYS skip recurring instances to avoid duplicates
+        elif event_type == 'occurrence':
+            stats['recurring_instances'] += 1
+            filter_reason = "recurring_instance"
+        
+        # Check event date
+        else:
+            try:
+                # Parse event date
+                event_date = DateTimeUtils.parse_graph_datetime(event.get('start', {}))
+                if not event_date:
+                    stats['date_parse_errors'] += 1
+                    filter_reason = "date_parse_error"
+                else:
+                    # Ensure both datetimes are timezone-aware for comparison
+                    if event_date.tzinfo is None:
+                        # If naive, assume it's UTC
+                        event_date = pytz.UTC.localize(event_date)
+
+                    # Convert to UTC for comparison
+                    event_date_utc = event_date.astimezone(pytz.UTC)
+
+                    # Skip old events (unless it's a recurring event that should always be synced)
+                    if event_date_utc < cutoff_date:
+                        # Special override for recurring events - always include them regardless of age
+                        if event.get('type') == 'seriesMaster':
+                            stats['passed_all_filters'] += 1
+                            filter_reason = "passed_all_filters"
+                        else:
+                            stats['past_events'] += 1
+                            filter_reason = f"past_event (date: {event_date_utc}, cutoff: {cutoff_date})"
+
+                    # Skip events too far in the future (but allow recurring events to extend further)
+                    elif event_date_utc > future_cutoff:
+                        # Special override for recurring events - allow them to extend further into the future
+                        if event.get('type') == 'seriesMaster':
+                            stats['passed_all_filters'] += 1
+                            filter_reason = "passed_all_filters"
+                        else:
+                            stats['future_events'] += 1
+                            filter_reason = f"future_event (date: {event_date_utc}, cutoff: {future_cutoff})"
+                    else:
+                        stats['passed_all_filters'] += 1
+                        filter_reason = "passed_all_filters"
+                        
+            except Exception as e:
+                stats['date_parse_errors'] += 1
+                filter_reason = f"date_parse_error: {str(e)}"
+        
+        # Record why this event was filtered out (stats above still count every event)
+        if filter_reason != "passed_all_filters" and len(filtered_out_events) < MAX_FILTERED_SAMPLE:
+            filtered_out_events.append({
+                'subject': subject,
+                'start_date': event.get('start', {}).get('dateTime', 'No date')[:10],
+                'categories': categories,
+                'showAs': show_as,
+                'type': event_type,
+                'filter_reason': filter_reason
+            })
+    
+    if not stats['total_events']:
+        raise RuntimeError("Could not retrieve source events")
+    
+    return {
+        'filtering_stats': stats,
+        'filtered_out_events': filtered_out_events,  # First MAX_FILTERED_SAMPLE
+        'generated_time': DateTimeUtils.format_central_time(DateTimeUtils.get_central_time())
+    }
+
 @app.route('/debug/sync-breakdown')
 def debug_sync_breakdown():
-    """Debug: Show exactly what's happening in the sync filtering process"""
+    """Debug: Show exactly what's happening in the sync filtering process (runs as a background job)"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source calendar ID
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
             return jsonify({"error": "Source calendar not found"}), 404
         
-        # Get all events from source calendar
-        all_events = sync_engine.reader.get_calendar_events(source_id)
-        if not all_events:
-            return jsonify({"error": "Could not retrieve source events"}), 500
-        
-        # Manually run through the same filtering logic as get_public_events
-        stats = {
-            'total_events': len(all_events),
-            'cancelled': 0,
-            'no_public_tag': 0,
-            'not_busy': 0,
-            'recurring_instances': 0,
-            'past_events': 0,
-            'future_events': 0,
-            'date_parse_errors': 0,
-            'passed_all_filters': 0
-        }
-        
-        filtered_out_events = []
-        
-        # Create timezone-aware cutoff dates (same as in calendar_ops.py)
-        from datetime import timedelta
-        import pytz
-        central_tz = pytz.timezone('America/Chicago')
-        now_central = DateTimeUtils.get_central_time()
-        cutoff_date = (now_central - timedelta(days=config.SYNC_CUTOFF_DAYS)).astimezone(pytz.UTC)
-        future_cutoff = (now_central + timedelta(days=365)).astimezone(pytz.UTC)
-        
-        for event in all_events:
-            subject = event.get('subject', 'No Subject')
-            categories = event.get('categories', [])
-            show_as = event.get('showAs', 'busy')
-            event_type = event.get('type', 'singleInstance')
-            
-            # Track why each event is filtered out
-            filter_reason = None
-            
-            # Skip cancelled events entirely
-            if event.get('isCancelled', False):
-                stats['cancelled'] += 1
-                filter_reason = "cancelled"
-            
-            # Check if public
-            elif 'Public' not in categories:
-                stats['no_public_tag'] += 1
-                filter_reason = "no_public_tag"
-            
-            # CRITICAL: Also check if event is marked as Busy
-            elif show_as != 'busy':
-                stats['not_busy'] += 1
-                filter_reason = f"not_busy (showAs: {show_as})"
-            
-            # ALWAYS skip recurring instances to avoid duplicates
-            elif event_type == 'occurrence':
-                stats['recurring_instances'] += 1
-                filter_reason = "recurring_instance"
-            
-            # Check event date
-            else:
-                try:
-                    # Parse event date
-                    event_date = DateTimeUtils.parse_graph_datetime(event.get('start', {}))
-                    if not event_date:
-                        stats['date_parse_errors'] += 1
-                        filter_reason = "date_parse_error"
-                    else:
-                        # Ensure both datetimes are timezone-aware for comparison
-                        if event_date.tzinfo is None:
-                            # If naive, assume it's UTC
-                            event_date = pytz.UTC.localize(event_date)
-
-                        # Convert to UTC for comparison
-                        event_date_utc = event_date.astimezone(pytz.UTC)
-
-                        # Skip old events (unless it's a recurring event that should always be synced)
-                        if event_date_utc < cutoff_date:
-                            # Special override for recurring events - always include them regardless of age
-                            if event.get('type') == 'seriesMaster':
-                                stats['passed_all_filters'] += 1
-                                filter_reason = "passed_all_filters"
-                            else:
-                                stats['past_events'] += 1
-                                filter_reason = f"past_event (date: {event_date_utc}, cutoff: {cutoff_date})"
-
-                        # Skip events too far in the future (but allow recurring events to extend further)
-                        elif event_date_utc > future_cutoff:
-                            # Special override for recurring events - allow them to extend further into the future
-                            if event.get('type') == 'seriesMaster':
-                                stats['passed_all_filters'] += 1
-                                filter_reason = "passed_all_filters"
-                            else:
-                                stats['future_events'] += 1
-                                filter_reason = f"future_event (date: {event_date_utc}, cutoff: {future_cutoff})"
-                        else:
-                            stats['passed_all_filters'] += 1
-                            filter_reason = "passed_all_filters"
-                            
-                except Exception as e:
-                    stats['date_parse_errors'] += 1
-                    filter_reason = f"date_parse_error: {str(e)}"
-            
-            # Record why this event was filtered out
-            if filter_reason != "passed_all_filters":
-                filtered_out_events.append({
-                    'subject': subject,
-                    'start_date': event.get('start', {}).get('dateTime', 'No date')[:10],
-                    'categories': categories,
-                    'showAs': show_as,
-                    'type': event_type,
-                    'filter_reason': filter_reason
-                })
-        
-        return jsonify({
-            'filtering_stats': stats,
-            'filtered_out_events': filtered_out_events[:30],  # First 30
-            'generated_time': DateTimeUtils.format_central_time(DateTimeUtils.get_central_time())
-        })
+        job = submit_debug_job(('sync-breakdown', source_id), compute_sync_breakdown, source_id)
+        return _debug_job_response(job)
         
     except Exception as e:
         logger.error(f"Debug sync breakdown error: {e}")
@@ -2009,34 +2180,37 @@ def debug_sync_breakdown():
 def debug_specific_event(event_subject):
     """Debug: Check why a specific event isn't syncing"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source calendar ID
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
             return jsonify({"error": "Source calendar not found"}), 404
         
         # Get all events from source calendar
-        all_events = sync_engine.reader.get_calendar_events(source_id)
+        all_events = cached_calendar_events(source_id)
         if not all_events:
             return jsonify({"error": "Could not retrieve source events"}), 500
         
-        # Find the specific event
+        # Paging / payload controls: raw Graph events (the DEBUG_EVENT_FIELDS
+        # payload, so recurrence but no body) are only embedded on request
+        limit = max(1, request.args.get('limit', 10, type=int))
+        include_raw = request.args.get('include_raw', '0') == '1'
+        
+        # Find the specific event, stopping once there is ample headroom
+        search_term = event_subject.lower()
+        scan_cap = limit * 5
         matching_events = []
         for event in all_events:
-            if event_subject.lower() in event.get('subject', '').lower():
+            if search_term in event['_subject_lc']:
                 matching_events.append(event)
+                if len(matching_events) >= scan_cap:
+                    break
         
         if not matching_events:
             return jsonify({"error": f"No events found matching '{event_subject}'"}), 404
         
         # Check each matching event
         results = []
-        for event in matching_events:
+        for event in matching_events[:limit]:
             subject = event.get('subject', 'No Subject')
             categories = event.get('categories', [])
             show_as = event.get('showAs', 'busy')
@@ -2057,8 +2231,6 @@ def debug_specific_event(event_subject):
             date_check = "unknown"
             if start_date and start_date != 'No date':
                 try:
-                    from datetime import timedelta
-                    import pytz
                     event_date = DateTimeUtils.parse_graph_datetime(event.get('start', {}))
                     if event_date:
                         if event_date.tzinfo is None:
@@ -2092,7 +2264,7 @@ def debug_specific_event(event_subject):
                 date_check == "valid_date"
             ])
             
-            results.append({
+            result = {
                 'subject': subject,
                 'start_date': start_date,
                 'categories': categories,
@@ -2100,12 +2272,16 @@ def debug_specific_event(event_subject):
                 'type': event_type,
                 'isCancelled': is_cancelled,
                 'checks': checks,
-                'should_sync': should_sync,
-                'raw_event': event
-            })
+                'should_sync': should_sync
+            }
+            if include_raw:
+                result['raw_event'] = strip_private_keys(event)
+            results.append(result)
         
         return jsonify({
             'search_term': event_subject,
+            'limit': limit,
+            'truncated': len(matching_events) > limit,
             'matching_events': results,
             'generated_time': DateTimeUtils.format_central_time(DateTimeUtils.get_central_time())
         })
@@ -2121,12 +2297,6 @@ def debug_specific_event(event_subject):
 def debug_mass_daily_sync_status():
     """Debug: Check which Mass- Daily events are actually syncing"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source calendar ID
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
@@ -2149,7 +2319,9 @@ def debug_mass_daily_sync_status():
                     })
         
         # Also get all Mass- Daily events from source for comparison
-        all_events = sync_engine.reader.get_calendar_events(source_id)
+        all_events = cached_calendar_events(source_id)
+        if all_events is None:
+            return jsonify({"error": "Could not retrieve source events"}), 500
         mass_daily_all = []
         for event in all_events:
             if 'Mass- Daily' in event.get('subject', ''):
@@ -2181,25 +2353,22 @@ def debug_mass_daily_sync_status():
 def debug_missing_public_events():
     """Debug: Show events with Public tags that aren't syncing"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source calendar ID
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
             return jsonify({"error": "Source calendar not found"}), 404
         
         # Get all events from source calendar
-        all_events = sync_engine.reader.get_calendar_events(source_id)
+        all_events = cached_calendar_events(source_id)
         if not all_events:
             return jsonify({"error": "Could not retrieve source events"}), 500
         
-        # Get public events using the actual sync method
-        public_events = sync_engine.reader.get_public_events(source_id)
-        public_event_subjects = {event.get('subject') for event in public_events} if public_events else set()
+        # Subjects the sync picks up: the cached list run through the sync's
+        # own filters and window
+        public_events = sync_engine.reader.get_public_events(source_id, events=all_events)
+        if public_events is None:
+            return jsonify({"error": "Could not determine which events sync"}), 500
+        public_event_subjects = {event.get('subject') for event in public_events}
         
         # Find events with Public tags that aren't syncing
         missing_public_events = []
@@ -2233,25 +2402,23 @@ def debug_missing_public_events():
 def debug_current_sync_status():
     """Debug: Check current sync status and what's actually in the public calendar"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source calendar ID
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
             return jsonify({"error": "Source calendar not found"}), 404
         
         # Get public calendar ID
-        public_id = sync_engine.reader.find_calendar_id(config.PUBLIC_CALENDAR)
+        public_id = sync_engine.reader.find_calendar_id(config.TARGET_CALENDAR)
         if not public_id:
             return jsonify({"error": "Public calendar not found"}), 404
         
         # Get all events from both calendars
-        source_events = sync_engine.reader.get_calendar_events(source_id)
-        public_events = sync_engine.reader.get_calendar_events(public_id)
+        source_events = cached_calendar_events(source_id)
+        public_events = cached_calendar_events(public_id)
+        if source_events is None:
+            return jsonify({"error": "Could not retrieve source events"}), 500
+        if public_events is None:
+            return jsonify({"error": "Could not retrieve public calendar events"}), 500
         
         # Find public events in source
         source_public_events = []
@@ -2276,14 +2443,14 @@ def debug_current_sync_status():
                 'isCancelled': event.get('isCancelled', False)
             })
         
-        # Find missing events
+        # Find missing events: diff the subject sets once, then materialize
+        # one representative event per missing subject
+        source_by_subject = {event['subject']: event for event in source_public_events}
         public_subjects = {event['subject'] for event in public_calendar_events}
-        missing_events = []
-        for event in source_public_events:
-            if event['subject'] not in public_subjects:
-                missing_events.append(event)
+        missing_subjects = source_by_subject.keys() - public_subjects
+        missing_events = [source_by_subject[subject] for subject in missing_subjects]
         
-        return jsonify({
+        return ojsonify({
             'source_public_events': source_public_events,
             'public_calendar_events': public_calendar_events,
             'missing_events': missing_events,
@@ -2316,7 +2483,7 @@ def quick_debug():
             return jsonify({"error": "Source calendar not found"}), 404
         
         # Get all events from source calendar
-        all_events = sync_engine.reader.get_calendar_events(source_id)
+        all_events = cached_calendar_events(source_id)
         if not all_events:
             return jsonify({"error": "Could not retrieve source events"}), 500
         
@@ -2359,9 +2526,8 @@ def quick_debug():
             "traceback": traceback.format_exc()
         }), 500
 
-@app.route('/debug/graph-api-test')
-def debug_graph_api_test():
-    """Test Microsoft Graph API directly - focused on categories"""
+def _graph_api_category_test(result_key):
+    """Query Graph directly for a few source events and summarize their categories"""
     try:
         if not auth_manager or not auth_manager.is_authenticated():
             return jsonify({"error": "Not authenticated"}), 401
@@ -2387,8 +2553,7 @@ def debug_graph_api_test():
             '$orderby': 'start/dateTime desc'
         }
         
-        import requests
-        response = requests.get(url, headers=headers, params=params, timeout=30)
+        response = GRAPH_SESSION.get(url, headers=headers, params=params, timeout=30)
         
         if response.status_code != 200:
             return jsonify({
@@ -2396,7 +2561,7 @@ def debug_graph_api_test():
                 "response": response.text
             }), 500
         
-        events = response.json().get('value', [])
+        events = parse_json_response(response).get('value', [])
         
         # Analyze categories
         category_analysis = {
@@ -2431,194 +2596,42 @@ def debug_graph_api_test():
                 })
         
         return jsonify({
-            'graph_api_test': category_analysis,
+            result_key: category_analysis,
             'api_response_status': response.status_code,
             'generated_time': DateTimeUtils.format_central_time(DateTimeUtils.get_central_time())
         })
         
     except Exception as e:
-        logger.error(f"Graph API test error: {e}")
+        logger.error(f"Graph API test ({result_key}) error: {e}")
         return jsonify({
             "error": str(e),
             "traceback": traceback.format_exc()
         }), 500
 
+@app.route('/debug/graph-api-test')
+def debug_graph_api_test():
+    """Test Microsoft Graph API directly - focused on categories"""
+    return _graph_api_category_test('graph_api_test')
+
 @app.route('/debug/graph-api-test-2')
 def debug_graph_api_test_2():
     """Test Microsoft Graph API again - check for consistency"""
-    try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
-        # Get source calendar ID
-        source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
-        if not source_id:
-            return jsonify({"error": "Source calendar not found"}), 404
-        
-        # Test Graph API directly with minimal fields
-        headers = auth_manager.get_headers()
-        if not headers:
-            return jsonify({"error": "No auth headers"}), 401
-        
-        # Get just a few events with categories field
-        url = f"https://graph.microsoft.com/v1.0/users/{config.SHARED_MAILBOX}/calendars/{source_id}/events"
-        params = {
-            '$select': 'subject,start,categories,showAs,type,isCancelled',
-            '$top': 10,
-            '$orderby': 'start/dateTime desc'
-        }
-        
-        import requests
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        
-        if response.status_code != 200:
-            return jsonify({
-                "error": f"Graph API error: {response.status_code}",
-                "response": response.text
-            }), 500
-        
-        events = response.json().get('value', [])
-        
-        # Analyze categories
-        category_analysis = {
-            'total_events': len(events),
-            'events_with_categories': 0,
-            'events_without_categories': 0,
-            'public_events': 0,
-            'sample_events': []
-        }
-        
-        for event in events:
-            categories = event.get('categories', [])
-            has_categories = len(categories) > 0
-            has_public = 'Public' in categories
-            
-            if has_categories:
-                category_analysis['events_with_categories'] += 1
-            else:
-                category_analysis['events_without_categories'] += 1
-            
-            if has_public:
-                category_analysis['public_events'] += 1
-            
-            # Sample events
-            if len(category_analysis['sample_events']) < 5:
-                category_analysis['sample_events'].append({
-                    'subject': event.get('subject'),
-                    'categories': categories,
-                    'showAs': event.get('showAs'),
-                    'type': event.get('type'),
-                    'start': event.get('start', {}).get('dateTime', 'No date')[:10]
-                })
-        
-        return jsonify({
-            'graph_api_test_2': category_analysis,
-            'api_response_status': response.status_code,
-            'generated_time': DateTimeUtils.format_central_time(DateTimeUtils.get_central_time())
-        })
-        
-    except Exception as e:
-        logger.error(f"Graph API test 2 error: {e}")
-        return jsonify({
-            "error": str(e),
-            "traceback": traceback.format_exc()
-        }), 500
-
-@app.route('/debug/test-single-event/<event_subject>')
-def test_single_event(event_subject):
-    """Test why a specific event isn't syncing"""
-    try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
-        # Get source calendar ID
-        source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
-        if not source_id:
-            return jsonify({"error": "Source calendar not found"}), 404
-        
-        # Get all events from source
-        all_events = sync_engine.reader.get_calendar_events(source_id)
-        
-        # Find matching event
-        matching_events = []
-        for event in all_events:
-            if event_subject.lower() in (event.get('subject') or '').lower():
-                matching_events.append({
-                    'subject': event.get('subject'),
-                    'type': event.get('type'),
-                    'categories': event.get('categories', []),
-                    'showAs': event.get('showAs'),
-                    'start': event.get('start'),
-                    'end': event.get('end'),
-                    'isAllDay': event.get('isAllDay'),
-                    'isCancelled': event.get('isCancelled'),
-                    'seriesMasterId': event.get('seriesMasterId'),
-                    'has_public': 'Public' in event.get('categories', []),
-                    'is_busy': event.get('showAs') == 'busy',
-                    'would_sync': 'Public' in event.get('categories', []) and event.get('showAs') == 'busy'
-                })
-        
-        # Now check what's in the public calendar
-        target_id = sync_engine.reader.find_calendar_id(config.TARGET_CALENDAR)
-        target_events = []
-        if target_id:
-            all_target = sync_engine.reader.get_calendar_events(target_id)
-            for event in all_target:
-                if event_subject.lower() in (event.get('subject') or '').lower():
-                    target_events.append({
-                        'subject': event.get('subject'),
-                        'type': event.get('type'),
-                        'start': event.get('start')
-                    })
-        
-        return jsonify({
-            'search_term': event_subject,
-            'source_events_found': len(matching_events),
-            'source_events': matching_events,
-            'target_events_found': len(target_events),
-            'target_events': target_events,
-            'diagnosis': {
-                'should_sync': len([e for e in matching_events if e['would_sync']]),
-                'blocked_by_category': len([e for e in matching_events if not e['has_public']]),
-                'blocked_by_showas': len([e for e in matching_events if not e['is_busy']])
-            }
-        })
-        
-    except Exception as e:
-        return jsonify({"error": str(e)}), 500
+    return _graph_api_category_test('graph_api_test_2')
 
 @app.route('/debug/verify-config')
 def verify_config():
     """Verify configuration matches actual calendar names"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get all calendars
-        calendars = sync_engine.reader.get_calendars()
+        calendars = cached_calendars()
+        if not calendars:
+            return jsonify({"error": "Could not retrieve calendars"}), 500
         
         # Find configured calendars
-        source_found = False
-        target_found = False
-        calendar_list = []
-        
-        for cal in calendars:
-            cal_name = cal.get('name')
-            calendar_list.append(cal_name)
-            
-            if cal_name == config.SOURCE_CALENDAR:
-                source_found = True
-            if cal_name == config.TARGET_CALENDAR:
-                target_found = True
+        calendar_list = [cal.get('name') for cal in calendars]
+        calendar_names = set(calendar_list)
+        source_found = config.SOURCE_CALENDAR in calendar_names
+        target_found = config.TARGET_CALENDAR in calendar_names
         
         return jsonify({
             'configuration': {
@@ -2645,56 +2658,51 @@ def verify_config():
 def debug_problem_range():
     """Specifically analyze Sept 22 - Nov 21 events"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source calendar ID
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
             return jsonify({"error": "Source calendar not found"}), 404
         
-        # Get all events from source
-        all_events = sync_engine.reader.get_calendar_events(source_id)
-        
-        problem_events = []
+        # Fetch only the problem window; calendarView filters by date server-side
         current_year = datetime.now().year
-        problem_start = f"{current_year}-09-21"
-        problem_end = f"{current_year}-11-22"
-        
+        problem_start = _CENTRAL.localize(datetime(current_year, 9, 21))
+        problem_end = _CENTRAL.localize(datetime(current_year, 11, 23))
+        all_events = sync_engine.reader.get_calendar_events(
+            source_id, select_fields=DEBUG_EVENT_FIELDS, start=problem_start, end=problem_end
+        ) or []
+
+        # One pass: tally types and sync eligibility, only build dicts for the sample
+        type_counts = Counter()
+        would_sync_count = 0
+        sample_events = []
         for event in all_events:
-            date_str = event.get('start', {}).get('dateTime', '')[:10]
-            if problem_start <= date_str <= problem_end:
-                problem_events.append({
+            categories = event.get('categories', [])
+            event_type = event.get('type')
+            would_sync = 'Public' in categories and event.get('showAs') == 'busy' and not event.get('isCancelled', False)
+            type_counts[event_type] += 1
+            if would_sync:
+                would_sync_count += 1
+            if len(sample_events) < 20:
+                sample_events.append({
                     'subject': event.get('subject'),
-                    'date': date_str,
-                    'type': event.get('type'),
-                    'categories': event.get('categories', []),
+                    'date': event.get('start', {}).get('dateTime', '')[:10],
+                    'type': event_type,
+                    'categories': categories,
                     'showAs': event.get('showAs'),
                     'seriesMasterId': event.get('seriesMasterId'),
                     'isCancelled': event.get('isCancelled'),
-                    'would_sync': 'Public' in event.get('categories', []) and event.get('showAs') == 'busy' and not event.get('isCancelled', False)
+                    'would_sync': would_sync
                 })
         
-        # Group by type for analysis
-        by_type = {}
-        for event in problem_events:
-            event_type = event['type']
-            if event_type not in by_type:
-                by_type[event_type] = []
-            by_type[event_type].append(event)
-        
-        return jsonify({
-            'total_in_range': len(problem_events),
-            'by_type': {k: len(v) for k, v in by_type.items()},
-            'events': problem_events[:20],  # First 20 as sample
-            'would_sync_count': len([e for e in problem_events if e['would_sync']]),
+        return ojsonify({
+            'total_in_range': len(all_events),
+            'by_type': dict(type_counts),
+            'events': sample_events,  # First 20 as sample
+            'would_sync_count': would_sync_count,
             'analysis': {
-                'occurrence_count': len([e for e in problem_events if e['type'] == 'occurrence']),
-                'seriesmaster_count': len([e for e in problem_events if e['type'] == 'seriesMaster']),
-                'singleinstance_count': len([e for e in problem_events if e['type'] == 'singleInstance'])
+                'occurrence_count': type_counts['occurrence'],
+                'seriesmaster_count': type_counts['seriesMaster'],
+                'singleinstance_count': type_counts['singleInstance']
             }
         })
         
@@ -2706,12 +2714,6 @@ def debug_problem_range():
 def debug_october_full():
     """Complete analysis of October sync pipeline"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
             return jsonify({"error": "Source calendar not found"}), 404
@@ -2737,6 +2739,9 @@ def debug_october_full():
         if not headers:
             return jsonify({"error": "No auth headers"}), 401
         
+        # The calendarView window does the date filtering server-side; asking for
+        # Central times means dateTime[:10] is already the local date
+        headers = dict(headers, Prefer='outlook.timezone="America/Chicago"')
         endpoint = f"https://graph.microsoft.com/v1.0/users/{config.SHARED_MAILBOX}/calendars/{source_id}/calendarView"
         params = {
             "startDateTime": start,
@@ -2745,59 +2750,74 @@ def debug_october_full():
             "$select": "id,subject,start,end,categories,showAs,type,seriesMasterId,isCancelled"
         }
         
-        import requests
-        response = requests.get(endpoint, headers=headers, params=params)
+        response = GRAPH_SESSION.get(endpoint, headers=headers, params=params, timeout=30)
         if response.status_code != 200:
             return jsonify({"error": f"API call failed: {response.status_code}", "response": response.text}), 500
         
-        raw_events = response.json().get('value', [])
+        body = parse_json_response(response)
+        raw_events = body.get('value', [])
+        while '@odata.nextLink' in body:
+            response = GRAPH_SESSION.get(body['@odata.nextLink'], headers=headers, timeout=30)
+            if response.status_code != 200:
+                logger.warning(f"October analysis stopped paging: {response.status_code}")
+                break
+            body = parse_json_response(response)
+            raw_events.extend(body.get('value', []))
         pipeline_stats['raw_fetch'] = len(raw_events)
         
-        # Analyze each event
-        october_events = []
+        # Analyze each event in one pass: counters stay in locals and sample
+        # rows are only built while a sample still has room
+        public_count = busy_count = both_count = occurrence_count = final_count = 0
+        should_sync_sample = []
+        blocked_sample = []
         for event in raw_events:
-            event_date = event.get('start', {}).get('dateTime', '')[:10]
-            if not (f'{current_year}-10-01' <= event_date <= f'{current_year}-10-31'):
-                continue
-                
-            pipeline_stats['after_date_filter'] += 1
-            
             categories = event.get('categories', [])
             has_public = 'Public' in categories
             show_as = event.get('showAs', 'busy')
             is_busy = show_as == 'busy'
             event_type = event.get('type', 'singleInstance')
+            would_sync = has_public and is_busy and event_type != 'occurrence'
             
             if has_public:
-                pipeline_stats['public_category'] += 1
+                public_count += 1
             if is_busy:
-                pipeline_stats['busy_status'] += 1
+                busy_count += 1
             if has_public and is_busy:
-                pipeline_stats['public_and_busy'] += 1
+                both_count += 1
             if event_type == 'occurrence':
-                pipeline_stats['filtered_occurrences'] += 1
+                occurrence_count += 1
+            if would_sync:
+                final_count += 1
             
-            october_events.append({
-                'subject': event.get('subject'),
-                'date': event_date,
-                'categories': categories,
-                'showAs': show_as,
-                'type': event_type,
-                'has_public': has_public,
-                'is_busy': is_busy,
-                'would_sync': has_public and is_busy and event_type != 'occurrence'
-            })
-        
-        # Count final events that would sync
-        pipeline_stats['final_count'] = sum(1 for e in october_events if e['would_sync'])
-        
-        # Sample events that should sync but might not be
-        should_sync_sample = [e for e in october_events if e['has_public'] and e['is_busy']][:10]
-        blocked_sample = [e for e in october_events if not e['would_sync']][:10]
-        
-        return jsonify({
+            # Sample events that should sync but might not be
+            wants_should = has_public and is_busy and len(should_sync_sample) < 10
+            wants_blocked = not would_sync and len(blocked_sample) < 10
+            if wants_should or wants_blocked:
+                row = {
+                    'subject': event.get('subject'),
+                    'date': event.get('start', {}).get('dateTime', '')[:10],
+                    'categories': categories,
+                    'showAs': show_as,
+                    'type': event_type,
+                    'has_public': has_public,
+                    'is_busy': is_busy,
+                    'would_sync': would_sync
+                }
+                if wants_should:
+                    should_sync_sample.append(row)
+                if wants_blocked:
+                    blocked_sample.append(row)
+        
+        pipeline_stats['after_date_filter'] = len(raw_events)
+        pipeline_stats['public_category'] = public_count
+        pipeline_stats['busy_status'] = busy_count
+        pipeline_stats['public_and_busy'] = both_count
+        pipeline_stats['filtered_occurrences'] = occurrence_count
+        pipeline_stats['final_count'] = final_count
+        
+        return ojsonify({
             'pipeline_stats': pipeline_stats,
-            'total_october_events': len(october_events),
+            'total_october_events': len(raw_events),
             'should_sync_sample': should_sync_sample,
             'blocked_sample': blocked_sample,
             'summary': {
@@ -2812,33 +2832,28 @@ def debug_october_full():
         
     except Exception as e:
         logger.error(f"October analysis error: {e}")
-        import traceback
         return jsonify({"error": str(e), "trace": traceback.format_exc()}), 500
 
 @app.route('/debug/verify-pagination-fix')
 def verify_pagination():
     """Verify pagination is working"""
     try:
-        from datetime import datetime
         current_year = datetime.now().year
         
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-            
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
             return jsonify({"error": "Source calendar not found"}), 404
         
         # Now test the fixed method
-        all_events = sync_engine.reader.get_calendar_events(source_id)
+        all_events = cached_calendar_events(source_id)
+        if all_events is None:
+            return jsonify({"error": "Could not retrieve source events"}), 500
         
-        # Count October events
-        october_events = [e for e in all_events if e.get('start', {}).get('dateTime', '').startswith(f'{current_year}-10')]
+        # Count October events (prefix built once, compared as a fixed-width slice)
+        october_prefix = f'{current_year}-10'
+        october_events = [e for e in all_events if e.get('start', {}).get('dateTime', '')[:7] == october_prefix]
         
-        return jsonify({
+        return ojsonify({
             'total_events_fetched': len(all_events),
             'october_events_count': len(october_events),
             'october_subjects': [e.get('subject') for e in october_events[:20]],
@@ -2854,22 +2869,29 @@ def verify_pagination():
 def debug_test_single_event(subject):
     """Test why a specific event isn't syncing"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
-        # Get source events
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
-        source_events = sync_engine.reader.get_public_events(source_id)
+        target_id = sync_engine.reader.find_calendar_id(config.TARGET_CALENDAR)
+        if not source_id or not target_id:
+            return jsonify({"error": "Could not find required calendars"}), 404
+        
+        # Read both sides the way the sync does (same calls, payload and
+        # window), not through the trimmed debug cache, so the signatures
+        # below are the ones the sync actually matches on
+        start_date = DateTimeUtils.get_central_time() - timedelta(days=config.SYNC_CUTOFF_DAYS)
+        end_date = DateTimeUtils.get_central_time() + timedelta(days=config.SYNC_LOOKAHEAD_DAYS)
+        source_events = sync_engine.reader.get_public_events(source_id, start=start_date, end=end_date)
+        target_events = sync_engine.reader.get_calendar_events(target_id, start=start_date, end=end_date)
+        if source_events is None:
+            return jsonify({"error": "Could not retrieve source events"}), 500
+        if target_events is None:
+            return jsonify({"error": "Could not retrieve target events"}), 500
         
         # Find events matching subject
-        matching = [e for e in source_events if subject.lower() in e.get('subject', '').lower()]
+        matching = SubjectIndex(source_events).query(subject)
         
-        # Get target events
-        target_id = sync_engine.reader.find_calendar_id(config.TARGET_CALENDAR)
-        target_events = sync_engine.reader.get_calendar_events(target_id)
+        target_index = {}
+        for event in target_events:
+            target_index.setdefault(sync_engine._create_event_signature(event), event)
         
         # Generate signatures
         results = []
@@ -2877,11 +2899,7 @@ def debug_test_single_event(subject):
             sig = sync_engine._create_event_signature(event)
             
             # Check if signature exists in target
-            target_match = None
-            for t_event in target_events:
-                if sync_engine._create_event_signature(t_event) == sig:
-                    target_match = t_event
-                    break
+            target_match = target_index.get(sig)
             
             results.append({
                 'source_subject': event.get('subject'),
@@ -2946,20 +2964,13 @@ def migrate_extended_properties():
         
     except Exception as e:
         logger.error(f"Migration error: {e}")
-        import traceback
         return jsonify({
             "error": str(e),
             "traceback": traceback.format_exc()
         }), 500
 
-@app.route('/admin')
-def admin_interface():
-    """Web interface for debugging category reading issues"""
-    try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return redirect('/')
-        
-        return '''
+# Static admin page, built once at import rather than per request
+_ADMIN_HTML = '''
         <!DOCTYPE html>
         <html>
         <head>
@@ -3207,6 +3218,12 @@ def admin_interface():
         </body>
         </html>
         '''
+
+@app.route('/admin')
+def admin_interface():
+    """Web interface for debugging category reading issues"""
+    try:
+        return _ADMIN_HTML
         
     except Exception as e:
         logger.error(f"Admin interface error: {e}")
@@ -3229,6 +3246,25 @@ logger.info(f"🕐 Server timezone: America/Chicago")
 logger.info(f"🕐 Current time: {DateTimeUtils.format_central_time(DateTimeUtils.get_central_time())}")
 initialize_components()
 
+# Calendar emoji SVG as apple touch icon; the ETag lets browsers revalidate with a 304
+_APPLE_ICON_SVG = '''<svg width="180" height="180" xmlns="https://www.w3.org/2000/svg">
+      <rect width="180" height="180" fill="#f8f8f8" rx="36"/>
+      <text x="50%" y="55%" font-family="Apple Color Emoji,Segoe UI Emoji,Noto Color Emoji" font-size="120" text-anchor="middle">📅</text>
+    </svg>'''
+_APPLE_ICON_ETAG = hashlib.md5(_APPLE_ICON_SVG.encode()).hexdigest()
+_APPLE_ICON_HEADERS = {
+    'Content-Type': 'image/svg+xml',
+    'Cache-Control': 'public, max-age=31536000, immutable',
+    'ETag': f'"{_APPLE_ICON_ETAG}"'
+}
+_FAVICON_SVG = "<svg xmlns='https://www.w3.org/2000/svg' viewBox='0 0 100 100'><text y='.9em' font-size='90'>📅</text></svg>".encode()
+_FAVICON_ETAG = hashlib.sha1(_FAVICON_SVG).hexdigest()
+_FAVICON_HEADERS = {
+    'Content-Type': 'image/svg+xml',
+    'Cache-Control': 'public, max-age=31536000, immutable',
+    'ETag': f'"{_FAVICON_ETAG}"'
+}
+
 @app.route('/apple-touch-icon.png')
 @app.route('/apple-touch-icon-precomposed.png')
 @app.route('/apple-touch-icon-120x120.png')
@@ -3238,46 +3274,152 @@ initialize_components()
 @app.route('/apple-touch-icon-180x180.png')
 def apple_touch_icon():
     """Serve apple touch icon"""
-    import base64
-    
-    # Calendar emoji SVG as apple touch icon
-    svg_content = '''<svg width="180" height="180" xmlns="https://www.w3.org/2000/svg">
-      <rect width="180" height="180" fill="#f8f8f8" rx="36"/>
-      <text x="50%" y="55%" font-family="Apple Color Emoji,Segoe UI Emoji,Noto Color Emoji" font-size="120" text-anchor="middle">📅</text>
-    </svg>'''
-    
-    # Return SVG with proper headers
-    return svg_content, 200, {
-        'Content-Type': 'image/svg+xml',
-        'Cache-Control': 'public, max-age=31536000'
-    }
+    if _APPLE_ICON_ETAG in request.if_none_match:
+        return '', 304, _APPLE_ICON_HEADERS
+    return _APPLE_ICON_SVG, 200, _APPLE_ICON_HEADERS
 
 @app.route('/favicon.ico')
 def favicon():
     """Serve favicon"""
-    return redirect("data:image/svg+xml,%3Csvg xmlns='https://www.w3.org/2000/svg' viewBox='0 0 100 100'%3E%3Ctext y='.9em' font-size='90'%3E📅%3C/text%3E%3C/svg%3E")
+    if _FAVICON_ETAG in request.if_none_match:
+        return '', 304, _FAVICON_HEADERS
+    return _FAVICON_SVG, 200, _FAVICON_HEADERS
 
 # Add this route to your app.py file (add it before the if __name__ == '__main__': line)
 
 def utc_to_central(utc_dt):
     """Convert UTC datetime to Central Time"""
-    import pytz
     if utc_dt.tzinfo is None:
-        utc_dt = pytz.UTC.localize(utc_dt)
-    central = pytz.timezone('America/Chicago')
-    return utc_dt.astimezone(central)
+        utc_dt = utc_dt.replace(tzinfo=timezone.utc)
+    return utc_dt.astimezone(_CENTRAL)
 
 def format_central_time(dt):
     """Format datetime for display in Central timezone"""
     if dt is None:
         return 'Never'
     if isinstance(dt, str):
-        dt = datetime.fromisoformat(dt.replace('Z', '+00:00'))
-    import pytz
-    central_tz = pytz.timezone('America/Chicago')
+        dt = parse_iso_datetime(dt.replace('Z', '+00:00'))
     if dt.tzinfo is None:
-        dt = central_tz.localize(dt)
-    return dt.astimezone(central_tz).strftime('%b %d, %Y at %I:%M %p CT')
+        dt = _CENTRAL.localize(dt)
+    return dt.astimezone(_CENTRAL).strftime('%b %d, %Y at %I:%M %p CT')
+
+def graph_datetime_to_utc(dt_dict, _fromiso=parse_iso_datetime):
+    """
+    Convert a Microsoft Graph dateTime dict to timezone-aware UTC datetime.
+    Handles cases where dateTime has no 'Z' and timeZone is 'Central Standard Time'.
+    Also handles 'date' field for all-day events. Returns None when there is
+    no value; malformed strings raise ValueError for the caller to handle.
+    """
+    if not dt_dict:
+        return None
+    # Date-only format (all-day events): noon UTC avoids timezone shift issues
+    date_str = dt_dict.get('date')
+    if date_str:
+        return _fromiso(date_str + 'T12:00:00').replace(tzinfo=_UTC)
+    dt_str = dt_dict.get('dateTime')
+    if not dt_str:
+        return None
+    if dt_str[-1] == 'Z':
+        dt_str = dt_str[:-1] + '+00:00'
+    dt = _fromiso(dt_str)
+    if dt.tzinfo is not None:
+        return dt.astimezone(_UTC)
+    # Map Graph TZ to pytz; fallback: assume UTC if unknown
+    return _GRAPH_TIMEZONES.get(dt_dict.get('timeZone'), _UTC).localize(dt).astimezone(_UTC)
+
+# Bulletin and event-search calendarView results, keyed by calendar and window
+CALENDAR_VIEW_CACHE_TTL_SECONDS = 60
+_calendar_view_cache = TTLCache(maxsize=32, ttl_seconds=CALENDAR_VIEW_CACHE_TTL_SECONDS)
+
+# Public calendar ID by name; it only changes if the calendar is recreated
+PUBLIC_CALENDAR_ID_TTL_SECONDS = 3600
+_public_calendar_ids = TTLCache(maxsize=8, ttl_seconds=PUBLIC_CALENDAR_ID_TTL_SECONDS)
+
+def _list_calendar_id(calendar_name, headers):
+    """Look up a calendar ID with the given headers; raises on a Graph error"""
+    calendars_url = f"https://graph.microsoft.com/v1.0/users/{config.SHARED_MAILBOX}/calendars"
+    response = GRAPH_SESSION.get(calendars_url, headers=headers, timeout=30)
+    response.raise_for_status()
+    for cal in parse_json_response(response).get('value', []):
+        if cal.get('name') == calendar_name:
+            return cal.get('id')
+    return None
+
+def _fetch_bulletin_window(calendar_id, start_str, end_str, headers):
+    """calendarView events for one bulletin window, with bodies where needed"""
+    # Use Microsoft Graph calendarView API
+    url = f"https://graph.microsoft.com/v1.0/users/{config.SHARED_MAILBOX}/calendars/{calendar_id}/calendarView"
+
+    params = {
+        'startDateTime': start_str,
+        'endDateTime': end_str,
+        # body is fetched separately, only for events without a location
+        '$select': 'id,subject,start,end,categories,location,isAllDay,showAs,type',
+        '$orderby': 'start/dateTime',
+        '$top': 999  # Graph's page-size ceiling; a bulletin week is one page
+    }
+
+    all_events = []
+
+    try:
+        response = GRAPH_CLIENT.get(url, headers=headers, params=params, timeout=30)
+
+        if response.status_code == 401:
+            # Try refreshing token
+            if sync_engine.auth.refresh_access_token():
+                headers = sync_engine.auth.get_headers()
+                response = GRAPH_CLIENT.get(url, headers=headers, params=params, timeout=30)
+
+        if response.status_code == 200:
+            data = parse_json_response(response)
+            all_events = data.get('value', [])
+            logger.info(f"Fetched {len(all_events)} events from calendar")
+
+            # Handle pagination if needed
+            next_link = data.get('@odata.nextLink')
+            while next_link:
+                next_response = GRAPH_CLIENT.get(next_link, headers=headers, timeout=30)
+                if next_response.status_code == 200:
+                    next_data = parse_json_response(next_response)
+                    next_events = next_data.get('value', [])
+                    all_events.extend(next_events)
+                    logger.info(f"Added {len(next_events)} more events from pagination")
+                    next_link = next_data.get('@odata.nextLink')
+                else:
+                    break
+
+            logger.info(f"Total events fetched: {len(all_events)}")
+            if all_events:
+                logger.info(f"Sample event: {all_events[0].get('subject', 'No Subject')} at {all_events[0].get('start', {}).get('dateTime', 'No Time')}")
+        else:
+            logger.error(f"Failed to get calendar view: {response.status_code} - {response.text}")
+            all_events = []
+
+    except Exception as e:
+        logger.error(f"Error fetching calendar view: {e}")
+        all_events = []
+
+    # The body's "Location:" line is only a fallback, so pull bodies just for
+    # events whose location field is empty
+    missing_location_ids = [
+        event['id'] for event in all_events
+        if event.get('id') and not ((event.get('location') or {}).get('displayName') or '').strip()
+    ]
+    if missing_location_ids:
+        bodies = sync_engine.reader.get_event_bodies(missing_location_ids)
+        for event in all_events:
+            if event.get('id') in bodies:
+                event['body'] = bodies[event['id']]
+
+    return all_events
+
+# Bulletin day headings; fixed English names instead of locale-dependent strftime
+_WEEKDAYS = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_MONTHS = ('', 'January', 'February', 'March', 'April', 'May', 'June', 'July',
+           'August', 'September', 'October', 'November', 'December')
+
+# "Location:" line the source calendar puts in event bodies; the value runs to the next tag
+_LOCATION_MARKER = '<strong>Location:</strong>'
 
 @app.route('/bulletin-events')
 def bulletin_events():
@@ -3293,235 +3435,133 @@ def bulletin_events():
         week_param = request.args.get('week', 'upcoming')
         
         # Get the public calendar ID
-        logger.info(f"Looking for calendar: {config.TARGET_CALENDAR}")
-        public_calendar_id = sync_engine.reader.find_calendar_id(config.TARGET_CALENDAR)
-        logger.info(f"Calendar ID found: {public_calendar_id}")
+        public_calendar_id = _public_calendar_ids.get_or_load(
+            config.TARGET_CALENDAR,
+            lambda: sync_engine.reader.find_calendar_id(config.TARGET_CALENDAR)
+        )
         if not public_calendar_id:
             logger.error(f"Public calendar not found: {config.TARGET_CALENDAR}")
             return jsonify({"error": "Public calendar not found"}), 404
         
         # Calculate date range based on week parameter
-        from datetime import timedelta
-        import pytz
-        import re
-        import requests
         
-        central_tz = pytz.timezone('America/Chicago')
         today = DateTimeUtils.get_central_time().date()
         
+        # Weeks run Sunday to Saturday. (wd + 1) % 7 is days since the last
+        # Sunday; the upcoming week starts at the next Sunday (a week out on Sundays).
+        days_since_sunday = (today.weekday() + 1) % 7
+        days_until_sunday = 7 - days_since_sunday
+        
         if week_param == 'current':
-            # Current week (Sunday to Saturday)
-            days_since_sunday = today.weekday() + 1 if today.weekday() != 6 else 0
             start_date = today - timedelta(days=days_since_sunday)
-            end_date = start_date + timedelta(days=6)
             week_label = "Current Week"
-        
-        elif week_param == 'upcoming':
-            # Upcoming week (Sunday to Saturday, 7 days)
-            days_until_sunday = (6 - today.weekday()) % 7
-            if days_until_sunday == 0:  # Today is Sunday — go to next Sunday
-                days_until_sunday = 7
-            start_date = today + timedelta(days=days_until_sunday)
-            end_date = start_date + timedelta(days=6)
-            week_label = "Upcoming Week"
-            logger.info(f"🔍 DEBUG: Upcoming week calculation - today={today}, days_until_sunday={days_until_sunday}, start_date={start_date}, end_date={end_date}, days_in_range={(end_date - start_date).days + 1}")
-        
         elif week_param == 'following':
-            # Following week (Sunday to Saturday, 7 days — one week after upcoming)
-            days_until_sunday = (6 - today.weekday()) % 7
-            if days_until_sunday == 0:  # Today is Sunday
-                days_until_sunday = 7
+            # One week after upcoming
             start_date = today + timedelta(days=days_until_sunday + 7)
-            end_date = start_date + timedelta(days=6)
             week_label = "Following Week"
-        
         else:
-            # Default to upcoming (Sunday to Saturday, 7 days)
-            days_until_sunday = (6 - today.weekday()) % 7
-            if days_until_sunday == 0:  # Today is Sunday
-                days_until_sunday = 7
+            # 'upcoming' and any unrecognized value
             start_date = today + timedelta(days=days_until_sunday)
-            end_date = start_date + timedelta(days=6)
             week_label = "Upcoming Week"
+        end_date = start_date + timedelta(days=6)
+        if week_param == 'upcoming':
+            logger.info(f"🔍 DEBUG: Upcoming week calculation - today={today}, days_until_sunday={days_until_sunday}, start_date={start_date}, end_date={end_date}, days_in_range={(end_date - start_date).days + 1}")
         
         # Create datetime objects at midnight in Central Time
-        start_datetime = central_tz.localize(datetime.combine(start_date, datetime.min.time()))
-        end_datetime = central_tz.localize(datetime.combine(end_date + timedelta(days=1), datetime.min.time()))
+        start_datetime = _CENTRAL.localize(datetime.combine(start_date, datetime.min.time()))
+        end_datetime = _CENTRAL.localize(datetime.combine(end_date + timedelta(days=1), datetime.min.time()))
         
         # Get auth headers
         headers = sync_engine.auth.get_headers()
         if not headers:
             return jsonify({"error": "No auth headers"}), 401
         
-        # Use Microsoft Graph calendarView API
-        url = f"https://graph.microsoft.com/v1.0/users/{config.SHARED_MAILBOX}/calendars/{public_calendar_id}/calendarView"
-        
         # Format dates for API (must be in UTC)
-        start_str = start_datetime.astimezone(pytz.UTC).strftime('%Y-%m-%dT%H:%M:%SZ')
-        end_str = end_datetime.astimezone(pytz.UTC).strftime('%Y-%m-%dT%H:%M:%SZ')
+        start_str = start_datetime.astimezone(_UTC).strftime('%Y-%m-%dT%H:%M:%SZ')
+        end_str = end_datetime.astimezone(_UTC).strftime('%Y-%m-%dT%H:%M:%SZ')
         
         logger.info(f"Date range: {start_date} to {end_date}")
         logger.info(f"API date range: {start_str} to {end_str}")
         
-        params = {
-            'startDateTime': start_str,
-            'endDateTime': end_str,
-            '$select': 'id,subject,start,end,categories,location,isAllDay,showAs,type,body',
-            '$orderby': 'start/dateTime',
-            '$top': 250
-        }
-        
-        all_events = []
-        
-        try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
-            
-            if response.status_code == 401:
-                # Try refreshing token
-                if sync_engine.auth.refresh_access_token():
-                    headers = sync_engine.auth.get_headers()
-                    response = requests.get(url, headers=headers, params=params, timeout=30)
-            
-            if response.status_code == 200:
-                data = response.json()
-                all_events = data.get('value', [])
-                logger.info(f"Fetched {len(all_events)} events from calendar")
-                
-                # Handle pagination if needed
-                next_link = data.get('@odata.nextLink')
-                while next_link:
-                    next_response = requests.get(next_link, headers=headers, timeout=30)
-                    if next_response.status_code == 200:
-                        next_data = next_response.json()
-                        next_events = next_data.get('value', [])
-                        all_events.extend(next_events)
-                        logger.info(f"Added {len(next_events)} more events from pagination")
-                        next_link = next_data.get('@odata.nextLink')
-                    else:
-                        break
-                
-                logger.info(f"Total events fetched: {len(all_events)}")
-                if all_events:
-                    logger.info(f"Sample event: {all_events[0].get('subject', 'No Subject')} at {all_events[0].get('start', {}).get('dateTime', 'No Time')}")
-            else:
-                logger.error(f"Failed to get calendar view: {response.status_code} - {response.text}")
-                all_events = []
-                
-        except Exception as e:
-            logger.error(f"Error fetching calendar view: {e}")
-            all_events = []
+        # Repeat page views within a minute reuse the same fetch
+        all_events = _calendar_view_cache.get_or_load(
+            ('bulletin', public_calendar_id, start_str, end_str),
+            lambda: _fetch_bulletin_window(public_calendar_id, start_str, end_str, headers)
+        ) or []
         
         # Process events for bulletin
         from utils import normalize_location, is_omitted_from_bulletin
 
-        def graph_datetime_to_utc(dt_dict):
-            """
-            Convert a Microsoft Graph dateTime dict to timezone-aware UTC datetime.
-            Handles cases where dateTime has no 'Z' and timeZone is 'Central Standard Time'.
-            Also handles 'date' field for all-day events.
-            """
-            try:
-                dt_dict = dt_dict or {}
-                # Check for date-only format (all-day events)
-                if 'date' in dt_dict:
-                    date_str = dt_dict['date']
-                    # Parse date and create datetime at noon UTC to avoid timezone shift issues
-                    dt = datetime.fromisoformat(date_str + 'T12:00:00')
-                    import pytz as _pytz
-                    return _pytz.UTC.localize(dt)
-                
-                # Handle dateTime format
-                dt_str = dt_dict.get('dateTime', '')
-                if not dt_str:
-                    return None
-                tz_name = dt_dict.get('timeZone', 'UTC') or 'UTC'
-
-                # Normalize ISO string; handle Z → +00:00
-                iso = dt_str.replace('Z', '+00:00')
-                dt = datetime.fromisoformat(iso)
-
-                # If already timezone-aware, convert to UTC
-                import pytz as _pytz
-                if dt.tzinfo is not None:
-                    return dt.astimezone(_pytz.UTC)
-
-                # Map Graph TZ to pytz
-                if tz_name == 'UTC':
-                    return _pytz.UTC.localize(dt)
-                if tz_name == 'Central Standard Time':
-                    central = _pytz.timezone('America/Chicago')
-                    return central.localize(dt).astimezone(_pytz.UTC)
-
-                # Fallback: assume UTC if unknown
-                return _pytz.UTC.localize(dt)
-            except Exception as _e:
-                logger.warning(f"Failed to parse Graph datetime: {dt_dict} ({_e})")
-                return None
-
-        logger.info(f"Processing {len(all_events)} events for bulletin")
+        # Hot-loop lookups bound to locals once
+        parse_graph_dt = graph_datetime_to_utc
+        # graph_datetime_to_utc always returns UTC, so pytz can convert the naive
+        # wall time directly instead of going through astimezone()
+        central_fromutc = _CENTRAL.fromutc
+        fromiso = datetime.fromisoformat
+        localize_central = _CENTRAL.localize
+        noon = datetime.min.time().replace(hour=12)
+        
         bulletin_events = []
+        append_event = bulletin_events.append
+        omitted_count = skipped_count = 0
         for event in all_events:
+            get = event.get
+            start_dict = get('start') or {}
             # Convert start/end to UTC and Central
-            start_utc = graph_datetime_to_utc(event.get('start'))
+            try:
+                start_utc = parse_graph_dt(start_dict)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Failed to parse Graph datetime: {start_dict} ({e})")
+                start_utc = None
             if start_utc is None:
-                logger.info("Skipping event with invalid start time")
+                skipped_count += 1
                 continue
 
-            is_all_day = event.get('isAllDay', False)
-            subject = event.get('subject', 'No Title')
+            is_all_day = get('isAllDay', False)
+            subject = get('subject', 'No Title')
             
             # For all-day events, create datetime at noon Central to avoid date shift
             if is_all_day:
                 # Get the date directly from the Graph API response
-                start_dict = event.get('start', {})
                 if 'date' in start_dict:
-                    event_date = datetime.fromisoformat(start_dict['date']).date()
+                    event_date = fromiso(start_dict['date']).date()
                 elif 'dateTime' in start_dict:
                     dt_str = start_dict['dateTime']
                     date_part = dt_str.split('T')[0]
-                    event_date = datetime.fromisoformat(date_part).date()
+                    event_date = fromiso(date_part).date()
                 else:
                     # Fallback to converted time
-                    event_date = utc_to_central(start_utc).date()
+                    event_date = central_fromutc(start_utc.replace(tzinfo=None)).date()
                 
                 # Create datetime at noon Central time for this date
-                central_tz = pytz.timezone('America/Chicago')
-                event_start_central = central_tz.localize(
-                    datetime.combine(event_date, datetime.min.time().replace(hour=12))
-                )
-                logger.debug(f"All-day event '{subject}': date={event_date}, central_time={event_start_central}")
+                event_start_central = localize_central(datetime.combine(event_date, noon))
+                logger.debug("All-day event '%s': date=%s, central_time=%s", subject, event_date, event_start_central)
             else:
-                event_start_central = utc_to_central(start_utc)
+                event_start_central = central_fromutc(start_utc.replace(tzinfo=None))
 
             # Prefer Graph location; fallback to body "Location:" snippet
             location_text = ''
-            location_field = event.get('location', {})
+            location_field = get('location', {})
             if isinstance(location_field, dict):
                 location_text = (location_field.get('displayName') or '').strip()
 
-            body_content = event.get('body', {}).get('content', '')
-            if not location_text and body_content and 'Location:' in body_content:
-                location_match = re.search(r'<strong>Location:</strong>\s*([^<]+)', body_content)
-                if location_match:
-                    location_text = location_match.group(1).strip()
+            body_content = get('body', {}).get('content', '')
+            if not location_text and body_content:
+                marker_at = body_content.find(_LOCATION_MARKER)
+                if marker_at != -1:
+                    value_start = marker_at + len(_LOCATION_MARKER)
+                    value_end = body_content.find('<', value_start)
+                    location_text = body_content[value_start:value_end if value_end != -1 else None].strip()
 
             # Check if this event should be omitted from bulletin
-            
-            # Debug logging for Mass events
-            if 'Mass' in subject:
-                logger.info(f"DEBUG Mass event: '{subject}' at {event_start_central} (weekday: {event_start_central.weekday()}, time: {event_start_central.strftime('%H:%M')})")
-            
             try:
                 # Ensure start_utc is timezone-aware before calling omission check
                 if start_utc.tzinfo is None:
-                    start_utc = pytz.UTC.localize(start_utc)
+                    start_utc = _UTC.localize(start_utc)
                 
-                omission_result = is_omitted_from_bulletin(subject, start_utc, location_text)
-                if omission_result:
-                    logger.info(f"✓ Omitting from bulletin: {subject} at {event_start_central}")
+                if is_omitted_from_bulletin(subject, start_utc, location_text):
+                    omitted_count += 1
                     continue
-                else:
-                    logger.info(f"✓ Including in bulletin: {subject} at {event_start_central}")
             except Exception as e:
                 logger.error(f"⚠️  Omission check failed for '{subject}': {e}")
                 logger.error(f"   start_utc={start_utc}, location={location_text}")
@@ -3531,81 +3571,72 @@ def bulletin_events():
                 subject_lower = subject.lower()
                 if any(keyword in subject_lower for keyword in ['mass', 'adoration', 'confession']):
                     logger.info(f"✓ Omitting liturgical event on error: {subject}")
+                    omitted_count += 1
                     continue
                 else:
                     logger.warning(f"⚠️  Including non-liturgical event despite error: {subject}")
 
-            logger.info(f"Including event in bulletin: {subject} at {event_start_central}")
-
             # Build event details
             event_data = {
                 'subject': subject,
                 'start': event_start_central,
                 'end': None,
                 'location': normalize_location(location_text),
-                'is_all_day': event.get('isAllDay', False)
+                'is_all_day': is_all_day
             }
 
             # End time (optional)
-            end_utc = graph_datetime_to_utc(event.get('end'))
+            end_dict = get('end') or {}
+            try:
+                end_utc = parse_graph_dt(end_dict)
+            except (ValueError, TypeError) as e:
+                logger.warning(f"Failed to parse Graph datetime: {end_dict} ({e})")
+                end_utc = None
             if end_utc is not None:
                 if is_all_day:
                     # For all-day events, extract date and create datetime at noon Central
                     # NOTE: Use event_end_date to avoid overwriting the week range's end_date
-                    end_dict = event.get('end', {})
                     if 'date' in end_dict:
-                        event_end_date = datetime.fromisoformat(end_dict['date']).date()
+                        event_end_date = fromiso(end_dict['date']).date()
                     elif 'dateTime' in end_dict:
                         dt_str = end_dict['dateTime']
                         date_part = dt_str.split('T')[0]
-                        event_end_date = datetime.fromisoformat(date_part).date()
+                        event_end_date = fromiso(date_part).date()
                     else:
-                        event_end_date = utc_to_central(end_utc).date()
+                        event_end_date = central_fromutc(end_utc.replace(tzinfo=None)).date()
                     
-                    central_tz = pytz.timezone('America/Chicago')
-                    event_data['end'] = central_tz.localize(
-                        datetime.combine(event_end_date, datetime.min.time().replace(hour=12))
-                    )
+                    event_data['end'] = localize_central(datetime.combine(event_end_date, noon))
                 else:
-                    event_data['end'] = utc_to_central(end_utc)
+                    event_data['end'] = central_fromutc(end_utc.replace(tzinfo=None))
 
-            bulletin_events.append(event_data)
+            append_event(event_data)
+        
+        logger.info(
+            "Processed %d events for bulletin: %d included, %d omitted, %d skipped (invalid start)",
+            len(all_events), len(bulletin_events), omitted_count, skipped_count
+        )
         
         # Sort events by start time
         bulletin_events.sort(key=lambda x: x['start'])
         
-        # Group events by day
-        events_by_day = {}
-        for event in bulletin_events:
-            # For all-day events, event_start_central is already set to noon on the correct date
-            # So we can safely use .date() without timezone shift issues
-            day_key = event['start'].date()
-            if day_key not in events_by_day:
-                events_by_day[day_key] = []
-            events_by_day[day_key].append(event)
+        # Group events by day; the list is sorted, so each day is one contiguous run.
+        # For all-day events, event_start_central is already set to noon on the correct date
+        # So we can safely use .date() without timezone shift issues
+        events_by_day = {
+            day_key: list(day_events)
+            for day_key, day_events in groupby(bulletin_events, key=lambda x: x['start'].date())
+        }
         
         # Format for display — ALWAYS include all 7 days in the week range (even if no events)
-        formatted_days = []
-        current_date = start_date
-        
-        logger.info(f"🔍 DEBUG: Starting day formatting loop - start_date={start_date}, end_date={end_date}")
         logger.info(f"🔍 DEBUG: events_by_day keys: {sorted(events_by_day.keys())}")
         
-        day_count = 0
-        while current_date <= end_date:
-            day_events = events_by_day.get(current_date, [])
-            # Always add the day, even if it has no events
-            day_info = {
-                'date': current_date,
-                'day_name': current_date.strftime('%A'),
-                'date_str': current_date.strftime('%B %d'),
-                'events': day_events
-            }
-            formatted_days.append(day_info)
-            logger.info(f"🔍 DEBUG: Added day {day_count + 1}: {day_info['day_name']} {day_info['date_str']} ({len(day_events)} events)")
-            
-            current_date += timedelta(days=1)
-            day_count += 1
+        # Always add the day, even if it has no events
+        formatted_days = [{
+            'date': current_date,
+            'day_name': _WEEKDAYS[current_date.weekday()],
+            'date_str': f"{_MONTHS[current_date.month]} {current_date.day:02d}",
+            'events': events_by_day.get(current_date, [])
+        } for current_date in (start_date + timedelta(days=i) for i in range((end_date - start_date).days + 1))]
         
         logger.info(f"🔍 DEBUG: Bulletin week range: {start_date} to {end_date} ({len(formatted_days)} days total)")
         days_list = [f"{d['day_name']} {d['date_str']} ({len(d['events'])} events)" for d in formatted_days]
@@ -3618,8 +3649,8 @@ def bulletin_events():
         
         # Render the bulletin template — always use full week boundaries for the date range
         return render_template('bulletin_events.html',
-                             start_date=start_date.strftime('%B %d'),
-                             end_date=end_date.strftime('%B %d, %Y'),
+                             start_date=f"{_MONTHS[start_date.month]} {start_date.day:02d}",
+                             end_date=f"{_MONTHS[end_date.month]} {end_date.day:02d}, {end_date.year}",
                              days=formatted_days,
                              week_label=week_label,
                              week_param=week_param,
@@ -3656,14 +3687,8 @@ def get_version():
 def debug_bulletin_calculation():
     """Debug endpoint to see exactly what dates are being calculated for bulletin"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        from datetime import timedelta
-        import pytz
         from utils import get_version_info
         
-        central_tz = pytz.timezone('America/Chicago')
         today = DateTimeUtils.get_central_time().date()
         week_param = request.args.get('week', 'upcoming')
         
@@ -3677,9 +3702,7 @@ def debug_bulletin_calculation():
         }
         
         if week_param == 'upcoming':
-            days_until_sunday = (6 - today.weekday()) % 7
-            if days_until_sunday == 0:
-                days_until_sunday = 7
+            days_until_sunday = 7 - (today.weekday() + 1) % 7  # next Sunday, a week out on Sundays
             start_date = today + timedelta(days=days_until_sunday)
             end_date = start_date + timedelta(days=6)
             
@@ -3723,12 +3746,6 @@ def debug_bulletin_calculation():
 def find_event_by_name(search_term):
     """Find events by name/subject"""
     try:
-        if not auth_manager or not auth_manager.is_authenticated():
-            return jsonify({"error": "Not authenticated"}), 401
-        
-        if not sync_engine:
-            return jsonify({"error": "Sync engine not initialized"}), 500
-        
         # Get source calendar ID
         source_id = sync_engine.reader.find_calendar_id(config.SOURCE_CALENDAR)
         if not source_id:
@@ -3749,18 +3766,16 @@ def find_event_by_name(search_term):
             })
         
         # Search for matching events (case-insensitive)
-        matching_events = []
-        for e in events:
-            if search_term.lower() in e.get('subject', '').lower():
-                matching_events.append({
-                    'id': e['id'],
-                    'subject': e['subject'],
-                    'start': e['start'].get('dateTime', e['start'].get('date', 'Unknown')),
-                    'categories': e.get('categories', []),
-                    'showAs': e.get('showAs', 'unknown'),
-                    'has_public': any(cat.lower() == 'public' for cat in e.get('categories', [])),
-                    'is_busy': e.get('showAs', '').lower() in ['busy', 'tentative', 'oof', 'workingelsewhere']
-                })
+        needle = search_term.lower()
+        matching_events = [{
+            'id': e['id'],
+            'subject': e['subject'],
+            'start': e['start'].get('dateTime', e['start'].get('date', 'Unknown')),
+            'categories': e.get('categories', []),
+            'showAs': e.get('showAs', 'unknown'),
+            'has_public': any(cat.lower() == 'public' for cat in e.get('categories', [])),
+            'is_busy': e.get('showAs', '').lower() in ['busy', 'tentative', 'oof', 'workingelsewhere']
+        } for e in events if needle in e.get('subject', '').lower()]
         
         return jsonify({
             'search_term': search_term,
@@ -3770,7 +3785,6 @@ def find_event_by_name(search_term):
         
     except Exception as e:
         logger.error(f"Error finding event: {str(e)}")
-        import traceback
         return jsonify({"error": str(e), "traceback": traceback.format_exc()}), 500
 
 @app.route('/event-search')
@@ -3789,16 +3803,13 @@ def event_search():
             return jsonify({"error": "No auth headers"}), 401
         
         # Get the public calendar ID using service token (reader.find_calendar_id uses session token)
-        calendars_url = f"https://graph.microsoft.com/v1.0/users/{config.SHARED_MAILBOX}/calendars"
-        cal_response = requests.get(calendars_url, headers=headers, timeout=30)
-        if cal_response.status_code != 200:
-            return jsonify({"error": "Could not list calendars", "detail": cal_response.text[:200]}), 502
-        calendars = cal_response.json().get('value', [])
-        public_calendar_id = None
-        for cal in calendars:
-            if cal.get('name') == config.TARGET_CALENDAR:
-                public_calendar_id = cal.get('id')
-                break
+        try:
+            public_calendar_id = _public_calendar_ids.get_or_load(
+                config.TARGET_CALENDAR,
+                lambda: _list_calendar_id(config.TARGET_CALENDAR, headers)
+            )
+        except requests.HTTPError as e:
+            return jsonify({"error": "Could not list calendars", "detail": e.response.text[:200]}), 502
         if not public_calendar_id:
             return jsonify({"error": "Public calendar not found"}), 404
         
@@ -3807,10 +3818,7 @@ def event_search():
         date_range = request.args.get('range', '30')  # Default 30 days
         
         # Calculate date range
-        from datetime import timedelta
-        import pytz
         
-        central_tz = pytz.timezone('America/Chicago')
         today = DateTimeUtils.get_central_time().date()
         start_date = today
         
@@ -3842,25 +3850,49 @@ def event_search():
             title = f"All Events - {range_text}"
         
         # Create datetime objects
-        start_datetime = central_tz.localize(datetime.combine(start_date, datetime.min.time()))
-        end_datetime = central_tz.localize(datetime.combine(end_date + timedelta(days=1), datetime.min.time()))
+        start_datetime = _CENTRAL.localize(datetime.combine(start_date, datetime.min.time()))
+        end_datetime = _CENTRAL.localize(datetime.combine(end_date + timedelta(days=1), datetime.min.time()))
         
         # Get events from API (same service headers)
         url = f"https://graph.microsoft.com/v1.0/users/{config.SHARED_MAILBOX}/calendars/{public_calendar_id}/calendarView"
         
         params = {
-            'startDateTime': start_datetime.astimezone(pytz.UTC).strftime('%Y-%m-%dT%H:%M:%SZ'),
-            'endDateTime': end_datetime.astimezone(pytz.UTC).strftime('%Y-%m-%dT%H:%M:%SZ'),
-            '$select': 'id,subject,start,end,categories,location,isAllDay,showAs,type,body',
+            'startDateTime': start_datetime.astimezone(_UTC).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            'endDateTime': end_datetime.astimezone(_UTC).strftime('%Y-%m-%dT%H:%M:%SZ'),
+            '$select': 'id,subject,start,isAllDay',  # Only what the page displays
             '$orderby': 'start/dateTime',
-            '$top': 500
+            '$top': 999
         }
-        
-        response = requests.get(url, headers=headers, params=params, timeout=30)
-        
-        events = []
-        if response.status_code == 200:
-            events = response.json().get('value', [])
+        if search_term:
+            # Let Graph narrow by subject; the loop below still checks each match
+            odata_term = search_term.replace("'", "''")
+            params['$filter'] = f"contains(subject, '{odata_term}')"
+        
+        # Repeat searches within a minute reuse the same fetch
+        cache_key = ('search', public_calendar_id, params['startDateTime'], params['endDateTime'], search_term)
+        events = _calendar_view_cache.get(cache_key)
+        if events is None:
+            response = GRAPH_CLIENT.get(url, headers=headers, params=params, timeout=30)
+            if response.status_code == 400 and '$filter' in params:
+                logger.warning(f"Graph rejected subject filter, filtering locally: {response.text[:200]}")
+                del params['$filter']
+                response = GRAPH_CLIENT.get(url, headers=headers, params=params, timeout=30)
+            
+            events = []
+            if response.status_code == 200:
+                data = parse_json_response(response)
+                events = data.get('value', [])
+                # A long range can run past one page; follow nextLink rather
+                # than silently showing only the first page
+                next_link = data.get('@odata.nextLink')
+                while next_link:
+                    next_response = GRAPH_CLIENT.get(next_link, headers=headers, timeout=30)
+                    if next_response.status_code != 200:
+                        break
+                    data = parse_json_response(next_response)
+                    events.extend(data.get('value', []))
+                    next_link = data.get('@odata.nextLink')
+                _calendar_view_cache.set(cache_key, events)
         
         # Process events for display
         event_list = []
@@ -3886,8 +3918,8 @@ def event_search():
         # Sort by datetime
         event_list.sort(key=lambda x: x['datetime_obj'])
         
-        # Generate simple HTML response
-        html = f'''
+        # Generate simple HTML response; pieces are joined once at the end
+        parts = [f'''
         <!DOCTYPE html>
         <html>
         <head>
@@ -3980,36 +4012,36 @@ def event_search():
                     Date range: {start_date.strftime('%B %d, %Y')} to {end_date.strftime('%B %d, %Y')}
                 </div>
                 <div id="event-list">
-        '''
+        ''']
         
         if event_list:
             for event in event_list:
-                html += f'''
+                parts.append(f'''
                     <div class="event">
                         <div class="date">{event['date']}</div>
                         <div><span class="time">{event['time']}</span> - <span class="subject">{event['subject']}</span></div>
                     </div>
-                '''
+                ''')
         else:
             if search_term:
-                html += f'<p>No events found containing "{search_term}" in this date range.</p>'
+                parts.append(f'<p>No events found containing "{search_term}" in this date range.</p>')
             else:
-                html += '<p>No events found in this date range.</p>'
+                parts.append('<p>No events found in this date range.</p>')
         
-        html += f'''
+        parts.append(f'''
                 </div>
                 <a href="/" class="back-link">← Back to Dashboard</a>
             </div>
             
-            <textarea id="plaintext" style="position: absolute; left: -9999px;">'''
+            <textarea id="plaintext" style="position: absolute; left: -9999px;">''')
         
         # Add plain text version for copying
         if search_term:
-            html += f"Events containing '{search_term}':\n\n"
+            parts.append(f"Events containing '{search_term}':\n\n")
         for event in event_list:
-            html += f"{event['date']}\n{event['time']} - {event['subject']}\n\n"
+            parts.append(f"{event['date']}\n{event['time']} - {event['subject']}\n\n")
         
-        html += '''</textarea>
+        parts.append('''</textarea>
             
             <script>
                 function copyList() {
@@ -4028,9 +4060,9 @@ def event_search():
             </script>
         </body>
         </html>
-        '''
+        ''')
         
-        return html
+        return ''.join(parts)
         
     except Exception as e:
         logger.error(f"Event search error: {e}")
@@ -4042,7 +4074,6 @@ def investigate_deletions():
     try:
         from calendar_ops import CalendarReader
         from signature_utils import generate_event_signature
-        from datetime import datetime, timedelta
         from collections import defaultdict
         from auth import MicrosoftAuth
         
@@ -4147,19 +4178,37 @@ def investigate_deletions():
 class GracefulShutdownHandler:
     def __init__(self):
         self.shutdown_requested = False
+        self.drained = False
         signal.signal(signal.SIGTERM, self.handle_sigterm)
         signal.signal(signal.SIGINT, self.handle_sigterm)
     
     def handle_sigterm(self, signum, frame):
+        # Second delivery comes from _drain once waiting is over
+        if self.drained:
+            sys.exit(0)
+        if self.shutdown_requested:
+            return
+        
         logger.warning(f"Received signal {signum}, initiating graceful shutdown...")
         self.shutdown_requested = True
         
-        # Wait for current operations to complete (max 30 seconds)
-        if hasattr(self, 'current_sync_thread') and self.current_sync_thread.is_alive():
-            self.current_sync_thread.join(timeout=30)
+        # Signal handlers run on the main thread, so the wait happens elsewhere
+        # and in-flight requests keep being served meanwhile
+        threading.Thread(target=self._drain, args=(signum,), name='shutdown-drain').start()
+    
+    def _drain(self, signum):
+        # Stop the scheduler first so it cannot start a new sync while draining
+        if scheduler:
+            scheduler.stop()
+        
+        # Wait for a manual sync to complete (max 30 seconds)
+        if _manual_sync_future is not None:
+            wait_futures([_manual_sync_future], timeout=30)
         
         logger.info("Graceful shutdown completed")
-        sys.exit(0)
+        self.drained = True
+        # Re-deliver the signal to the main thread, which now exits
+        _thread.interrupt_main(signum)
 
 # Initialize graceful shutdown handler
 shutdown_handler = GracefulShutdownHandler()
@@ -10,6 +10,7 @@ import hashlib
 import json
 import logging
 import os
+import threading
 import time
 import urllib.parse
 from datetime import datetime, timedelta
@@ -22,6 +23,10 @@ from utils import DateTimeUtils, RetryUtils, structured_logger
 
 logger = logging.getLogger(__name__)
 
+# Keep-alive session for the token endpoint, so refreshes reuse one TLS
+# connection to login.microsoftonline.com
+TOKEN_SESSION = requests.Session()
+
 class MicrosoftAuth:
     """Microsoft OAuth authentication handler"""
     
@@ -29,6 +34,16 @@ class MicrosoftAuth:
         # Set up persistent token storage on Render disk
         self.token_file = '/data/token_cache.json'
 
+        # Serializes check-then-refresh so the scheduler's background refresh
+        # and a request thread never rotate the refresh token at the same time
+        self._token_lock = threading.Lock()
+        # (TOKEN_EXPIRES_AT string, epoch seconds) so the expiry is parsed
+        # once per refresh rather than on every header request
+        self._parsed_expiry = (None, 0.0)
+        # (mtime_ns, size) of the token file as last loaded or saved; an
+        # unchanged file is not re-read on every token check
+        self._token_file_stamp = None
+
         # Load persistent tokens (disk first, env-var fallback for bootstrap)
         self._ensure_tokens_loaded()
         logger.info("Auth manager initialized (hybrid mode)")
@@ -44,10 +59,25 @@ class MicrosoftAuth:
             self.env_access_token = os.environ.get('ACCESS_TOKEN')
             self.env_refresh_token = os.environ.get('REFRESH_TOKEN')
     
+    def _stat_token_file(self):
+        """(mtime_ns, size) of the token file, or None if it does not exist"""
+        try:
+            stat = os.stat(self.token_file)
+        except FileNotFoundError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
     def _load_tokens_from_disk(self):
-        """Load tokens from persistent disk storage"""
+        """Load tokens from persistent disk storage.
+
+        Re-reads only when the file changed since it was last loaded or saved,
+        so each token check costs a stat() instead of a JSON parse.
+        """
         try:
-            if os.path.exists(self.token_file):
+            stamp = self._stat_token_file()
+            if stamp is not None:
+                if stamp == self._token_file_stamp:
+                    return
                 with open(self.token_file, 'r') as f:
                     cached = json.load(f)
                 self.env_access_token = cached.get('access_token')
@@ -58,13 +88,16 @@ class MicrosoftAuth:
                 if expires_at:
                     os.environ['TOKEN_EXPIRES_AT'] = expires_at
                 
+                self._token_file_stamp = stamp
                 logger.info("✅ Loaded tokens from persistent storage")
             else:
+                self._token_file_stamp = None
                 self.env_access_token = None
                 self.env_refresh_token = None
                 logger.info("No persistent token cache found")
         except Exception as e:
             logger.warning(f"Failed to load tokens from disk: {e}")
+            self._token_file_stamp = None
             self.env_access_token = None
             self.env_refresh_token = None
     
@@ -78,6 +111,8 @@ class MicrosoftAuth:
             }
             with open(self.token_file, 'w') as f:
                 json.dump(token_data, f)
+            # Memory already holds what was just written
+            self._token_file_stamp = self._stat_token_file()
             logger.info("✅ Tokens saved to persistent storage")
         except Exception as e:
             logger.error(f"Failed to save tokens to disk: {e}")
@@ -122,32 +157,71 @@ class MicrosoftAuth:
         sync identity. Reloading from disk first keeps multiple gunicorn workers
         in sync after any one of them refreshes.
         """
-        self._ensure_tokens_loaded()
-        access_token = self.env_access_token
-        refresh_token = self.env_refresh_token
-        token_expires_at = os.environ.get('TOKEN_EXPIRES_AT')
+        now = time.time()
+        with self._token_lock:
+            self._ensure_tokens_loaded()
+            access_token = self.env_access_token
+            refresh_token = self.env_refresh_token
+            token_expires_at = os.environ.get('TOKEN_EXPIRES_AT')
 
-        if not refresh_token:
-            logger.warning("No refresh token available")
-            return False
-        
-        # Refresh if no access token OR within 10 minutes of expiry (was 5)
-        if not access_token or self._is_token_expired(token_expires_at, buffer_minutes=10):
-            logger.info("Token expired or missing, refreshing...")
+            if not refresh_token:
+                logger.warning("No refresh token available")
+                return False
+
+            # Refresh if no access token OR within 10 minutes of expiry (was 5)
+            if not access_token or self._is_token_expired(token_expires_at, buffer_minutes=10, now=now):
+                logger.info("Token expired or missing, refreshing...")
+                return self.refresh_access_token()
+
+            return True
+
+    def refresh_if_near_expiry(self) -> bool:
+        """Refresh ahead of ensure_valid_token's window; called from the scheduler.
+
+        The wider TOKEN_BACKGROUND_REFRESH_MIN buffer means a scheduled check
+        normally renews the token before a sync or page load would have to.
+        """
+        now = time.time()
+        with self._token_lock:
+            self._ensure_tokens_loaded()
+            if not self.env_refresh_token:
+                return False
+            token_expires_at = os.environ.get('TOKEN_EXPIRES_AT')
+            if self.env_access_token and not self._is_token_expired(
+                token_expires_at, buffer_minutes=config.TOKEN_BACKGROUND_REFRESH_MIN, now=now
+            ):
+                return True
+            logger.info("Token nearing expiry, refreshing in the background...")
             return self.refresh_access_token()
-        
-        return True
 
-    def _is_token_expired(self, expires_at_str, buffer_minutes=10):
-        """Check if token is expired with larger buffer"""
+    def _is_token_expired(self, expires_at_str, buffer_minutes=10, now=None):
+        """Check if token is expired with larger buffer.
+
+        now is epoch seconds (time.time()); callers holding _token_lock read
+        it before acquiring so no clock or timezone work happens under it.
+        """
         if not expires_at_str:
             return True
+        if now is None:
+            now = time.time()
         try:
-            expires_at = datetime.fromisoformat(expires_at_str)
-            now = DateTimeUtils.get_central_time()
-            return now >= (expires_at - timedelta(minutes=buffer_minutes))
-        except:
+            return now >= self._token_expiry_epoch(expires_at_str) - buffer_minutes * 60
+        except ValueError:
             return True
+
+    def _token_expiry_epoch(self, expires_at_str: str) -> float:
+        """Epoch seconds for a TOKEN_EXPIRES_AT value, parsed once per distinct string"""
+        cached_str, cached_epoch = self._parsed_expiry
+        if cached_str == expires_at_str:
+            return cached_epoch
+        expires_at = datetime.fromisoformat(expires_at_str)
+        if expires_at.tzinfo is None:
+            # Expiries are always written with an offset; a naive one is
+            # ambiguous, so treat it as expired like the old aware/naive compare did
+            raise ValueError(f"TOKEN_EXPIRES_AT has no UTC offset: {expires_at_str}")
+        epoch = expires_at.timestamp()
+        self._parsed_expiry = (expires_at_str, epoch)
+        return epoch
     
     def get_headers(self):
         """Get authorization headers for API calls"""
@@ -183,7 +257,7 @@ class MicrosoftAuth:
             'scope': ' '.join(config.GRAPH_SCOPES)
         }
         try:
-            response = requests.post(token_url, data=data, timeout=30)
+            response = TOKEN_SESSION.post(token_url, data=data, timeout=30)
             if response.status_code != 200:
                 logger.error(f"Persistent token refresh failed: {response.status_code} - {response.text}")
                 return False
@@ -191,7 +265,7 @@ class MicrosoftAuth:
             new_access = tokens.get('access_token')
             new_refresh = tokens.get('refresh_token', refresh_token)
             expires_in = tokens.get('expires_in', 3600)
-            expires_at = DateTimeUtils.get_central_time() + timedelta(seconds=expires_in - 300)
+            expires_at = DateTimeUtils.get_central_time() + timedelta(seconds=expires_in - config.TOKEN_REFRESH_LEAD_SECONDS)
             self.env_access_token = new_access
             self.env_refresh_token = new_refresh
             os.environ['TOKEN_EXPIRES_AT'] = expires_at.isoformat()
@@ -204,18 +278,25 @@ class MicrosoftAuth:
     
     def get_service_headers(self):
         """Get headers from the persistent (sync) token so calendar access works for any signed-in user.
-        Use for endpoints like event-search that should use the app's calendar identity."""
-        self._ensure_tokens_loaded()
-        if not self.env_refresh_token:
-            logger.warning("No persistent token available for get_service_headers")
-            return None
-        expires_at_str = os.environ.get('TOKEN_EXPIRES_AT')
-        if not self.env_access_token or self._is_token_expired(expires_at_str, buffer_minutes=10):
-            if not self._refresh_persistent_token():
+        Use for endpoints like event-search that should use the app's calendar identity.
+
+        Check-and-refresh runs under _token_lock like ensure_valid_token, so a
+        health probe cannot rotate the refresh token under a scheduled refresh;
+        only the resulting token is read out, and headers are built unlocked."""
+        now = time.time()
+        with self._token_lock:
+            self._ensure_tokens_loaded()
+            if not self.env_refresh_token:
+                logger.warning("No persistent token available for get_service_headers")
                 return None
-        if self.env_access_token:
+            expires_at_str = os.environ.get('TOKEN_EXPIRES_AT')
+            if not self.env_access_token or self._is_token_expired(expires_at_str, buffer_minutes=10, now=now):
+                if not self._refresh_persistent_token():
+                    return None
+            access_token = self.env_access_token
+        if access_token:
             return {
-                'Authorization': f'Bearer {self.env_access_token}',
+                'Authorization': f'Bearer {access_token}',
                 'Content-Type': 'application/json'
             }
         return None
@@ -241,14 +322,14 @@ class MicrosoftAuth:
         }
         
         try:
-            response = requests.post(token_url, data=data, timeout=30)
+            response = TOKEN_SESSION.post(token_url, data=data, timeout=30)
             if response.status_code == 200:
                 tokens = response.json()
                 
                 new_access = tokens.get('access_token')
                 new_refresh = tokens.get('refresh_token', refresh_token)
                 expires_in = tokens.get('expires_in', 3600)
-                expires_at = DateTimeUtils.get_central_time() + timedelta(seconds=expires_in - 300)
+                expires_at = DateTimeUtils.get_central_time() + timedelta(seconds=expires_in - config.TOKEN_REFRESH_LEAD_SECONDS)
                 
                 # Single sync identity: always persist to env + disk.
                 self.env_access_token = new_access
@@ -294,7 +375,7 @@ class MicrosoftAuth:
         }
         
         try:
-            response = requests.post(token_url, data=data, timeout=30)
+            response = TOKEN_SESSION.post(token_url, data=data, timeout=30)
             if response.status_code == 200:
                 tokens = response.json()
                 
@@ -305,7 +386,7 @@ class MicrosoftAuth:
                 # in env + disk (below), the app's single sync identity.
                 session['authenticated'] = True
                 expires_in = tokens.get('expires_in', 3600)
-                expires_at = DateTimeUtils.get_central_time() + timedelta(seconds=expires_in - 300)
+                expires_at = DateTimeUtils.get_central_time() + timedelta(seconds=expires_in - config.TOKEN_REFRESH_LEAD_SECONDS)
 
                 # Also update environment variables + persistent storage
                 self.env_access_token = tokens.get('access_token')
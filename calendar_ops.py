@@ -6,17 +6,156 @@
 Consolidated Calendar Operations - Handles all read/write operations to Microsoft Graph
 """
 import logging
+import threading
+import time
+import traceback
 import requests
-from typing import List, Dict, Optional
+from urllib3.util.retry import Retry
+from typing import List, Dict, Optional, Iterator, Tuple
 from datetime import datetime, timedelta, timezone
 import pytz
 import uuid
+from urllib.parse import urlencode
 
 import config
 from utils import RetryUtils, DateTimeUtils
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; fall back to the stdlib decoder
+    orjson = None
+
+try:
+    import httpx
+except ImportError:  # Optional; Graph reads fall back to GRAPH_SESSION
+    httpx = None
+
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session for every Graph call, so sync writes, pagination
+# and admin debug clicks reuse pooled TLS connections instead of reconnecting.
+# Sharing one Session across threads is safe here: callers only issue requests
+# and never change its headers, cookies or mounts after import.
+#
+# The adapter retries only on throttling/5xx status codes, honoring
+# Retry-After; connection errors stay with RetryUtils.retry_with_backoff so the
+# two layers don't multiply. raise_on_status=False hands the final response
+# back so existing status handling still runs. Only idempotent methods are
+# retried (urllib3's default), so POSTs are never resent here.
+GRAPH_SESSION = requests.Session()
+GRAPH_SESSION.mount('https://', requests.adapters.HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=20,
+    max_retries=Retry(
+        total=3,
+        connect=0,
+        read=0,
+        status=3,
+        backoff_factor=0.5,
+        status_forcelist=[429, 500, 502, 503, 504],
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+))
+
+
+def _make_graph_client():
+    """HTTP/2 client for the read-heavy Graph routes, or GRAPH_SESSION without httpx/h2"""
+    if httpx is None:
+        return GRAPH_SESSION
+    try:
+        return httpx.Client(
+            http2=True,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=16)
+        )
+    except ImportError:  # http2=True needs the h2 package
+        return GRAPH_SESSION
+
+
+# Both clients answer .get(url, headers=, params=, timeout=) with a response
+# carrying .status_code, .text and .content, which is all the callers use
+GRAPH_CLIENT = _make_graph_client()
+
+
+# Outlook lets one mailbox run 4 requests at once and throttles the rest with
+# 429, including $batch sub-requests, so every $batch holds a slot and honors Retry-After
+MAILBOX_CONCURRENCY = 4
+_MAILBOX_SLOTS = threading.BoundedSemaphore(MAILBOX_CONCURRENCY)
+MAX_THROTTLE_RETRIES = 5
+
+# Guard against a nextLink loop. At $top=100 this allows 5,000 events per
+# read; a calendar with more is reported as a failed read, never truncated.
+MAX_CALENDAR_VIEW_PAGES = 50
+
+
+class CalendarReadError(Exception):
+    """A calendarView read could not be completed, so its events are partial"""
+    pass
+
+
+def retry_after_seconds(headers, attempt: int) -> float:
+    """Seconds to wait before a throttled retry: Retry-After, else 0.5s doubling to 30s"""
+    value = (headers or {}).get('Retry-After') or (headers or {}).get('retry-after')
+    try:
+        return max(float(value), 0.0)
+    except (TypeError, ValueError):
+        return min(0.5 * (2 ** attempt), 30.0)
+
+
+def parse_json_response(response) -> Dict:
+    """Decode a Graph response body, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def post_graph_batch(headers: Dict, batch_requests: List[Dict]) -> Tuple[int, List[Dict]]:
+    """
+    POST one $batch and resubmit any sub-requests Graph throttled.
+
+    Returns (status, sub-responses). A 429 on the batch itself or on a
+    sub-request waits out Retry-After before retrying; sub-requests still
+    throttled after MAX_THROTTLE_RETRIES come back with status 429.
+    """
+    batch_url = "https://graph.microsoft.com/v1.0/$batch"
+    pending = batch_requests
+    responses = {}
+
+    for attempt in range(MAX_THROTTLE_RETRIES + 1):
+        with _MAILBOX_SLOTS:
+            response = GRAPH_SESSION.post(batch_url, headers=headers, json={'requests': pending}, timeout=60)
+
+        if response.status_code == 429 and attempt < MAX_THROTTLE_RETRIES:
+            delay = retry_after_seconds(response.headers, attempt)
+            logger.warning(f"Batch throttled (429), retrying in {delay:.1f}s")
+            time.sleep(delay)
+            continue
+
+        if response.status_code != 200:
+            # Sub-requests answered on an earlier attempt still count
+            if responses:
+                break
+            return response.status_code, []
+
+        throttled = []
+        for result in parse_json_response(response).get('responses', []):
+            responses[result.get('id')] = result
+            if result.get('status') == 429:
+                throttled.append(result)
+
+        if not throttled or attempt == MAX_THROTTLE_RETRIES:
+            break
+
+        delay = max(retry_after_seconds(r.get('headers'), attempt) for r in throttled)
+        throttled_ids = {r.get('id') for r in throttled}
+        pending = [r for r in pending if r['id'] in throttled_ids]
+        logger.warning(f"{len(pending)} batch sub-requests throttled (429), retrying in {delay:.1f}s")
+        time.sleep(delay)
+
+    return 200, list(responses.values())
+
+
 def get_utc_now_iso():
     return datetime.now(timezone.utc).isoformat()
 
@@ -137,19 +276,19 @@ class CalendarReader:
         url = f"https://graph.microsoft.com/v1.0/users/{config.SHARED_MAILBOX}/calendars"
         
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            response = GRAPH_SESSION.get(url, headers=headers, timeout=30)
             
             if response.status_code == 401:
                 # Try refreshing token
                 if self.auth.refresh_access_token():
                     headers = self.auth.get_headers()
-                    response = requests.get(url, headers=headers, timeout=30)
+                    response = GRAPH_SESSION.get(url, headers=headers, timeout=30)
                 else:
                     logger.error("Authentication failed")
                     return None
             
             if response.status_code == 200:
-                calendars = response.json().get('value', [])
+                calendars = parse_json_response(response).get('value', [])
                 logger.info(f"Successfully retrieved {len(calendars)} calendars")
                 return calendars
             else:
@@ -167,8 +306,13 @@ class CalendarReader:
             logger.error(f"Error getting calendars: {e}")
             raise
     
-    def find_calendar_id(self, calendar_name: str) -> Optional[str]:
-        """Find a calendar ID by name with caching"""
+    def find_calendar_id(self, calendar_name: str, calendars: List[Dict] = None) -> Optional[str]:
+        """
+        Find a calendar ID by name with caching.
+
+        Passing calendars (an already-fetched get_calendars() list) resolves a
+        cache miss from it instead of fetching the list again.
+        """
         # Check cache first
         if calendar_name in self._calendar_cache:
             expiry = self._cache_expiry.get(calendar_name)
@@ -177,14 +321,19 @@ class CalendarReader:
                 return self._calendar_cache[calendar_name]
         
         # If not in cache or expired, fetch
-        calendars = self.get_calendars()
+        if calendars is None:
+            calendars = self.get_calendars()
         if not calendars:
             return None
         
         def remember(calendar_id):
-            # Cache the result for 1 hour
+            previous = self._calendar_cache.get(calendar_name)
+            if previous and previous != calendar_id:
+                logger.warning(f"Calendar '{calendar_name}' changed ID ({previous} -> {calendar_id}); was it recreated?")
             self._calendar_cache[calendar_name] = calendar_id
-            self._cache_expiry[calendar_name] = DateTimeUtils.get_central_time() + timedelta(hours=1)
+            self._cache_expiry[calendar_name] = (
+                DateTimeUtils.get_central_time() + timedelta(hours=config.CALENDAR_ID_CACHE_HOURS)
+            )
             return calendar_id
 
         for calendar in calendars:
@@ -213,98 +362,10 @@ class CalendarReader:
     def get_calendar_events(self, calendar_id: str, select_fields: List[str] = None, start: datetime = None, end: datetime = None) -> Optional[List[Dict]]:
         """Get all calendar events with proper pagination"""
         try:
-            headers = self.auth.get_headers()
-            if not headers:
+            if not self.auth.get_headers():
                 return None
             
-            # Use provided date range or calculate default range
-            if start and end:
-                # Use provided date range
-                start_date = start
-                end_date = end
-            else:
-                # Calculate date range - MUST stay within 730 day limit
-                central_tz = pytz.timezone('America/Chicago')
-                now_central = DateTimeUtils.get_central_time()
-                
-                # Microsoft Graph limit is 1825 days total, but we'll use 730 days (2 years)
-                # Let's do 1 year back, 1 year forward = 365 + 365 = 730 days
-                start_date = now_central - timedelta(days=365)  # 1 year back
-                end_date = now_central + timedelta(days=365)    # 1 year forward
-            
-            # Convert to UTC for API call
-            start_utc = start_date.astimezone(pytz.UTC)
-            end_utc = end_date.astimezone(pytz.UTC)
-            
-            start_time = start_utc.isoformat()
-            end_time = end_utc.isoformat()
-            
-            # Calculate actual day span for logging
-            day_span = (end_utc - start_utc).days
-            logger.info(f"📅 Date range: {day_span} days from {start_time[:10]} to {end_time[:10]}")
-            
-            if day_span > 730:
-                logger.error(f"⚠️ Date range {day_span} days exceeds our limit of 730 days!")
-                # Adjust to stay within limit
-                end_date = start_date + timedelta(days=730)
-                end_utc = end_date.astimezone(pytz.UTC)
-                end_time = end_utc.isoformat()
-                logger.info(f"📅 Adjusted end date to stay within limit: {end_time[:10]}")
-            
-            # Use calendarView to expand recurring events
-            endpoint = f"https://graph.microsoft.com/v1.0/users/{config.SHARED_MAILBOX}/calendars/{calendar_id}/calendarView"
-            
-            params = {
-                "startDateTime": start_time,
-                "endDateTime": end_time,
-                "$select": "id,subject,body,start,end,categories,showAs,type,seriesMasterId,isCancelled,recurrence,sensitivity,isAllDay,responseStatus,organizer",
-                "$expand": "singleValueExtendedProperties($filter=(id eq 'String {66f5a359-4659-4830-9070-00047ec6ac6e} Name sourceEventId') or (id eq 'String {66f5a359-4659-4830-9070-00047ec6ac6e} Name lastSynced'))",
-                "$top": 100  # Fetch in chunks of 100
-            }
-            
-            all_events = []
-            request_count = 0
-            
-            logger.info(f"[Sync] Querying from {start_time} to {end_time}")
-            logger.info(f"📅 Fetching calendar events (within 730-day limit)")
-            
-            while endpoint:
-                request_count += 1
-                logger.info(f"  Fetching page {request_count}...")
-                
-                # Make request
-                if request_count == 1:
-                    response = requests.get(endpoint, headers=headers, params=params, timeout=30)
-                else:
-                    # For subsequent pages, use the @odata.nextLink URL directly
-                    response = requests.get(endpoint, headers=headers, timeout=30)
-                
-                if response.status_code == 401:
-                    # Try refreshing token
-                    if self.auth.refresh_access_token():
-                        headers = self.auth.get_headers()
-                        response = requests.get(endpoint, headers=headers, params=params if request_count == 1 else None, timeout=30)
-                    else:
-                        logger.error("Authentication failed during event retrieval")
-                        return None
-                
-                if not response.ok:
-                    logger.error(f"Failed to fetch events: {response.status_code} - {response.text}")
-                    break
-                    
-                data = response.json()
-                events = data.get('value', [])
-                all_events.extend(events)
-                
-                logger.info(f"  Retrieved {len(events)} events (total so far: {len(all_events)})")
-                
-                # Check for next page
-                endpoint = data.get('@odata.nextLink')
-                
-                # Safety limit to prevent infinite loops
-                if request_count > 50:
-                    logger.warning("Hit pagination safety limit of 50 pages")
-                    break
+            all_events = list(self.iter_calendar_events(calendar_id, select_fields=select_fields, start=start, end=end))
             
             logger.info(f"✅ Total events fetched: {len(all_events)}")
             
@@ -323,12 +384,256 @@ class CalendarReader:
             
             return all_events
             
+        except CalendarReadError as e:
+            # A partial list must not pass for the whole calendar
+            logger.error(f"Calendar read incomplete: {e}")
+            return None
         except Exception as e:
             logger.error(f"Error fetching calendar events: {e}")
-            import traceback
             logger.error(traceback.format_exc())
             return []
     
+    def _calendar_view_window(self, start: datetime = None, end: datetime = None):
+        """Resolve a calendarView window to UTC ISO strings within the 730-day limit"""
+        # Use provided date range or calculate default range
+        if start and end:
+            # Use provided date range
+            start_date = start
+            end_date = end
+        else:
+            # Calculate date range - MUST stay within 730 day limit
+            now_central = DateTimeUtils.get_central_time()
+            
+            # Microsoft Graph limit is 1825 days total, but we'll use 730 days (2 years)
+            # Let's do 1 year back, 1 year forward = 365 + 365 = 730 days
+            start_date = now_central - timedelta(days=365)  # 1 year back
+            end_date = now_central + timedelta(days=365)    # 1 year forward
+        
+        # Convert to UTC for API call
+        start_utc = start_date.astimezone(pytz.UTC)
+        end_utc = end_date.astimezone(pytz.UTC)
+        
+        start_time = start_utc.isoformat()
+        end_time = end_utc.isoformat()
+        
+        # Calculate actual day span for logging
+        day_span = (end_utc - start_utc).days
+        logger.info(f"📅 Date range: {day_span} days from {start_time[:10]} to {end_time[:10]}")
+        
+        if day_span > 730:
+            logger.error(f"⚠️ Date range {day_span} days exceeds our limit of 730 days!")
+            # Adjust to stay within limit
+            end_date = start_date + timedelta(days=730)
+            end_utc = end_date.astimezone(pytz.UTC)
+            end_time = end_utc.isoformat()
+            logger.info(f"📅 Adjusted end date to stay within limit: {end_time[:10]}")
+        
+        return start_time, end_time
+    
+    def _calendar_view_params(self, start_time: str, end_time: str, select_fields: List[str] = None) -> Dict:
+        """
+        Query parameters for a calendarView request.
+
+        Without select_fields this is the full sync payload (body, extended
+        properties). Read-only callers can pass the fields they actually use
+        to shrink every page; the extended-property expansion is then skipped.
+        """
+        if select_fields:
+            return {
+                "startDateTime": start_time,
+                "endDateTime": end_time,
+                "$select": ",".join(select_fields),
+                "$top": 100
+            }
+        return {
+            "startDateTime": start_time,
+            "endDateTime": end_time,
+            "$select": "id,subject,body,start,end,categories,showAs,type,seriesMasterId,isCancelled,recurrence,sensitivity,isAllDay,responseStatus,organizer",
+            "$expand": "singleValueExtendedProperties($filter=(id eq 'String {66f5a359-4659-4830-9070-00047ec6ac6e} Name sourceEventId') or (id eq 'String {66f5a359-4659-4830-9070-00047ec6ac6e} Name lastSynced'))",
+            "$top": 100  # Fetch in chunks of 100
+        }
+    
+    def iter_calendar_events(self, calendar_id: str, start: datetime = None, end: datetime = None, select_fields: List[str] = None) -> Iterator[Dict]:
+        """
+        Yield calendar events page by page instead of collecting them.
+
+        Only one Graph page is held in memory at a time, so callers that just
+        count or filter (e.g. the sync-breakdown diagnostic) stay flat in memory
+        however large the calendar is. Raises CalendarReadError if
+        authentication fails or a page request errors, so a caller never
+        mistakes the events seen so far for the whole calendar.
+        """
+        headers = self.auth.get_headers()
+        if not headers:
+            raise CalendarReadError("No authentication headers")
+        
+        start_time, end_time = self._calendar_view_window(start, end)
+        
+        # Use calendarView to expand recurring events
+        endpoint = f"https://graph.microsoft.com/v1.0/users/{config.SHARED_MAILBOX}/calendars/{calendar_id}/calendarView"
+        params = self._calendar_view_params(start_time, end_time, select_fields)
+        
+        request_count = 0
+        yielded = 0
+        
+        logger.info(f"[Sync] Querying from {start_time} to {end_time}")
+        logger.info(f"📅 Fetching calendar events (within 730-day limit)")
+        
+        while endpoint:
+            request_count += 1
+            logger.info(f"  Fetching page {request_count}...")
+            
+            # Make request
+            if request_count == 1:
+                response = GRAPH_SESSION.get(endpoint, headers=headers, params=params, timeout=30)
+            else:
+                # For subsequent pages, use the @odata.nextLink URL directly
+                response = GRAPH_SESSION.get(endpoint, headers=headers, timeout=30)
+            
+            if response.status_code == 401:
+                # Try refreshing token
+                if self.auth.refresh_access_token():
+                    headers = self.auth.get_headers()
+                    response = GRAPH_SESSION.get(endpoint, headers=headers, params=params if request_count == 1 else None, timeout=30)
+                else:
+                    logger.error("Authentication failed during event retrieval")
+                    raise CalendarReadError(f"Authentication failed on page {request_count}")
+            
+            if not response.ok:
+                logger.error(f"Failed to fetch events: {response.status_code} - {response.text}")
+                if response.status_code == 404:
+                    self.expire_calendar_id(calendar_id)
+                raise CalendarReadError(f"Page {request_count} failed with status {response.status_code}")
+            
+            data = parse_json_response(response)
+            events = data.get('value', [])
+            # Release the raw body before handing events out
+            response.close()
+            yielded += len(events)
+            
+            logger.info(f"  Retrieved {len(events)} events (total so far: {yielded})")
+            
+            # Check for next page
+            endpoint = data.get('@odata.nextLink')
+            
+            yield from events
+            
+            # Safety limit to prevent infinite loops. Stopping here would hand
+            # back a partial calendar, so a read that still has pages fails
+            if endpoint and request_count >= MAX_CALENDAR_VIEW_PAGES:
+                logger.error(f"Hit pagination safety limit of {MAX_CALENDAR_VIEW_PAGES} pages")
+                raise CalendarReadError(f"More than {MAX_CALENDAR_VIEW_PAGES} pages of events")
+    
+    def graph_batch(self, batch_requests: List[Dict]) -> Optional[Dict[str, Dict]]:
+        """
+        POST up to 20 sub-requests to the Graph $batch endpoint in one round trip.
+
+        Returns {request id: sub-response} (each with 'status' and 'body'), or
+        None if the batch itself failed. Throttled sub-requests are retried
+        after Retry-After (post_graph_batch), like the writer's batches.
+        """
+        headers = self.auth.get_headers()
+        if not headers:
+            return None
+        
+        status, responses = post_graph_batch(headers, batch_requests)
+        
+        if status == 401:
+            # Try refreshing token
+            if not self.auth.refresh_access_token():
+                logger.error("Authentication failed during batch request")
+                return None
+            headers = self.auth.get_headers()
+            status, responses = post_graph_batch(headers, batch_requests)
+        
+        if status != 200:
+            logger.error(f"Batch request failed: {status}")
+            return None
+        
+        return {r.get('id'): r for r in responses}
+    
+    def get_event_bodies(self, event_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Fetch just the body of several events, 20 per $batch round trip.
+
+        For callers that leave body out of a large listing and only need it
+        for a few events. Events whose sub-request fails are left out.
+        """
+        bodies = {}
+        for offset in range(0, len(event_ids), 20):
+            chunk = event_ids[offset:offset + 20]
+            responses = self.graph_batch([
+                {
+                    'id': str(index),
+                    'method': 'GET',
+                    'url': f"/users/{config.SHARED_MAILBOX}/events/{event_id}?$select=body"
+                }
+                for index, event_id in enumerate(chunk)
+            ])
+            if responses is None:
+                continue
+            for index, event_id in enumerate(chunk):
+                sub = responses.get(str(index)) or {}
+                if sub.get('status') == 200:
+                    bodies[event_id] = (sub.get('body') or {}).get('body') or {}
+        return bodies
+    
+    def get_calendar_views_batched(self, calendar_ids: List[str], start: datetime = None, end: datetime = None, select_fields: List[str] = None) -> Dict[str, Optional[List[Dict]]]:
+        """
+        Fetch calendarView events for several calendars through $batch.
+
+        Every calendar's next page rides in the same batch, so N calendars cost
+        one round trip per page depth instead of one per calendar per page.
+        A calendar whose sub-request fails, or that still has pages after
+        MAX_CALENDAR_VIEW_PAGES, maps to None rather than a partial list.
+        """
+        start_time, end_time = self._calendar_view_window(start, end)
+        query = urlencode(self._calendar_view_params(start_time, end_time, select_fields))
+        
+        results = {calendar_id: [] for calendar_id in calendar_ids}
+        pages = dict.fromkeys(calendar_ids, 0)
+        pending = {
+            calendar_id: f"/users/{config.SHARED_MAILBOX}/calendars/{calendar_id}/calendarView?{query}"
+            for calendar_id in calendar_ids
+        }
+        
+        # Every round either advances or drops each calendar it sends, and the
+        # page cap bounds the advances, so this ends
+        while pending:
+            ids = list(pending)[:20]  # Graph allows 20 sub-requests per batch
+            responses = self.graph_batch([
+                {'id': str(idx), 'method': 'GET', 'url': pending[calendar_id]}
+                for idx, calendar_id in enumerate(ids)
+            ])
+            if responses is None:
+                for calendar_id in ids:
+                    results[calendar_id] = None
+                    del pending[calendar_id]
+                continue
+            
+            for idx, calendar_id in enumerate(ids):
+                sub = responses.get(str(idx)) or {}
+                if sub.get('status') != 200:
+                    logger.error(f"Batched calendarView failed for {calendar_id}: {sub.get('status')}")
+                    results[calendar_id] = None
+                    del pending[calendar_id]
+                    continue
+                body = sub.get('body') or {}
+                results[calendar_id].extend(body.get('value', []))
+                pages[calendar_id] += 1
+                next_link = body.get('@odata.nextLink')
+                if not next_link:
+                    del pending[calendar_id]
+                elif pages[calendar_id] >= MAX_CALENDAR_VIEW_PAGES:
+                    # Same safety limit as iter_calendar_events: fail, never truncate
+                    logger.error(f"Batched calendarView for {calendar_id} hit the {MAX_CALENDAR_VIEW_PAGES}-page limit")
+                    results[calendar_id] = None
+                    del pending[calendar_id]
+                else:
+                    pending[calendar_id] = next_link.replace("https://graph.microsoft.com/v1.0", "", 1)
+        
+        return results
+    
     @RetryUtils.retry_with_backoff(max_retries=3, base_delay=1)
     def get_calendar_instances(self, calendar_id: str, start_date: str, end_date: str) -> Optional[List[Dict]]:
         """
@@ -361,19 +666,19 @@ class CalendarReader:
         logger.info(f"[Sync] Querying instances from {start_date} to {end_date}")
         
         try:
-            response = requests.get(url, headers=headers, params=params, timeout=30)
+            response = GRAPH_SESSION.get(url, headers=headers, params=params, timeout=30)
             
             if response.status_code == 401:
                 # Try refreshing token
                 if self.auth.refresh_access_token():
                     headers = self.auth.get_headers()
-                    response = requests.get(url, headers=headers, params=params, timeout=30)
+                    response = GRAPH_SESSION.get(url, headers=headers, params=params, timeout=30)
                 else:
                     logger.error("Authentication failed during instance retrieval")
                     return None
             
             if response.status_code == 200:
-                data = response.json()
+                data = parse_json_response(response)
                 instances = data.get('value', [])
                 all_instances.extend(instances)
                 
@@ -382,9 +687,9 @@ class CalendarReader:
                 page_counter = 0
                 max_pages = 50  # Safety guard for pagination
                 while next_link and page_counter < max_pages:
-                    next_response = requests.get(next_link, headers=headers, timeout=30)
+                    next_response = GRAPH_SESSION.get(next_link, headers=headers, timeout=30)
                     if next_response.status_code == 200:
-                        next_data = next_response.json()
+                        next_data = parse_json_response(next_response)
                         all_instances.extend(next_data.get('value', []))
                         next_link = next_data.get('@odata.nextLink')
                         page_counter += 1
@@ -416,18 +721,20 @@ class CalendarReader:
             logger.error(f"Error getting instances: {e}")
             raise
     
-    def get_public_events(self, calendar_id: str, include_instances: bool = False, start: datetime = None, end: datetime = None, category: str = None) -> Optional[List[Dict]]:
+    def get_public_events(self, calendar_id: str, include_instances: bool = False, start: datetime = None, end: datetime = None, category: str = None, events: List[Dict] = None) -> Optional[List[Dict]]:
         """
         Get only the events carrying a given Outlook category (default "Public").
 
         Passing category lets one source calendar feed several target calendars,
         e.g. "Public" -> public calendar and "SAS" -> Sundays At St. Edward.
+        Passing events filters an already-fetched calendarView instead of
+        fetching one.
         """
         # Falls back to the configured primary category rather than a literal,
         # so diagnostics cannot silently disagree with what the sync engine reads.
         category = (category or config.SYNC_CATEGORY or 'Public').lower()
         # Get all events including expanded recurring occurrences
-        all_events = self.get_calendar_events(calendar_id, start=start, end=end)
+        all_events = events if events is not None else self.get_calendar_events(calendar_id, start=start, end=end)
         
         if not all_events:
             return None
@@ -543,13 +850,22 @@ class CalendarReader:
         }
         
         # Create timezone-aware cutoff dates
-        central_tz = pytz.timezone('America/Chicago')
         now_central = DateTimeUtils.get_central_time()
         
         # Convert to UTC for comparison
         cutoff_date = (now_central - timedelta(days=config.SYNC_CUTOFF_DAYS)).astimezone(pytz.UTC)
         future_cutoff = (now_central + timedelta(days=365)).astimezone(pytz.UTC)
         
+        # The calendarView already bounded the fetch server-side; when that
+        # window sits inside the cutoffs, re-checking each single event's date
+        # can't reject anything, so the per-event parse is skipped
+        window_inside_cutoffs = (
+            events is None
+            and start is not None and start.tzinfo is not None
+            and end is not None and end.tzinfo is not None
+            and start >= cutoff_date and end <= future_cutoff
+        )
+        
         for event in all_events:
             # Skip cancelled events entirely
             if event.get('isCancelled', False):
@@ -595,7 +911,7 @@ class CalendarReader:
                         # This is an orphaned occurrence - include it
                         logger.info(f"✅ Including orphaned occurrence: {event.get('subject')} on {event.get('start', {}).get('dateTime', '')[:10]}")
                         stats['orphaned_occurrences'] = stats.get('orphaned_occurrences', 0) + 1
-                else:
+                elif not window_inside_cutoffs:
                     # For single events, check the date
                     event_date = DateTimeUtils.parse_graph_datetime(event.get('start', {}))
                     if not event_date:
@@ -627,9 +943,8 @@ class CalendarReader:
         
         logger.info(f"Found {len(public_events)} public events to sync")
         logger.info(f"Event statistics: {stats}")
-        
+
         return public_events
-    
 
     def clear_calendar_cache(self):
         """Clear the calendar ID cache"""
@@ -637,6 +952,18 @@ class CalendarReader:
         self._cache_expiry.clear()
         logger.info("Calendar cache cleared")
 
+    def expire_calendar_id(self, calendar_id: str):
+        """
+        Force the next find_calendar_id to re-resolve any name cached to this ID.
+
+        The stale ID is kept (only its expiry is dropped) so a changed ID can
+        be reported when the name resolves again.
+        """
+        for name, cached_id in self._calendar_cache.items():
+            if cached_id == calendar_id:
+                self._cache_expiry.pop(name, None)
+                logger.warning(f"Calendar ID for '{name}' returned 404; it will be looked up again")
+
 
 class CalendarWriter:
     """Handles writing calendar data to Microsoft Graph"""
@@ -661,13 +988,13 @@ class CalendarWriter:
         create_data = self._prepare_event_data(event_data)
         
         try:
-            response = requests.post(url, headers=headers, json=create_data, timeout=30)
+            response = GRAPH_SESSION.post(url, headers=headers, json=create_data, timeout=30)
             
             if response.status_code == 401:
                 # Try refreshing token
                 if self.auth.refresh_access_token():
                     headers = self.auth.get_headers()
-                    response = requests.post(url, headers=headers, json=create_data, timeout=30)
+                    response = GRAPH_SESSION.post(url, headers=headers, json=create_data, timeout=30)
                 else:
                     logger.error("Authentication failed during event creation")
                     return False
@@ -707,13 +1034,13 @@ class CalendarWriter:
         update_data = self._prepare_event_data(event_data)
         
         try:
-            response = requests.patch(url, headers=headers, json=update_data, timeout=30)
+            response = GRAPH_SESSION.patch(url, headers=headers, json=update_data, timeout=30)
             
             if response.status_code == 401:
                 # Try refreshing token
                 if self.auth.refresh_access_token():
                     headers = self.auth.get_headers()
-                    response = requests.patch(url, headers=headers, json=update_data, timeout=30)
+                    response = GRAPH_SESSION.patch(url, headers=headers, json=update_data, timeout=30)
                 else:
                     logger.error("Authentication failed during event update")
                     return False
@@ -754,7 +1081,7 @@ class CalendarWriter:
         url = f"https://graph.microsoft.com/v1.0/users/{config.SHARED_MAILBOX}/calendars/{calendar_id}/events/{event_id}"
         
         try:
-            response = requests.delete(url, headers=headers, timeout=30)
+            response = GRAPH_SESSION.delete(url, headers=headers, timeout=30)
             
             if response.status_code == 401:
                 # Try refreshing token
@@ -762,7 +1089,7 @@ class CalendarWriter:
                     headers = self.auth.get_headers()
                     if suppress_notifications:
                         headers['Prefer'] = 'outlook.timezone="UTC", outlook.send-notifications="false"'
-                    response = requests.delete(url, headers=headers, timeout=30)
+                    response = GRAPH_SESSION.delete(url, headers=headers, timeout=30)
                 else:
                     logger.error("Authentication failed during event deletion")
                     return False
@@ -826,14 +1153,14 @@ class CalendarWriter:
                 'endDateTime': end_window
             }
             
-            response = requests.get(url, headers=headers, params=params)
+            response = GRAPH_SESSION.get(url, headers=headers, params=params)
             
             if response.status_code != 200:
                 logger.error(f"❌ Failed to get occurrence: {response.status_code}")
                 logger.error(f"Response: {response.text}")
                 return False
             
-            instances = response.json().get('value', [])
+            instances = parse_json_response(response).get('value', [])
             
             # Find the occurrence that matches our target date
             target_occurrence = None
@@ -851,7 +1178,7 @@ class CalendarWriter:
             occurrence_id = target_occurrence['id']
             delete_url = f"https://graph.microsoft.com/v1.0/users/{config.SHARED_MAILBOX}/calendars/{calendar_id}/events/{occurrence_id}"
             
-            delete_response = requests.delete(delete_url, headers=headers)
+            delete_response = GRAPH_SESSION.delete(delete_url, headers=headers)
             
             if delete_response.status_code == 204:
                 logger.info(f"✅ Successfully deleted occurrence: {target_occurrence.get('subject', 'Unknown')} on {occurrence_date}")
@@ -904,13 +1231,13 @@ class CalendarWriter:
                 'endDateTime': end_window
             }
             
-            response = requests.get(instances_url, headers=headers, params=params, timeout=30)
+            response = GRAPH_SESSION.get(instances_url, headers=headers, params=params, timeout=30)
             
             if response.status_code != 200:
                 logger.error(f"❌ Failed to get occurrence: {response.status_code}")
                 return False
             
-            instances = response.json().get('value', [])
+            instances = parse_json_response(response).get('value', [])
             
             # Find the occurrence that matches our target date
             target_occurrence = None
@@ -931,13 +1258,13 @@ class CalendarWriter:
             # Prepare update data with all-day event handling
             prepared_data = self._prepare_event_data(update_data)
             
-            response = requests.patch(update_url, headers=headers, json=prepared_data, timeout=30)
+            response = GRAPH_SESSION.patch(update_url, headers=headers, json=prepared_data, timeout=30)
             
             if response.status_code == 401:
                 # Try refreshing token
                 if self.auth.refresh_access_token():
                     headers = self.auth.get_headers()
-                    response = requests.patch(update_url, headers=headers, json=prepared_data, timeout=30)
+                    response = GRAPH_SESSION.patch(update_url, headers=headers, json=prepared_data, timeout=30)
                 else:
                     logger.error("Authentication failed during occurrence update")
                     return False
@@ -1039,19 +1366,15 @@ class CalendarWriter:
         """
         source = reader or CalendarReader(self.auth)
         events = source.get_calendar_events(calendar_id) or []
-        deleted = 0
         
+        # Only delete events that carry our sync marker
+        synced_ids = []
         for event in events:
-            # Only delete if it has our sync marker
             body_content = event.get('body', {}).get('content', '')
             if 'SYNC_ID:' in body_content or 'Auto-synced from' in body_content:
-                try:
-                    self.delete_event(calendar_id, event['id'])
-                    deleted += 1
-                except:
-                    pass
+                synced_ids.append(event['id'])
         
-        return deleted
+        return self.batch_delete_events(calendar_id, synced_ids)['successful']
     
     def _prepare_event_data(self, source_event: Dict) -> Dict:
         """Prepare event data for creation/update - DEPRECATED, use _prepare_event_for_api"""
@@ -1059,7 +1382,6 @@ class CalendarWriter:
     
     def _get_next_day(self, date_string):
         """Get the next day for all-day event end date"""
-        from datetime import datetime, timedelta
         
         date_obj = datetime.strptime(date_string, '%Y-%m-%d')
         next_day = date_obj + timedelta(days=1)
@@ -1083,9 +1405,6 @@ class CalendarWriter:
             results['errors'].append('No authentication')
             return results
         
-        # Microsoft Graph batch endpoint
-        batch_url = "https://graph.microsoft.com/v1.0/$batch"
-        
         for i in range(0, len(events), batch_size):
             batch = events[i:i + batch_size]
             
@@ -1102,13 +1421,8 @@ class CalendarWriter:
                     }
                 })
             
-            batch_payload = {
-                'requests': batch_requests
-            }
-            
             # DEBUG: Log the first event being sent
             if batch_requests:
-                import json
                 # logger.info(f"🔍 BATCH REQUEST DEBUG - First event:")
                 # logger.info(f"   Subject: {batch_requests[0]['body'].get('subject', 'No Subject')}")
                 # logger.info(f"   Start: {batch_requests[0]['body'].get('start', {})}")
@@ -1118,10 +1432,9 @@ class CalendarWriter:
                 pass
             
             try:
-                response = requests.post(batch_url, headers=headers, json=batch_payload, timeout=60)
+                status, batch_results = post_graph_batch(headers, batch_requests)
                 
-                if response.status_code == 200:
-                    batch_results = response.json().get('responses', [])
+                if status == 200:
                     
                     for result in batch_results:
                         if result.get('status') in [200, 201]:
@@ -1169,7 +1482,7 @@ class CalendarWriter:
                 else:
                     # Batch request failed
                     results['failed'] += len(batch)
-                    error_msg = f"Batch request failed: {response.status_code}"
+                    error_msg = f"Batch request failed: {status}"
                     results['errors'].append(error_msg)
                     logger.error(error_msg)
                     
@@ -1181,7 +1494,85 @@ class CalendarWriter:
         
         logger.info(f"Batch create completed: {results['successful']} successful, {results['failed']} failed")
         return results
-    
+
+    def batch_update_events(self, calendar_id: str, updates: List[Tuple[str, Dict]], batch_size: int = 20) -> Dict:
+        """PATCH multiple events in batches; updates are (target event id, source event) pairs"""
+        if config.MASTER_CALENDAR_PROTECTION and calendar_id == config.SOURCE_CALENDAR:
+            logger.error("PROTECTION: Attempted to batch update in source calendar!")
+            return {'successful': 0, 'failed': len(updates), 'errors': ['Protected calendar']}
+
+        results = {
+            'successful': 0,
+            'failed': 0,
+            'errors': []
+        }
+
+        headers = self.auth.get_headers()
+        if not headers:
+            results['failed'] = len(updates)
+            results['errors'].append('No authentication')
+            return results
+
+        for i in range(0, len(updates), batch_size):
+            batch = updates[i:i + batch_size]
+
+            # Create batch request
+            batch_requests = []
+            for idx, (event_id, event_data) in enumerate(batch):
+                batch_requests.append({
+                    'id': str(idx + 1),
+                    'method': 'PATCH',
+                    'url': f'/users/{config.SHARED_MAILBOX}/calendars/{calendar_id}/events/{event_id}',
+                    'body': self._prepare_event_data(event_data),
+                    'headers': {
+                        'Content-Type': 'application/json'
+                    }
+                })
+
+            try:
+                status, batch_results = post_graph_batch(headers, batch_requests)
+
+                if status == 401:
+                    # Try refreshing token
+                    if not self.auth.refresh_access_token():
+                        results['failed'] += len(batch)
+                        results['errors'].append('Authentication failed during batch update')
+                        logger.error("Authentication failed during batch update")
+                        continue
+                    headers = self.auth.get_headers()
+                    status, batch_results = post_graph_batch(headers, batch_requests)
+
+                if status == 200:
+
+                    for result in batch_results:
+                        if result.get('status') == 200:
+                            results['successful'] += 1
+                        else:
+                            results['failed'] += 1
+                            event_idx = int(result.get('id')) - 1
+                            subject = batch[event_idx][1].get('subject', 'Unknown') if event_idx < len(batch) else 'Unknown'
+                            error_msg = f"Event {result.get('id')}: Status {result.get('status')} - Subject: '{subject}'"
+                            error_body = result.get('body')
+                            if isinstance(error_body, dict) and isinstance(error_body.get('error'), dict):
+                                error_msg += f" - API Error: {error_body['error'].get('message', 'Unknown error')}"
+                            results['errors'].append(error_msg)
+                            logger.error(error_msg)
+                else:
+                    # Batch request failed
+                    results['failed'] += len(batch)
+                    error_msg = f"Batch request failed: {status}"
+                    results['errors'].append(error_msg)
+                    logger.error(error_msg)
+
+            except Exception as e:
+                results['failed'] += len(batch)
+                error_msg = f"Batch exception: {str(e)}"
+                results['errors'].append(error_msg)
+                logger.error(error_msg)
+
+        logger.info(f"Batch update completed: {results['successful']} successful, {results['failed']} failed")
+        return results
+
     def batch_delete_events(self, calendar_id: str, event_ids: List[str], batch_size: int = 20) -> Dict:
         """Delete multiple events in batches"""
         if config.MASTER_CALENDAR_PROTECTION and calendar_id == config.SOURCE_CALENDAR:
@@ -1203,9 +1594,6 @@ class CalendarWriter:
         # Add preference header for batch
         headers['Prefer'] = 'outlook.timezone="UTC", outlook.send-notifications="false"'
         
-        # Microsoft Graph batch endpoint
-        batch_url = "https://graph.microsoft.com/v1.0/$batch"
-        
         for i in range(0, len(event_ids), batch_size):
             batch = event_ids[i:i + batch_size]
             
@@ -1221,15 +1609,10 @@ class CalendarWriter:
                     }
                 })
             
-            batch_payload = {
-                'requests': batch_requests
-            }
-            
             try:
-                response = requests.post(batch_url, headers=headers, json=batch_payload, timeout=60)
+                status, batch_results = post_graph_batch(headers, batch_requests)
                 
-                if response.status_code == 200:
-                    batch_results = response.json().get('responses', [])
+                if status == 200:
                     
                     for result in batch_results:
                         if result.get('status') in [200, 204, 404]:  # 404 is OK (already deleted)
@@ -1242,7 +1625,7 @@ class CalendarWriter:
                 else:
                     # Batch request failed
                     results['failed'] += len(batch)
-                    error_msg = f"Batch request failed: {response.status_code}"
+                    error_msg = f"Batch request failed: {status}"
                     results['errors'].append(error_msg)
                     logger.error(error_msg)
                     
@@ -144,6 +144,12 @@ GRAPH_SCOPES = [
 SYNC_INTERVAL_MIN = int(os.environ.get('SYNC_INTERVAL_MIN', 23))
 HEALTH_CHECK_INTERVAL = int(os.environ.get('HEALTH_CHECK_INTERVAL', 5))
 
+# Token Refresh Settings
+# Stored expiry is pulled in this many seconds ahead of the real one
+TOKEN_REFRESH_LEAD_SECONDS = int(os.environ.get('TOKEN_REFRESH_LEAD_SECONDS', 300))
+# The scheduler refreshes in the background once a token is this close to expiry
+TOKEN_BACKGROUND_REFRESH_MIN = int(os.environ.get('TOKEN_BACKGROUND_REFRESH_MIN', 15))
+
 # Circuit Breaker Settings
 CIRCUIT_BREAKER_FAIL_MAX = int(os.environ.get('CIRCUIT_BREAKER_FAIL_MAX', 5))
 CIRCUIT_BREAKER_RESET_TIMEOUT = int(os.environ.get('CIRCUIT_BREAKER_RESET_TIMEOUT', 60))
@@ -154,6 +160,8 @@ BASE_DELAY = float(os.environ.get('BASE_DELAY', 1.0))
 
 # Cache Settings
 CACHE_TTL_HOURS = int(os.environ.get('CACHE_TTL_HOURS', 24))
+# Calendar IDs only change if a calendar is recreated; a 404 also expires them
+CALENDAR_ID_CACHE_HOURS = int(os.environ.get('CALENDAR_ID_CACHE_HOURS', 24))
 
 # Logging
 LOG_LEVEL = os.environ.get('LOG_LEVEL', 'INFO')
@@ -15,6 +15,7 @@ Signature mismatches cause thousands of duplicate events to be created.
 import json
 import hashlib
 import logging
+from functools import lru_cache
 from typing import Dict
 
 logger = logging.getLogger(__name__)
@@ -55,65 +56,51 @@ def generate_event_signature(event: Dict) -> str:
     is_all_day = event.get('isAllDay', False)
     if is_all_day:
         # Extract date portion only, no time
-        if 'T' in start_datetime:
-            start_normalized = start_datetime.split('T')[0]
-        else:
-            start_normalized = start_datetime
+        start_normalized = start_datetime.partition('T')[0]
     else:
         start_normalized = normalize_datetime(start_datetime)
     
     # For recurring events
     if event_type == 'seriesMaster':
-        recurrence = event.get('recurrence', {})
-        pattern = recurrence.get('pattern', {})
-        
-        # Create a stable hash of the recurrence pattern
-        pattern_data = {
-            'type': pattern.get('type', 'unknown'),
-            'interval': pattern.get('interval', 1),
-            'daysOfWeek': sorted(pattern.get('daysOfWeek', [])),
-            'dayOfMonth': pattern.get('dayOfMonth'),
-            'index': pattern.get('index')
-        }
-        
-        # Create hash of pattern for consistency
-        pattern_str = json.dumps(pattern_data, sort_keys=True)
-        pattern_hash = hashlib.md5(pattern_str.encode()).hexdigest()[:8]
-        
-        signature = f"recurring:{subject}:{pattern_hash}:{start_normalized}:{location_normalized}"
-        
-        return signature
-    
-    elif event_type == 'occurrence':
-        # CRITICAL FIX: Treat occurrences as single events for signature matching
-        # This ensures orphaned occurrences match previously synced events
-        # Use the same format as single events (without seriesMasterId)
-        if is_all_day:
-            # All-day: date only with ALLDAY marker
-            signature = f"single:{subject}:{start_normalized}:ALLDAY:{location_normalized}"
-        elif 'T' in start_normalized:
-            date_part = start_normalized.split('T')[0]
-            time_part = start_normalized.split('T')[1]
-            signature = f"single:{subject}:{date_part}:{time_part}:{location_normalized}"
-        else:
-            signature = f"single:{subject}:{start_normalized}:{location_normalized}"
-        
-        return signature
-    
-    # For single events
+        pattern = (event.get('recurrence') or {}).get('pattern') or {}
+        pattern_hash = _recurrence_pattern_hash(
+            pattern.get('type', 'unknown'),
+            pattern.get('interval', 1),
+            tuple(sorted(pattern.get('daysOfWeek', []))),
+            pattern.get('dayOfMonth'),
+            pattern.get('index')
+        )
+        return f"recurring:{subject}:{pattern_hash}:{start_normalized}:{location_normalized}"
+    
+    # Single events and occurrences share one format.
+    # CRITICAL FIX: Treat occurrences as single events for signature matching
+    # This ensures orphaned occurrences match previously synced events
+    # (the format carries no seriesMasterId)
     if is_all_day:
         # All-day: date only with ALLDAY marker
-        signature = f"single:{subject}:{start_normalized}:ALLDAY:{location_normalized}"
-    else:
-        # Timed: include time component
-        if 'T' in start_normalized:
-            date_part = start_normalized.split('T')[0]
-            time_part = start_normalized.split('T')[1]
-            signature = f"single:{subject}:{date_part}:{time_part}:{location_normalized}"
-        else:
-            signature = f"single:{subject}:{start_normalized}:{location_normalized}"
-    
-    return signature
+        return f"single:{subject}:{start_normalized}:ALLDAY:{location_normalized}"
+    
+    # Timed: include time component
+    date_part, has_time, time_part = start_normalized.partition('T')
+    if has_time:
+        return f"single:{subject}:{date_part}:{time_part}:{location_normalized}"
+    return f"single:{subject}:{start_normalized}:{location_normalized}"
+
+
+@lru_cache(maxsize=256)
+def _recurrence_pattern_hash(pattern_type, interval, days_of_week, day_of_month, index) -> str:
+    """Short stable hash of a recurrence pattern; a calendar repeats a handful of patterns"""
+    pattern_data = {
+        'type': pattern_type,
+        'interval': interval,
+        'daysOfWeek': list(days_of_week),
+        'dayOfMonth': day_of_month,
+        'index': index
+    }
+    
+    # Create hash of pattern for consistency
+    pattern_str = json.dumps(pattern_data, sort_keys=True)
+    return hashlib.md5(pattern_str.encode()).hexdigest()[:8]
 
 
 def normalize_subject(subject: str) -> str:
@@ -7,23 +7,29 @@ Consolidated Sync Logic - Complete calendar synchronization engine
 """
 import logging
 import time
+import traceback
 import threading
-import schedule
 import json
 import os
 import hashlib
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Tuple, Set, Optional
 from threading import Lock
-from collections import defaultdict
+from collections import defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 import statistics
 import pytz
 
+try:
+    import orjson
+except ImportError:  # Optional speedup; the event cache falls back to json
+    orjson = None
+
 def get_utc_now_iso():
     return datetime.now(timezone.utc).isoformat()
 
 import config
-from calendar_ops import CalendarReader, CalendarWriter
+from calendar_ops import CalendarReader, CalendarWriter, MAILBOX_CONCURRENCY
 from utils import DateTimeUtils, CircuitBreaker, CircuitBreakerOpenError, RetryUtils, structured_logger
 from signature_utils import generate_event_signature, normalize_subject, normalize_datetime, normalize_location
 
@@ -47,8 +53,8 @@ class ChangeTracker:
         """Load cached event data from disk"""
         try:
             if os.path.exists(self.cache_file):
-                with open(self.cache_file, 'r') as f:
-                    data = json.load(f)
+                with open(self.cache_file, 'rb') as f:
+                    data = orjson.loads(f.read()) if orjson is not None else json.load(f)
                     self.event_cache = data.get('events', {})
                     self.last_sync_time = data.get('last_sync_time')
                     logger.info(f"✅ Loaded {len(self.event_cache)} cached events")
@@ -66,8 +72,14 @@ class ChangeTracker:
                 'last_sync_time': DateTimeUtils.get_central_time().isoformat(),
                 'cache_version': '1.0'
             }
-            with open(self.cache_file, 'w') as f:
-                json.dump(data, f, indent=2)
+            # The cache holds every source event in full, so this runs over
+            # the whole Graph payload each sync; orjson does it in C
+            if orjson is not None:
+                with open(self.cache_file, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+            else:
+                with open(self.cache_file, 'w') as f:
+                    json.dump(data, f, indent=2)
             logger.info(f"✅ Saved {len(self.event_cache)} events to cache")
         except Exception as e:
             logger.error(f"Failed to save event cache: {e}")
@@ -535,12 +547,15 @@ class SyncValidator:
         for event in target_events:
             start_time = event.get('start', {}).get('dateTime', '')
             if start_time:
-                try:
-                    event_date = DateTimeUtils.parse_graph_datetime(event.get('start', {}))
-                    if event_date and event_date < cutoff_date:
-                        old_events.append(event.get('subject', 'Unknown'))
-                except:
-                    pass
+                event_date = DateTimeUtils.parse_graph_datetime(event.get('start', {}))
+                if event_date is None:
+                    continue
+                # UTC starts come back naive; comparing those against the
+                # aware cutoff raised and silently passed every event
+                if event_date.tzinfo is None:
+                    event_date = pytz.UTC.localize(event_date)
+                if event_date < cutoff_date:
+                    old_events.append(event.get('subject', 'Unknown'))
         
         passed = len(old_events) == 0
         details = f"Found {len(old_events)} events older than cutoff" if not passed else "All events within date range"
@@ -778,6 +793,9 @@ class SyncEngine:
         # Sync state
         self.sync_lock = Lock()
         self.last_sync_time = None
+        # (ISO, Central display) for last_sync_time, formatted once when it is
+        # recorded rather than on every status poll
+        self._last_sync_time_text = (None, 'Never')
         self.last_sync_result = {"success": False, "message": "Not synced yet"}
         self.sync_in_progress = False
         
@@ -791,7 +809,9 @@ class SyncEngine:
         }
         
         # Rate limiting
-        self.sync_request_times = []  # Stores timestamps of sync requests within the last hour
+        # Timestamps of sync requests within the last hour, oldest first. Only
+        # "more than MAX" matters, so MAX + 1 entries is all it ever needs.
+        self.sync_request_times = deque(maxlen=config.MAX_SYNC_REQUESTS_PER_HOUR + 1)
         
         # Enhanced features
         self.structured_logger = structured_logger
@@ -827,17 +847,10 @@ class SyncEngine:
             start_date = DateTimeUtils.get_central_time() - timedelta(days=config.SYNC_CUTOFF_DAYS)
             end_date = DateTimeUtils.get_central_time() + timedelta(days=config.SYNC_LOOKAHEAD_DAYS)
             
-            # Fetch events in weekly chunks
-            source_events = []
-            target_events = []
-            
-            for start, end in self.generate_weekly_ranges(start_date, end_date):
-                logger.info(f"[Preview] Querying from {start.isoformat()} to {end.isoformat()}")
-                week_source = self.reader.get_public_events(source_id, start=start, end=end, include_instances=False) or []
-                week_target = self.reader.get_calendar_events(target_id, start=start, end=end) or []
-                
-                source_events.extend(week_source)
-                target_events.extend(week_target)
+            # Fetch source events in weekly chunks; the target in one read
+            source_events, target_events = self._read_pair_events(
+                source_id, target_id, start_date, end_date, label='Preview'
+            )
             
             if source_events is None:
                 raise Exception("Failed to retrieve source calendar events")
@@ -847,12 +860,16 @@ class SyncEngine:
             
             logger.info(f"📊 Preview: Retrieved {len(source_events)} source events and {len(target_events)} target events")
             
+            # Sign each target once; the duplicate map and the diff share it
+            target_signatures = [self._create_event_signature(e) for e in target_events]
+            
             # Build target map for quick lookup and collect duplicate targets to delete
-            target_map, duplicate_targets = self._build_event_map(target_events)
+            target_map, duplicate_targets = self._build_event_map(target_events, target_signatures)
             
             # Determine operations needed
             to_add, to_update, to_delete = self._determine_sync_operations(
-                source_events, target_events, target_map, check_instances=False
+                source_events, target_events, target_map, check_instances=False,
+                target_signatures=target_signatures
             )
 
             # Safely append duplicates detected in target to deletion list
@@ -948,20 +965,25 @@ class SyncEngine:
                 return {"error": error_msg, "circuit_breaker_open": True}
             raise
     
+    def rate_limit_remaining(self) -> int:
+        """
+        Syncs still allowed in the current hour, dropping expired request times.
+
+        Cheap and local, so callers can refuse a sync before any Graph traffic.
+        Must not be called with sync_lock held.
+        """
+        cutoff_time = DateTimeUtils.get_central_time() - timedelta(hours=1)
+        with self.sync_lock:
+            while self.sync_request_times and self.sync_request_times[0] <= cutoff_time:
+                self.sync_request_times.popleft()
+            return max(config.MAX_SYNC_REQUESTS_PER_HOUR - len(self.sync_request_times), 0)
+    
     def _do_sync(self) -> Dict:
         """Sync every configured category from the source calendar to its own target calendar."""
         start_time = DateTimeUtils.get_central_time()
 
-        # Track this sync request for rate limiting
-        current_time = DateTimeUtils.get_central_time()
-        self.sync_request_times.append(current_time)
-
-        # Clean up old entries (older than 1 hour)
-        cutoff_time = current_time - timedelta(hours=1)
-        self.sync_request_times = [t for t in self.sync_request_times if t > cutoff_time]
-
         # Check rate limit
-        if len(self.sync_request_times) > config.MAX_SYNC_REQUESTS_PER_HOUR:
+        if self.rate_limit_remaining() <= 0:
             return {
                 "error": f"Rate limit exceeded. Maximum {config.MAX_SYNC_REQUESTS_PER_HOUR} syncs per hour.",
                 "rate_limit_remaining": 0,
@@ -973,6 +995,9 @@ class SyncEngine:
             if self.sync_in_progress:
                 return {"error": "Sync already in progress"}
             self.sync_in_progress = True
+            # Only runs that actually start count toward the hourly limit;
+            # refused attempts used to push the window out on their own
+            self.sync_request_times.append(DateTimeUtils.get_central_time())
 
         try:
             pairs = config.get_sync_pairs()
@@ -1008,9 +1033,12 @@ class SyncEngine:
             # actually updated", so a run where every pair failed must not
             # advance it, or the freshness metric reports a stalled service as
             # current.
+            synced_at = DateTimeUtils.get_central_time()
+            synced_text = (synced_at.isoformat(), DateTimeUtils.format_central_time(synced_at))
             with self.sync_lock:
                 if any(r.get('success') for r in pair_results):
-                    self.last_sync_time = DateTimeUtils.get_central_time()
+                    self.last_sync_time = synced_at
+                    self._last_sync_time_text = synced_text
                 self.last_sync_result = result
 
             # Add sync to history
@@ -1019,7 +1047,6 @@ class SyncEngine:
             return result
 
         except Exception as e:
-            import traceback
             duration = (DateTimeUtils.get_central_time() - start_time).total_seconds()
 
             error_result = {
@@ -1127,6 +1154,43 @@ class SyncEngine:
         self.sync_state['progress'] = self.sync_state.get('progress', 0) + 1
         self.sync_state['phase'] = phase
 
+    def _read_pair_events(self, source_id: str, target_id: str, start_date: datetime, end_date: datetime,
+                          category: str = None, label: str = 'Sync',
+                          progress_phase: str = None) -> Tuple[List[Dict], Optional[List[Dict]]]:
+        """
+        Read the source window week by week and the target window in one go.
+
+        The target calendar only holds what was synced to it, so one paginated
+        read over the whole window replaces a request per week (and returns an
+        event spanning a week boundary once, not twice). Every read is I/O
+        bound, so they share a pool capped at the mailbox concurrency limit;
+        weeks are collected in order so the source list keeps its ordering.
+        """
+        # Fetch headers once first so a due token refresh happens here rather
+        # than racing across the worker threads
+        if self.reader.auth:
+            self.reader.auth.get_headers()
+
+        def read_week(start, end):
+            logger.info(f"[{label}] Querying from {start.isoformat()} to {end.isoformat()}")
+            return self.reader.get_public_events(source_id, start=start, end=end,
+                                                 include_instances=False, category=category) or []
+
+        source_events = []
+        with ThreadPoolExecutor(max_workers=MAILBOX_CONCURRENCY, thread_name_prefix='sync-fetch') as pool:
+            target_future = pool.submit(self.reader.get_calendar_events, target_id, start=start_date, end=end_date)
+            week_futures = [pool.submit(read_week, start, end)
+                            for start, end in self.generate_weekly_ranges(start_date, end_date)]
+
+            for future in week_futures:
+                source_events.extend(future.result())
+                if progress_phase:
+                    self._advance_progress(progress_phase)
+
+            target_events = target_future.result()
+
+        return source_events, target_events
+
     @staticmethod
     def _pair_failure(category: str, target_calendar_name: str, reason: str) -> Dict:
         """
@@ -1178,19 +1242,11 @@ class SyncEngine:
             start_date = DateTimeUtils.get_central_time() - timedelta(days=config.SYNC_CUTOFF_DAYS)
             end_date = DateTimeUtils.get_central_time() + timedelta(days=config.SYNC_LOOKAHEAD_DAYS)
             
-            # Fetch events in weekly chunks
-            source_events = []
-            target_events = []
-            
-            for start, end in self.generate_weekly_ranges(start_date, end_date):
-                logger.info(f"[Sync:{category}] Querying from {start.isoformat()} to {end.isoformat()}")
-                week_source = self.reader.get_public_events(source_id, start=start, end=end, include_instances=False, category=category) or []
-                week_target = self.reader.get_calendar_events(target_id, start=start, end=end) or []
-
-                source_events.extend(week_source)
-                target_events.extend(week_target)
-
-                self._advance_progress(f"Reading {target_calendar_name}")
+            # Fetch source events in weekly chunks; the target in one read
+            source_events, target_events = self._read_pair_events(
+                source_id, target_id, start_date, end_date, category=category,
+                label=f"Sync:{category}", progress_phase=f"Reading {target_calendar_name}"
+            )
 
             if source_events is None:
                 return self._pair_failure(category, target_calendar_name,
@@ -1231,12 +1287,16 @@ class SyncEngine:
             target_all_day_count = sum(1 for e in target_events if e.get('isAllDay', False))
             logger.info(f"📅 All-day events - Source: {source_all_day_count}, Target: {target_all_day_count}")
             
+            # Sign each target once; the duplicate map and the diff share it
+            target_signatures = [self._create_event_signature(e) for e in target_events]
+            
             # Build target map for quick lookup and collect duplicate targets to delete
-            target_map, duplicate_targets = self._build_event_map(target_events)
+            target_map, duplicate_targets = self._build_event_map(target_events, target_signatures)
             
             # Determine operations needed
             to_add, to_update, to_delete = self._determine_sync_operations(
-                source_events, target_events, target_map, check_instances=False
+                source_events, target_events, target_map, check_instances=False,
+                target_signatures=target_signatures
             )
 
             # Safely append duplicates detected in target to deletion list
@@ -1355,7 +1415,6 @@ class SyncEngine:
             return result
             
         except Exception as e:
-            import traceback
             duration = (DateTimeUtils.get_central_time() - start_time).total_seconds()
 
             # One failing pair must not abort the others, so this is caught here
@@ -1690,34 +1749,35 @@ class SyncEngine:
         
         return stats
     
-    def _build_event_map(self, events: List[Dict]) -> Tuple[Dict[str, Dict], List[Dict]]:
+    def _build_event_map(self, events: List[Dict], signatures: List[str] = None) -> Tuple[Dict[str, Dict], List[Dict]]:
         """Build a map of events by signature and collect duplicates to remove.
 
         Returns a tuple of (event_map, duplicates_to_delete).
         - event_map keeps a single canonical event per signature
         - duplicates_to_delete contains extra events sharing the same signature
+        signatures, if given, are the events' precomputed signatures in order.
         """
         event_map: Dict[str, Dict] = {}
         duplicates_to_delete: List[Dict] = []
+        if signatures is None:
+            signatures = [self._create_event_signature(event) for event in events]
+
+        for event, signature in zip(events, signatures):
+            # Process all events now (including occurrences); one lookup per
+            # event, and the common unique case ends here
+            existing = event_map.get(signature)
+            if existing is None:
+                event_map[signature] = event
+                continue
 
-        for event in events:
-            signature = self._create_event_signature(event)
-
-            # Process all events now (including occurrences)
-            if signature in event_map:
-                # Keep the newer event based on creation time; mark the other as duplicate
-                existing = event_map[signature]
-                existing_created = existing.get('createdDateTime', '')
-                new_created = event.get('createdDateTime', '')
-                if new_created < existing_created:
-                    logger.info(f"Duplicate detected for signature '{signature}' - keeping OLDER event (new)")
-                    duplicates_to_delete.append(existing)
-                    event_map[signature] = event
-                else:
-                    logger.info(f"Duplicate detected for signature '{signature}' - keeping OLDER event (existing)")
-                    duplicates_to_delete.append(event)
-            else:
+            # Keep the older event based on creation time; mark the other as duplicate
+            if event.get('createdDateTime', '') < existing.get('createdDateTime', ''):
+                logger.info(f"Duplicate detected for signature '{signature}' - keeping OLDER event (new)")
+                duplicates_to_delete.append(existing)
                 event_map[signature] = event
+            else:
+                logger.info(f"Duplicate detected for signature '{signature}' - keeping OLDER event (existing)")
+                duplicates_to_delete.append(event)
 
         return event_map, duplicates_to_delete
     
@@ -1726,18 +1786,32 @@ class SyncEngine:
         source_events: List[Dict], 
         target_events: List[Dict],
         target_map: Dict[str, Dict],
-        check_instances: bool = False
+        check_instances: bool = False,
+        target_signatures: List[str] = None
     ) -> Tuple[List[Dict], List[Tuple[Dict, Dict]], List[Dict]]:
-        """Determine what operations are needed"""
+        """Determine what operations are needed
+
+        target_signatures, if given, are the target events' precomputed
+        signatures in order, so targets already signed for target_map are
+        not signed again.
+        """
         to_add = []
         to_update = []
+        if target_signatures is None:
+            target_signatures = [self._create_event_signature(event) for event in target_events]
         
-        # CRITICAL FIX: Only compare against events that were synced by our system
-        synced_target_events = [event for event in target_events if self._is_synced_event(event)]
+        # CRITICAL FIX: Only compare against events that were synced by our system.
+        # One pass over the signed targets: all signatures feed the existence
+        # check, synced ones also get a map entry and a content fingerprint.
+        synced_target_events = []
         synced_target_map = {}
-        for event in synced_target_events:
-            sig = self._create_event_signature(event)
-            synced_target_map[sig] = event
+        target_fingerprints = {}
+        existing_signatures = set(target_signatures)
+        for event, sig in zip(target_events, target_signatures):
+            if self._is_synced_event(event):
+                synced_target_events.append(event)
+                synced_target_map[sig] = event
+                target_fingerprints[sig] = self._content_fingerprint(event)
         
         # Make a copy of synced_target_map for tracking deletions
         remaining_targets = synced_target_map.copy()
@@ -1771,8 +1845,6 @@ class SyncEngine:
                 if not sig.startswith("skip:occurrence:"):
                     source_signatures.add(sig)
             
-            synced_target_signatures = set(synced_target_map.keys())
-            
             # DEBUG: Add detailed signature comparison logging
             logger.info("="*60)
             logger.info("SIGNATURE COMPARISON DEBUG")
@@ -1807,15 +1879,6 @@ class SyncEngine:
             
             logger.info("="*60)
         
-        # Find matching signatures (moved outside if False block - needed for logic)
-        source_signatures = set()
-        for event in source_events:
-            sig = self._create_event_signature(event)
-            if not sig.startswith("skip:occurrence:"):
-                source_signatures.add(sig)
-        
-        synced_target_signatures = set(synced_target_map.keys())
-        
         # Removed for performance - see speed optimization plan
         if False:  # DUPLICATE DETECTION ANALYSIS
             logger.info("="*60)
@@ -1883,25 +1946,9 @@ class SyncEngine:
         # Note: target_id is not available in this scope, skip cleanup during preview
         # self._cleanup_room_in_inn_duplicates(target_id, target_events)
         
-        matching_sigs = source_signatures & synced_target_signatures
-        logger.info(f"  Matching signatures found: {len(matching_sigs)}")
-        if matching_sigs:
-            logger.info(f"  First 5 matches: {list(matching_sigs)[:5]}")
-
-        # Find events that should be added
-        should_add = source_signatures - synced_target_signatures
-        logger.info(f"  Signatures that should be added: {len(should_add)}")
-        if should_add:
-            logger.info(f"  First 5 to add: {list(should_add)[:5]}")
-        
-        # Build a comprehensive lookup of existing events in target calendar
-        # Use the same signature logic for consistent duplicate detection
-        existing_signatures = set()
-        for event in target_events:
-            sig = self._create_event_signature(event)
-            existing_signatures.add(sig)
-        
-        # Track source event signatures we've already processed in this sync
+        # Track source event signatures we've already processed in this sync.
+        # Signatures are computed once here; the match/add summary below is
+        # derived from this set rather than a separate pass over the source.
         source_signatures_seen = set()
         
         for source_event in source_events:
@@ -1932,7 +1979,7 @@ class SyncEngine:
                 # Check if it's a synced event that needs updating
                 if signature in remaining_targets:
                     target_event = remaining_targets[signature]
-                    if self._needs_update(source_event, target_event):
+                    if self._needs_update(source_event, target_event, target_fingerprints[signature]):
                         logger.debug(f"📝 UPDATE needed: {subject} (All-day: {is_all_day})")
                         to_update.append((source_event, target_event))
                     else:
@@ -1947,14 +1994,36 @@ class SyncEngine:
                 logger.debug(f"➕ ADD needed: {subject} (All-day: {is_all_day}) (signature: {signature})")
                 to_add.append(source_event)
         
+        matching_sigs = source_signatures_seen.intersection(synced_target_map)
+        logger.info(f"  Matching signatures found: {len(matching_sigs)}")
+        if matching_sigs:
+            logger.info(f"  First 5 matches: {list(matching_sigs)[:5]}")
+
+        should_add = source_signatures_seen.difference(synced_target_map)
+        logger.info(f"  Signatures that should be added: {len(should_add)}")
+        if should_add:
+            logger.info(f"  First 5 to add: {list(should_add)[:5]}")
+        
+        # An edit that changes the signature (most often a new time) leaves an
+        # add and an unmatched synced target with the same subject; PATCH the
+        # target instead of deleting it and creating a replacement
+        to_add, moved = self._pair_moved_events(to_add, list(remaining_targets.values()))
+        to_update.extend(moved)
+        moved_ids = {target_event.get('id') for _, target_event in moved}
+        
         # NEW DELETION DETECTION: Use extendedProperties-based approach
         # This identifies events to delete based on source event IDs, not just signatures
-        events_to_delete_by_source_id = self._identify_events_to_delete(source_events, synced_target_events)
+        events_to_delete_by_source_id = [
+            event for event in self._identify_events_to_delete(source_events, synced_target_events)
+            if event.get('id') not in moved_ids
+        ]
         
         # Combine both deletion approaches:
         # 1. Legacy signature-based deletions (remaining_targets)
         # 2. New source ID-based deletions (events_to_delete_by_source_id)
-        signature_based_deletions = list(remaining_targets.values())
+        signature_based_deletions = [
+            event for event in remaining_targets.values() if event.get('id') not in moved_ids
+        ]
         
         # Merge both deletion lists, avoiding duplicates
         all_deletions = {}
@@ -1967,7 +2036,7 @@ class SyncEngine:
         
         logger.info(f"📊 Operation summary:")
         logger.info(f"  - {len(to_add)} events to ADD")
-        logger.info(f"  - {len(to_update)} events to UPDATE") 
+        logger.info(f"  - {len(to_update)} events to UPDATE ({len(moved)} paired from add + delete)")
         logger.info(f"  - {len(to_delete)} events to DELETE")
         logger.info(f"    - {len(signature_based_deletions)} from signature matching")
         logger.info(f"    - {len(events_to_delete_by_source_id)} from source ID tracking")
@@ -1975,6 +2044,42 @@ class SyncEngine:
         
         return to_add, to_update, to_delete
     
+    def _pair_moved_events(
+        self,
+        to_add: List[Dict],
+        unmatched_targets: List[Dict]
+    ) -> Tuple[List[Dict], List[Tuple[Dict, Dict]]]:
+        """
+        Pair planned adds with unmatched synced targets of the same subject.
+
+        Only targets with the same all-day flag qualify, since the update
+        payload sets isAllDay but never clears it. Pairing follows list order
+        so the plan is deterministic. Returns (remaining adds, paired updates).
+        """
+        targets_by_key = defaultdict(deque)
+        for target_event in unmatched_targets:
+            if target_event.get('id'):
+                key = (normalize_subject(target_event.get('subject', '')), bool(target_event.get('isAllDay')))
+                targets_by_key[key].append(target_event)
+        
+        if not targets_by_key:
+            return to_add, []
+        
+        remaining_adds = []
+        moved = []
+        for source_event in to_add:
+            candidates = targets_by_key.get(
+                (normalize_subject(source_event.get('subject', '')), bool(source_event.get('isAllDay')))
+            )
+            if candidates:
+                moved.append((source_event, candidates.popleft()))
+            else:
+                remaining_adds.append(source_event)
+        
+        if moved:
+            logger.info(f"🔀 Pairing {len(moved)} add + delete pairs into updates")
+        return remaining_adds, moved
+    
     def _cleanup_room_in_inn_duplicates(self, target_calendar_id: str, target_events: List[Dict]) -> None:
         """
         ONE-TIME CLEANUP: Remove duplicate "Room in the Inn" events.
@@ -2037,19 +2142,46 @@ class SyncEngine:
         else:
             logger.info("✅ No duplicate 'Room in the Inn' events found to delete")
     
-    def _needs_update(self, source_event: Dict, target_event: Dict) -> bool:
+    # Field names for the positions of a _content_fingerprint tuple
+    _FINGERPRINT_FIELDS = ('subject', 'start', 'end', 'isAllDay', 'categories', 'location', 'body', 'recurrence')
+
+    @staticmethod
+    def _fingerprint_time(value) -> Tuple[str, str]:
+        """Normalized (dateTime, timeZone) so format and case noise don't count as changes"""
+        if not isinstance(value, dict):
+            return ('', '')
+        return (normalize_datetime(value.get('dateTime', '')), (value.get('timeZone') or '').lower())
+
+    def _content_fingerprint(self, event: Dict) -> Tuple:
+        """Hashable, normalized tuple of every field _needs_update compares"""
+        location = event.get('location') or {}
+        location_name = location.get('displayName') or '' if isinstance(location, dict) else str(location)
+        body = event.get('body')
+        body_content = body.get('content') or '' if isinstance(body, dict) else ''
+        return (
+            (event.get('subject') or '').strip().lower(),
+            self._fingerprint_time(event.get('start')),
+            self._fingerprint_time(event.get('end')),
+            bool(event.get('isAllDay')),
+            frozenset(event.get('categories') or ()),
+            location_name.strip().lower(),
+            body_content.strip().lower(),
+            json.dumps(event.get('recurrence') or {}, sort_keys=True),
+        )
+
+    def _needs_update(self, source_event: Dict, target_event: Dict, target_fingerprint: Optional[Tuple] = None) -> bool:
         """Check if an event needs updating - COMPARE PREPARED DATA WITH TARGET"""
         subject = source_event.get('subject', 'Unknown')
         
-        # Prepare the source event as it would be in the target calendar
-        prepared_source_data = self.writer._prepare_event_data(source_event)
+        # Quick check: compare modification times first (fastest check)
+        source_modified = source_event.get('lastModifiedDateTime')
+        target_modified = target_event.get('lastModifiedDateTime')
+        
+        if source_modified == target_modified:
+            # If modification times match, no changes needed
+            return False
         
         # Skip update if only modification times are different and no actual content changed
-        # Store original modification times for comparison
-        source_modified_original = source_event.get('lastModifiedDateTime')
-        target_modified_original = target_event.get('lastModifiedDateTime')
-
-        # Temporarily set them to the same value for comparison
         source_event_copy = source_event.copy()
         target_event_copy = target_event.copy()
         source_event_copy['lastModifiedDateTime'] = 'SAME'
@@ -2060,81 +2192,35 @@ class SyncEngine:
             logger.debug(f"Skipping update for '{subject}' - only modification time differs")
             return False
         
-        # Quick check: compare modification times first (fastest check)
-        source_modified = source_event.get('lastModifiedDateTime')
-        target_modified = target_event.get('lastModifiedDateTime')
-        
-        if source_modified == target_modified:
-            # If modification times match, no changes needed
-            return False
-        
-        # If we get here, there are changes - do detailed comparison using prepared data
-        logger.info(f"🔍 Checking if '{subject}' needs update (modified times differ)")
-        
-        # Compare normalized subject
-        prepared_subject = prepared_source_data.get('subject', '').strip().lower()
-        target_subject = target_event.get('subject', '').strip().lower()
-        
-        if prepared_subject != target_subject:
-            logger.info(f"  📝 Subject changed: '{prepared_subject}' != '{target_subject}'")
-            return True
-        
-        # Compare start/end times
-        if prepared_source_data.get('start') != target_event.get('start'):
-            logger.info(f"  🕐 Start time changed for '{subject}'")
-            return True
-        
-        if prepared_source_data.get('end') != target_event.get('end'):
-            logger.info(f"  🕐 End time changed for '{subject}'")
-            return True
-        
-        if prepared_source_data.get('isAllDay') != target_event.get('isAllDay'):
-            logger.info(f"  📅 All-day flag changed for '{subject}'")
-            return True
-        
-        # Compare categories
-        prepared_categories = set(prepared_source_data.get('categories', []))
-        target_categories = set(target_event.get('categories', []))
-        
-        if prepared_categories != target_categories:
-            logger.info(f"  ✅ CATEGORIES CHANGED for '{subject}': {prepared_categories} != {target_categories}")
-            return True
-        
-        # Compare location (prepared vs target)
-        prepared_location = prepared_source_data.get('location', {})
-        target_location = target_event.get('location', {})
-        
-        # Normalize location comparison (could be string or dict)
-        prepared_loc_str = prepared_location.get('displayName', '') if isinstance(prepared_location, dict) else str(prepared_location)
-        target_loc_str = target_location.get('displayName', '') if isinstance(target_location, dict) else str(target_location)
-        
-        if prepared_loc_str.strip().lower() != target_loc_str.strip().lower():
-            logger.info(f"  ✅ LOCATION CHANGED for '{subject}': '{prepared_loc_str}' != '{target_loc_str}'")
-            return True
-        
-        # Compare body content (prepared vs target)
-        prepared_body = prepared_source_data.get('body', {}).get('content', '') if isinstance(prepared_source_data.get('body'), dict) else ''
-        target_body = target_event.get('body', {}).get('content', '') if isinstance(target_event.get('body'), dict) else ''
-
-        # Normalize body content for comparison
-        prepared_body_normalized = prepared_body.strip().lower()
-        target_body_normalized = target_body.strip().lower()
-        
-        if prepared_body_normalized != target_body_normalized:
-            logger.info(f"  ✅ BODY CONTENT CHANGED for '{subject}'")
-            return True
+        # Prepare the source event as it would be in the target calendar and
+        # compare it with the target in one tuple comparison
+        prepared_source_data = self.writer._prepare_event_data(source_event)
+        source_fingerprint = self._content_fingerprint(prepared_source_data)
+        if target_fingerprint is None:
+            target_fingerprint = self._content_fingerprint(target_event)
         
-        # For recurring events, check if recurrence pattern changed
+        # Recurrence only matters for series masters, and comes from the raw
+        # source event rather than the prepared payload
         if source_event.get('type') == 'seriesMaster':
-            source_recurrence = source_event.get('recurrence', {})
-            target_recurrence = target_event.get('recurrence', {})
-            if source_recurrence != target_recurrence:
-                logger.info(f"  ✅ RECURRENCE PATTERN CHANGED for '{subject}'")
-                return True
+            source_fingerprint = source_fingerprint[:-1] + (
+                json.dumps(source_event.get('recurrence') or {}, sort_keys=True),
+            )
+        else:
+            source_fingerprint = source_fingerprint[:-1] + (None,)
+            target_fingerprint = target_fingerprint[:-1] + (None,)
         
-        # No changes detected (modification times might be different due to timezone or other metadata)
-        logger.info(f"  ➡️  No changes detected for '{subject}' (modification times differ but content is same)")
-        return False
+        if source_fingerprint == target_fingerprint:
+            # No changes detected (modification times might be different due to timezone or other metadata)
+            logger.info(f"  ➡️  No changes detected for '{subject}' (modification times differ but content is same)")
+            return False
+        
+        changed = [
+            name for name, source_value, target_value
+            in zip(self._FINGERPRINT_FIELDS, source_fingerprint, target_fingerprint)
+            if source_value != target_value
+        ]
+        logger.info(f"  ✅ {', '.join(changed).upper()} CHANGED for '{subject}'")
+        return True
     
     def _execute_sync_operations_batch(
         self, 
@@ -2156,64 +2242,45 @@ class SyncEngine:
             'delete_failed': 0
         }
         
-        # Process in very small batches to avoid timeouts
-        BATCH_SIZE = 20  # Changed from 5
+        # Graph accepts 20 sub-requests per $batch
+        BATCH_SIZE = 20
+        
+        def run_phase(phase, items, write):
+            """POST a phase's batches concurrently; phases still run in order"""
+            nonlocal successful, failed
+            if not items:
+                return
+            self.sync_state['phase'] = phase
+            batches = [items[i:i + BATCH_SIZE] for i in range(0, len(items), BATCH_SIZE)]
+            logger.info(f"{phase.capitalize()}: {len(items)} events in {len(batches)} batches")
+            
+            # Each batch is one round trip; running them side by side (capped at
+            # the mailbox concurrency limit) keeps wall time near a single RTT
+            with ThreadPoolExecutor(max_workers=min(MAILBOX_CONCURRENCY, len(batches)),
+                                    thread_name_prefix=f'sync-{phase}') as pool:
+                for batch_result in pool.map(write, batches):
+                    successful += batch_result['successful']
+                    failed += batch_result['failed']
+                    operation_details[f'{phase}_success'] += batch_result['successful']
+                    operation_details[f'{phase}_failed'] += batch_result['failed']
+                    self.sync_state['last_checkpoint'] = DateTimeUtils.get_central_time()
         
         # Phase 1: Additions
-        if to_add:
-            self.sync_state['phase'] = 'add'
-            for i in range(0, len(to_add), BATCH_SIZE):
-                batch = to_add[i:i + BATCH_SIZE]
-                logger.info(f"Adding batch {i//BATCH_SIZE + 1}/{(len(to_add) + BATCH_SIZE - 1)//BATCH_SIZE}")
-                
-                batch_result = self.writer.batch_create_events(target_calendar_id, batch)
-                successful += batch_result['successful']
-                failed += batch_result['failed']
-                operation_details['add_success'] += batch_result['successful']
-                operation_details['add_failed'] += batch_result['failed']
-                
-                self.sync_state['last_checkpoint'] = DateTimeUtils.get_central_time()
-                
-                # Yield control to prevent timeout
-                time.sleep(0.1)
-        
-        # Phase 2: Updates (most time-consuming)
-        if to_update:
-            self.sync_state['phase'] = 'update'
-            for i in range(0, len(to_update), BATCH_SIZE):
-                batch = to_update[i:i + BATCH_SIZE]
-                logger.info(f"Updating batch {i//BATCH_SIZE + 1}/{(len(to_update) + BATCH_SIZE - 1)//BATCH_SIZE}")
-                
-                for source_event, target_event in batch:
-                    event_id = target_event.get('id')
-                    if self.writer.update_event(target_calendar_id, event_id, source_event):
-                        successful += 1
-                        operation_details['update_success'] += 1
-                    else:
-                        failed += 1
-                        operation_details['update_failed'] += 1
-                
-                self.sync_state['last_checkpoint'] = DateTimeUtils.get_central_time()
-                
-                # Longer pause between update batches
-                time.sleep(0.5)
+        run_phase('add', to_add,
+                  lambda batch: self.writer.batch_create_events(target_calendar_id, batch))
+        
+        # Phase 2: Updates
+        run_phase('update', to_update,
+                  lambda batch: self.writer.batch_update_events(
+                      target_calendar_id,
+                      [(target_event.get('id'), source_event) for source_event, target_event in batch]
+                  ))
         
         # Phase 3: Deletions
-        if to_delete:
-            self.sync_state['phase'] = 'delete'
-            for i in range(0, len(to_delete), BATCH_SIZE):
-                batch = to_delete[i:i + BATCH_SIZE]
-                event_ids = [event.get('id') for event in batch]
-                
-                batch_result = self.writer.batch_delete_events(target_calendar_id, event_ids)
-                successful += batch_result['successful']
-                failed += batch_result['failed']
-                operation_details['delete_success'] += batch_result['successful']
-                operation_details['delete_failed'] += batch_result['failed']
-                
-                self.sync_state['last_checkpoint'] = DateTimeUtils.get_central_time()
-                
-                time.sleep(0.1)
+        run_phase('delete', to_delete,
+                  lambda batch: self.writer.batch_delete_events(
+                      target_calendar_id, [event.get('id') for event in batch]
+                  ))
         
         total = len(to_add) + len(to_update) + len(to_delete)
 
@@ -2412,27 +2479,14 @@ class SyncEngine:
     
     def get_status(self) -> Dict:
         """Get current sync status"""
+        current_time_iso = DateTimeUtils.get_central_time().isoformat()
+        rate_limit_remaining = self.rate_limit_remaining()
         with self.sync_lock:
-            # Handle last_sync_time safely - it might be a string or datetime
-            last_sync_time_iso = None
-            if self.last_sync_time:
-                if isinstance(self.last_sync_time, str):
-                    last_sync_time_iso = self.last_sync_time
-                else:
-                    try:
-                        last_sync_time_iso = self.last_sync_time.isoformat()
-                    except AttributeError:
-                        last_sync_time_iso = str(self.last_sync_time)
-            
-            # Handle current_time safely
-            try:
-                current_time_iso = DateTimeUtils.get_central_time().isoformat()
-            except AttributeError:
-                current_time_iso = str(DateTimeUtils.get_central_time())
+            last_sync_time_iso, last_sync_time_display = self._last_sync_time_text
             
             status = {
                 'last_sync_time': last_sync_time_iso,
-                'last_sync_time_display': DateTimeUtils.format_central_time(self.last_sync_time) if self.last_sync_time else 'Never',
+                'last_sync_time_display': last_sync_time_display,
                 'last_sync_result': self.last_sync_result,
                 'sync_in_progress': self.sync_in_progress,
                 'sync_progress': {
@@ -2441,7 +2495,7 @@ class SyncEngine:
                     'total': self.sync_state.get('total', 0),
                     'percent': round((self.sync_state.get('progress', 0) / max(self.sync_state.get('total', 1), 1)) * 100, 1)
                 } if self.sync_in_progress else None,
-                'rate_limit_remaining': config.MAX_SYNC_REQUESTS_PER_HOUR - len(self.sync_request_times),
+                'rate_limit_remaining': rate_limit_remaining,
                 'circuit_breaker_state': self.circuit_breaker.state,
                 'total_syncs': len(self.history.history),
                 'authenticated': self.auth.is_authenticated() if self.auth else False,
@@ -2453,6 +2507,10 @@ class SyncEngine:
             }
             return status
     
+    def get_last_sync_time_text(self) -> Tuple[Optional[str], str]:
+        """(ISO string, Central display) of the last successful sync; (None, 'Never') before one"""
+        return self._last_sync_time_text
+    
     def get_progress_percent(self):
         """Calculate progress percentage, clamped to 0-100"""
         total = self.sync_state.get('total', 0)
@@ -2470,6 +2528,9 @@ class SyncScheduler:
         self.scheduler_lock = Lock()
         self.scheduler_running = False
         self.scheduler_thread = None
+        # Set by stop() so the scheduler thread wakes at once instead of
+        # finishing its current sleep
+        self._stop_event = threading.Event()
         # ADD THESE LINES:
         self.last_scheduled_sync = None
         self.next_scheduled_sync = None
@@ -2479,20 +2540,32 @@ class SyncScheduler:
     def start(self):
         """Start the scheduler"""
         with self.scheduler_lock:
+            if self.scheduler_thread is not None and not self.scheduler_running:
+                # A just-stopped thread exits as soon as it sees the event
+                self.scheduler_thread.join(timeout=5)
             if self.scheduler_thread is None or not self.scheduler_thread.is_alive():
                 logger.info(f"Starting scheduler thread at {DateTimeUtils.format_central_time(DateTimeUtils.get_central_time())}...")
                 self.scheduler_running = True
+                self._stop_event.clear()
                 self.scheduler_thread = threading.Thread(target=self._run_scheduler, daemon=True)
                 self.scheduler_thread.start()
             else:
                 logger.info("Scheduler already running")
     
-    def stop(self):
-        """Stop the scheduler"""
+    def stop(self, timeout=5):
+        """Stop the scheduler and wait up to timeout seconds for its thread to exit"""
         with self.scheduler_lock:
             self.scheduler_running = False
+            self._stop_event.set()
+            thread = self.scheduler_thread
         
         logger.info(f"Stopping scheduler at {DateTimeUtils.format_central_time(DateTimeUtils.get_central_time())}...")
+        
+        # The thread exits as soon as it sees the event, unless a job is mid-run
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                logger.warning(f"Scheduler thread still finishing a job after {timeout}s")
     
     def is_running(self):
         """Check if scheduler is running"""
@@ -2501,22 +2574,33 @@ class SyncScheduler:
     
     def _run_scheduler(self):
         """Run the scheduler loop"""
-        # Schedule sync to run every 23 minutes with built-in health check
-        schedule.every(23).minutes.do(self._scheduled_sync_with_health_check)
+        # [interval seconds, next due (monotonic), job]; first runs are one
+        # interval after start, as they were with the schedule package
+        started = time.monotonic()
+        jobs = [
+            # Sync every 23 minutes with built-in health check
+            [23 * 60, started + 23 * 60, self._scheduled_sync_with_health_check],
+            # Keep the access token renewed ahead of time so syncs don't wait on OAuth
+            [4 * 60, started + 4 * 60, self._refresh_token_if_needed],
+        ]
         
         logger.info(f"Scheduler started - sync with health check every 23 minutes (CT) - started at {DateTimeUtils.format_central_time(DateTimeUtils.get_central_time())}")
         
         # Add startup delay to prevent immediate sync after deployment
         logger.info("⏳ Waiting 2 minutes before first scheduled sync to allow deployment to stabilize...")
-        time.sleep(120)  # Wait 2 minutes before first sync
-        
-        while True:
-            with self.scheduler_lock:
-                if not self.scheduler_running:
-                    break
-            
-            schedule.run_pending()
-            time.sleep(60)  # Check every minute
+        self._stop_event.wait(120)  # Wait 2 minutes before first sync
+        
+        while not self._stop_event.is_set():
+            for job in jobs:
+                interval, due, run = job
+                if time.monotonic() >= due:
+                    run()
+                    # Next run counts from when this one finished, so a long
+                    # sync is never followed straight away by a catch-up run
+                    job[1] = time.monotonic() + interval
+            # Sleep until the next job is due; stop() sets the event and ends
+            # the wait early
+            self._stop_event.wait(max(min(job[1] for job in jobs) - time.monotonic(), 1))
         
         logger.info(f"Scheduler stopped at {DateTimeUtils.format_central_time(DateTimeUtils.get_central_time())}")
     
@@ -2532,6 +2616,14 @@ class SyncScheduler:
             'recent_scheduled_syncs': self.scheduled_sync_history[-5:]  # Last 5 syncs
         }
     
+    def _refresh_token_if_needed(self):
+        """Function called by scheduler - renews the token before it is due"""
+        try:
+            if not self.sync_engine.auth.refresh_if_near_expiry():
+                logger.warning("Background token refresh failed; syncs will retry inline")
+        except Exception as e:
+            logger.error(f"❌ Background token refresh failed: {e}")
+    
     def _scheduled_sync(self):
         """Function called by scheduler - IMPROVED with error handling"""
         try:
@@ -2563,6 +2655,15 @@ class SyncScheduler:
     def _scheduled_sync_with_health_check(self):
         """Function called by scheduler - runs health check before sync"""
         try:
+            # A manual or still-running sync owns this slot. Skip it rather than
+            # queue behind sync_lock; the next run is timed from now, so missed
+            # slots collapse into that single run instead of piling up.
+            with self.sync_engine.sync_lock:
+                busy = self.sync_engine.sync_in_progress
+            if busy:
+                logger.warning("⏭️ Skipping scheduled sync - previous sync still running")
+                return
+            
             # Record the scheduled sync attempt
             self.last_scheduled_sync = DateTimeUtils.get_central_time()
             self.scheduled_sync_count += 1
@@ -2585,6 +2686,12 @@ class SyncScheduler:
             logger.info(f"⏰ Next scheduled sync will be at: {DateTimeUtils.format_central_time(self.next_scheduled_sync)}")
             logger.info("="*60)
             
+            # Refuse before the health check's Graph call when the engine
+            # would refuse the sync anyway
+            if self.sync_engine.rate_limit_remaining() <= 0:
+                logger.warning("⚠️ Hourly sync limit reached, skipping scheduled sync")
+                return
+            
             # Step 1: Run health check first
             logger.info("💓 Running pre-sync health check...")
             
@@ -80,3 +80,10 @@ class TestAuthGate:
         resp = client.get('/google496a12bccfaf6424.html')
         assert resp.status_code == 200
         assert b'google-site-verification: google496a12bccfaf6424.html' in resp.data
+
+    def test_debug_route_without_sync_engine_fails_fast(self, client, monkeypatch):
+        monkeypatch.setattr(app_module, 'auth_manager', _FakeAuth(), raising=False)
+        monkeypatch.setattr(app_module, 'sync_engine', None, raising=False)
+        resp = client.get('/debug/calendars')
+        assert resp.status_code == 500
+        assert resp.get_json()['error'] == 'Sync engine not initialized'
@@ -190,7 +190,11 @@ class TestRealWriterClearSynced:
                     {'id': 'legacy-1', 'body': {'content': 'Auto-synced from Calendar'}},
                 ]
 
-        writer.delete_event = lambda cal, eid, **kw: deleted.append(eid) or True
+        def batch_delete_events(cal, event_ids, **kwargs):
+            deleted.extend(event_ids)
+            return {'successful': len(event_ids), 'failed': 0, 'errors': []}
+
+        writer.batch_delete_events = batch_delete_events
 
         count = writer.clear_synced_events_only('cal-id', reader=_Reader())
 
@@ -220,9 +224,9 @@ class TestClearTargetGuard:
                 return [{'id': 'evt-1'}, {'id': 'evt-2'}]
 
         class _Writer:
-            def delete_event(self, calendar_id, event_id, **kwargs):
-                deleted.append((calendar_id, event_id))
-                return True
+            def batch_delete_events(self, calendar_id, event_ids, **kwargs):
+                deleted.extend((calendar_id, event_id) for event_id in event_ids)
+                return {'successful': len(event_ids), 'failed': 0, 'errors': []}
 
             def clear_synced_events_only(self, calendar_id, reader=None):
                 deleted.append((calendar_id, 'synced-sweep'))
@@ -0,0 +1,75 @@
+"""
+Background debug job tests: heavy debug endpoints hand their work to a daemon
+thread and the client polls /debug/job/<id> for the result.
+"""
+import os
+import sys
+import threading
+
+os.environ.setdefault('DISABLE_BACKGROUND_INIT', 'true')
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+import app as app_module
+from app import app as flask_app
+
+
+class _FakeAuth:
+    def is_authenticated(self):
+        return True
+
+
+@pytest.fixture
+def client(monkeypatch):
+    flask_app.config['TESTING'] = True
+    monkeypatch.setattr(app_module, 'auth_manager', _FakeAuth(), raising=False)
+    monkeypatch.setattr(app_module, '_debug_jobs', {})
+    monkeypatch.setattr(app_module, '_debug_jobs_by_key', {})
+    return flask_app.test_client()
+
+
+def _wait_for(job_id, client):
+    for _ in range(200):
+        resp = client.get(f'/debug/job/{job_id}')
+        if resp.status_code != 202:
+            return resp
+        threading.Event().wait(0.01)
+    raise AssertionError('debug job never finished')
+
+
+@pytest.mark.unit
+class TestDebugJobs:
+    def test_job_result_is_polled(self, client):
+        job = app_module.submit_debug_job('k', lambda x: {'value': x}, 7)
+        resp = _wait_for(job['job_id'], client)
+        assert resp.status_code == 200
+        assert resp.get_json()['result'] == {'value': 7}
+
+    def test_same_key_reuses_job(self, client):
+        gate = threading.Event()
+        calls = []
+
+        def slow():
+            calls.append(1)
+            gate.wait(2)
+            return {}
+
+        first = app_module.submit_debug_job('shared', slow)
+        second = app_module.submit_debug_job('shared', slow)
+        gate.set()
+        assert first['job_id'] == second['job_id']
+        _wait_for(first['job_id'], client)
+        assert len(calls) == 1
+
+    def test_failed_job_reports_error(self, client):
+        def boom():
+            raise RuntimeError('graph down')
+
+        job = app_module.submit_debug_job('bad', boom)
+        resp = _wait_for(job['job_id'], client)
+        assert resp.status_code == 500
+        assert resp.get_json()['error'] == 'graph down'
+
+    def test_unknown_job_is_404(self, client):
+        assert client.get('/debug/job/nope').status_code == 404
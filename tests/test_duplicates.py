@@ -157,6 +157,58 @@ class TestSyncedEventDetection:
         assert not is_synced, "Event without SYNC_ID should not be detected as synced"
 
 
+class TestNeedsUpdate:
+    """Test the content comparison that decides whether to PATCH"""
+
+    SOURCE = {
+        'id': 'source-1',
+        'subject': 'Team Meeting',
+        'start': {'dateTime': '2024-03-15T10:00:00.0000000', 'timeZone': 'UTC'},
+        'end': {'dateTime': '2024-03-15T11:00:00.0000000', 'timeZone': 'UTC'},
+        'location': {'displayName': 'Room A'},
+        'categories': ['Public'],
+        'isAllDay': False,
+        'lastModifiedDateTime': '2024-03-02T00:00:00Z'
+    }
+
+    def synced_copy(self, engine, **changes):
+        target = dict(engine.writer._prepare_event_data(self.SOURCE), id='target-1',
+                      lastModifiedDateTime='2024-03-01T00:00:00Z')
+        target.update(changes)
+        return target
+
+    @pytest.mark.duplicate
+    @pytest.mark.unit
+    def test_formatting_noise_is_not_a_change(self):
+        """Fraction digits and time zone case alone should not trigger an update"""
+        engine = SyncEngine(auth_manager=None)
+        target = self.synced_copy(engine, start={'dateTime': '2024-03-15T10:00:00', 'timeZone': 'utc'})
+        assert not engine._needs_update(self.SOURCE, target)
+
+    @pytest.mark.duplicate
+    @pytest.mark.unit
+    def test_location_change_is_detected(self):
+        """A changed location must still be synced"""
+        engine = SyncEngine(auth_manager=None)
+        target = self.synced_copy(engine, location={'displayName': 'Room B'})
+        assert engine._needs_update(self.SOURCE, target)
+
+    @pytest.mark.duplicate
+    @pytest.mark.unit
+    def test_moved_event_becomes_update(self):
+        """A time change should PATCH the synced copy, not delete and re-add it"""
+        engine = SyncEngine(auth_manager=None)
+        target = self.synced_copy(engine)
+        moved = dict(self.SOURCE,
+                     start={'dateTime': '2024-03-15T14:00:00.0000000', 'timeZone': 'UTC'},
+                     end={'dateTime': '2024-03-15T15:00:00.0000000', 'timeZone': 'UTC'})
+
+        to_add, to_update, to_delete = engine._determine_sync_operations([moved], [target], {})
+
+        assert to_add == [] and to_delete == []
+        assert to_update == [(moved, target)]
+
+
 @pytest.fixture
 def duplicate_events():
     """Fixture providing duplicate event pairs for testing"""
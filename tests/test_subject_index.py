@@ -0,0 +1,39 @@
+"""
+SubjectIndex tests: token-indexed lookups must return exactly what a plain
+case-insensitive substring scan over subjects would.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pytest
+
+from utils import SubjectIndex
+
+EVENTS = [
+    {'subject': 'Mass- Daily'},
+    {'subject': 'Choir Practice'},
+    {'subject': None},
+    {'subject': 'Daily Mass (School)'},
+    {'subject': 'Massage fundraiser'},
+]
+
+
+def _scan(term):
+    return [e for e in EVENTS if term.lower() in (e.get('subject') or '').lower()]
+
+
+@pytest.mark.unit
+class TestSubjectIndex:
+    @pytest.mark.parametrize('term', [
+        'mass', 'MASS', 'ss- da', 'daily', 'y mass (sch', 'practice', 'zzz', '',
+    ])
+    def test_matches_linear_scan(self, term):
+        assert SubjectIndex(EVENTS).query(term) == _scan(term)
+
+    def test_insert_after_build(self):
+        index = SubjectIndex(EVENTS)
+        index.insert({'subject': 'Adoration'})
+        assert [e['subject'] for e in index.query('ador')] == ['Adoration']
+        assert len(index) == len(EVENTS) + 1
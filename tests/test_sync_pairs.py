@@ -14,6 +14,7 @@ These tests pin the two behaviours that matter operationally:
   2. A typo in EXTRA_SYNC_PAIRS can never aim a write at the master calendar.
 """
 import importlib
+import json
 import os
 import sys
 
@@ -216,6 +217,91 @@ class TestCalendarLookup:
         assert self.make_reader().find_calendar_id('Youth Calendar') is None
 
 
+class TestCalendarRead:
+    """get_calendar_events() never passes a partial read off as the whole calendar"""
+
+    class _Auth:
+        def get_headers(self):
+            return {'Authorization': 'Bearer test'}
+
+        def refresh_access_token(self):
+            return False
+
+    class _Response:
+        def __init__(self, status_code, payload=None):
+            self.status_code = status_code
+            self.ok = status_code == 200
+            self.text = ''
+            self.content = json.dumps(payload or {}).encode()
+
+        def close(self):
+            pass
+
+    def read_with_pages(self, monkeypatch, responses):
+        pages = iter(responses)
+
+        class _Session:
+            def get(self, url, **kwargs):
+                return next(pages)
+
+        monkeypatch.setattr('calendar_ops.GRAPH_SESSION', _Session())
+        return CalendarReader(auth_manager=self._Auth()).get_calendar_events('cal-id')
+
+    def test_all_pages_are_returned(self, monkeypatch):
+        events = self.read_with_pages(monkeypatch, [
+            self._Response(200, {'value': [{'id': 'a'}], '@odata.nextLink': 'next'}),
+            self._Response(200, {'value': [{'id': 'b'}]}),
+        ])
+        assert [event['id'] for event in events] == ['a', 'b']
+
+    def test_failed_later_page_fails_the_read(self, monkeypatch):
+        events = self.read_with_pages(monkeypatch, [
+            self._Response(200, {'value': [{'id': 'a'}], '@odata.nextLink': 'next'}),
+            self._Response(503),
+        ])
+        assert events is None
+
+    def test_failed_token_refresh_fails_the_read(self, monkeypatch):
+        events = self.read_with_pages(monkeypatch, [
+            self._Response(200, {'value': [{'id': 'a'}], '@odata.nextLink': 'next'}),
+            self._Response(401),
+        ])
+        assert events is None
+
+    def test_page_limit_fails_the_read_instead_of_truncating(self, monkeypatch):
+        monkeypatch.setattr('calendar_ops.MAX_CALENDAR_VIEW_PAGES', 2)
+        events = self.read_with_pages(monkeypatch, [
+            self._Response(200, {'value': [{'id': 'a'}], '@odata.nextLink': 'next'}),
+            self._Response(200, {'value': [{'id': 'b'}], '@odata.nextLink': 'next'}),
+            self._Response(200, {'value': [{'id': 'c'}]}),
+        ])
+        assert events is None
+
+    def batch_read(self, monkeypatch, sub_responses):
+        """get_calendar_views_batched() for one calendar, one sub-response per POST"""
+        answers = iter(sub_responses)
+
+        class _Session:
+            def post(self, url, json=None, **kwargs):
+                return TestCalendarRead._Response(200, {'responses': [dict(next(answers), id='0')]})
+
+        monkeypatch.setattr('calendar_ops.GRAPH_SESSION', _Session())
+        reader = CalendarReader(auth_manager=self._Auth())
+        return reader.get_calendar_views_batched(['cal-id'])['cal-id']
+
+    def test_batched_read_retries_a_throttled_page(self, monkeypatch):
+        events = self.batch_read(monkeypatch, [
+            {'status': 429, 'headers': {'Retry-After': '0'}},
+            {'status': 200, 'body': {'value': [{'id': 'a'}]}},
+        ])
+        assert events == [{'id': 'a'}]
+
+    def test_batched_read_page_limit_maps_to_none(self, monkeypatch):
+        monkeypatch.setattr('calendar_ops.MAX_CALENDAR_VIEW_PAGES', 2)
+        page = {'status': 200, 'body': {'value': [{'id': 'a'}], '@odata.nextLink': 'https://graph.microsoft.com/v1.0/next'}}
+        assert self.batch_read(monkeypatch, [page, page, page]) is None
+
+
 class TestSyncProgress:
     """
     Progress must reflect the work that actually takes time.
@@ -356,8 +442,8 @@ class TestDeletionBudget:
 
         # Every pair plans the same number of deletions
         fake_deletes = [{'id': f'evt-{i}'} for i in range(deletions_per_pair)]
-        engine._determine_sync_operations = lambda s, t, m, check_instances=False: ([], [], list(fake_deletes))
-        engine._build_event_map = lambda events: ({}, [])
+        engine._determine_sync_operations = lambda s, t, m, check_instances=False, target_signatures=None: ([], [], list(fake_deletes))
+        engine._build_event_map = lambda events, signatures=None: ({}, [])
 
         executed = []
 
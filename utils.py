@@ -13,6 +13,7 @@ import random
 import time
 import threading
 import subprocess
+from collections import defaultdict
 from datetime import datetime, timedelta
 from functools import wraps
 from typing import Dict, List, Optional, Any, Callable
@@ -23,6 +24,14 @@ import requests
 import config
 logger = logging.getLogger(__name__)
 
+try:
+    from ciso8601 import parse_datetime as parse_iso_datetime
+except ImportError:  # Optional speedup; fromisoformat reads Graph timestamps too
+    parse_iso_datetime = datetime.fromisoformat
+
+# pytz.timezone() does a registry lookup per call; resolve Central once
+CENTRAL_TZ = pytz.timezone('America/Chicago')
+
 # =============================================================================
 # CORE UTILITIES
 # =============================================================================
@@ -33,8 +42,7 @@ class DateTimeUtils:
     @staticmethod
     def get_central_time() -> datetime:
         """Get current time in Central timezone"""
-        central_tz = pytz.timezone('America/Chicago')
-        return datetime.now(central_tz)
+        return datetime.now(CENTRAL_TZ)
     
     @staticmethod
     def format_central_time(dt: datetime) -> str:
@@ -43,10 +51,9 @@ class DateTimeUtils:
             return 'Never'
         if isinstance(dt, str):
             dt = datetime.fromisoformat(dt.replace('Z', '+00:00'))
-        central_tz = pytz.timezone('America/Chicago')
         if dt.tzinfo is None:
-            dt = central_tz.localize(dt)
-        return dt.astimezone(central_tz).strftime('%b %d, %Y at %I:%M %p CT')
+            dt = CENTRAL_TZ.localize(dt)
+        return dt.astimezone(CENTRAL_TZ).strftime('%b %d, %Y at %I:%M %p CT')
     
     @staticmethod
     def parse_graph_datetime(dt_dict: Dict) -> datetime:
@@ -65,9 +72,9 @@ class DateTimeUtils:
             dt_str = dt_str[:-1] + '+00:00'
         
         try:
-            dt = datetime.fromisoformat(dt_str)
+            dt = parse_iso_datetime(dt_str)
             if tz_str != 'UTC':
-                tz = pytz.timezone(tz_str)
+                tz = CENTRAL_TZ if tz_str == 'America/Chicago' else pytz.timezone(tz_str)
                 dt = tz.localize(dt)
             return dt
         except Exception as e:
@@ -87,8 +94,7 @@ class DateTimeUtils:
             # Convert to UTC first if it has a different timezone
             utc_dt = utc_dt.astimezone(pytz.UTC)
         
-        central = pytz.timezone('America/Chicago')
-        return utc_dt.astimezone(central)
+        return utc_dt.astimezone(CENTRAL_TZ)
     
     @staticmethod
     def central_to_utc(central_dt: datetime) -> datetime:
@@ -98,8 +104,7 @@ class DateTimeUtils:
         
         # If the datetime is naive, assume it's Central Time
         if central_dt.tzinfo is None:
-            central = pytz.timezone('America/Chicago')
-            central_dt = central.localize(central_dt)
+            central_dt = CENTRAL_TZ.localize(central_dt)
         
         return central_dt.astimezone(pytz.UTC)
     
@@ -124,8 +129,7 @@ class DateTimeUtils:
     @staticmethod
     def get_timezone_offset() -> str:
         """Get current Central Time offset from UTC"""
-        central = pytz.timezone('America/Chicago')
-        now = datetime.now(central)
+        now = datetime.now(CENTRAL_TZ)
         offset = now.strftime('%z')
         return f"UTC{offset[:3]}:{offset[3:]}"
     
@@ -594,6 +598,99 @@ class CacheManager:
         except Exception as e:
             logging.error(f"Error clearing cache {key}: {e}")
 
+class TTLCache:
+    """Thread-safe in-memory cache whose entries expire ttl_seconds after being set"""
+    
+    def __init__(self, maxsize: int = 16, ttl_seconds: float = 60):
+        self.maxsize = maxsize
+        self.ttl_seconds = ttl_seconds
+        self._data = {}
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        """Return the cached value, or default if missing or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return default
+            expires_at, value = entry
+            if time.monotonic() >= expires_at:
+                del self._data[key]
+                return default
+            return value
+    
+    def set(self, key, value):
+        """Cache value, evicting the entry closest to expiry when full"""
+        with self._lock:
+            if key not in self._data and len(self._data) >= self.maxsize:
+                oldest = min(self._data, key=lambda k: self._data[k][0])
+                del self._data[oldest]
+            self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+    
+    def get_or_load(self, key, loader: Callable[[], Any]):
+        """Return the cached value, calling loader() to fill a miss.
+
+        Empty results (None, []) are not cached, so a failed fetch is retried.
+        """
+        value = self.get(key)
+        if value is None:
+            value = loader()
+            if value:
+                self.set(key, value)
+        return value
+    
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self._data.clear()
+
+class SubjectIndex:
+    """
+    Token index over event subjects for repeated substring searches.
+
+    Subjects are lowercased and split on whitespace once. A query token can only
+    match inside a subject token, so lookups scan the (small) token vocabulary
+    instead of every event, and the full substring check runs on candidates only.
+    """
+    
+    def __init__(self, events: Optional[List[Dict]] = None):
+        self._events = []
+        self._subjects = []
+        self._tokens = defaultdict(list)
+        for event in events or []:
+            self.insert(event)
+    
+    def insert(self, event: Dict):
+        """Add an event to the index"""
+        idx = len(self._events)
+        subject = (event.get('subject') or '').lower()
+        self._events.append(event)
+        self._subjects.append(subject)
+        for token in set(subject.split()):
+            self._tokens[token].append(idx)
+    
+    def query(self, term: str) -> List[Dict]:
+        """Events whose subject contains term (case-insensitive), in insertion order"""
+        term = term.lower()
+        query_tokens = term.split()
+        if not query_tokens:
+            return list(self._events)
+        
+        candidates = None
+        for query_token in query_tokens:
+            hits = set()
+            for token, indices in self._tokens.items():
+                if query_token in token:
+                    hits.update(indices)
+            candidates = hits if candidates is None else candidates & hits
+            if not candidates:
+                return []
+        
+        return [self._events[i] for i in sorted(candidates) if term in self._subjects[i]]
+    
+    def __len__(self):
+        return len(self._events)
+
 # =============================================================================
 # DECORATORS
 # =============================================================================
@@ -743,6 +840,9 @@ def normalize_location(location: str | None) -> str | None:
     # Single token
     return _normalize_location_token(name)
 
+# Lowercase substrings present in every title is_omitted_from_bulletin can omit
+_BULLETIN_OMIT_HINTS = ('mass', 'adoration')
+
 def is_omitted_from_bulletin(subject: str, starts_at_utc: datetime, location: str | None) -> bool:
     """
     Return True if this event should be hidden from *bulletin lists only*,
@@ -760,6 +860,11 @@ def is_omitted_from_bulletin(subject: str, starts_at_utc: datetime, location: st
     if "adoration" in subject_lower and "confession" in subject_lower:
         return True
     
+    # Every day/time rule below matches a Mass or Adoration title; anything
+    # else can skip the timezone conversion entirely
+    if not any(hint in subject_lower for hint in _BULLETIN_OMIT_HINTS):
+        return False
+    
     # If we got here, continue with day/time-specific checks below...
     
     # Defensive: ensure timezone-aware datetime
@@ -847,7 +952,7 @@ def is_omitted_from_bulletin(subject: str, starts_at_utc: datetime, location: st
 __all__ = [
     'DateTimeUtils', 'ValidationUtils', 'MetricsUtils',
     'ResilientAPIClient', 'RetryUtils', 'StructuredLogger',
-    'CacheManager', 'require_auth', 'handle_api_errors', 'rate_limit',
+    'CacheManager', 'TTLCache', 'SubjectIndex', 'require_auth', 'handle_api_errors', 'rate_limit',
     'cache_manager', 'structured_logger', 'get_version_info',
     'normalize_location', 'is_omitted_from_bulletin'
 ] 
\ No newline at end of file